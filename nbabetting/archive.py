@@ -0,0 +1,122 @@
+"""archive.py – Cold-tier, append-only monthly archive of long-settled bets."""
+from __future__ import annotations
+
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# (placed_at, bet_id) — the sort key for a user's history, newest first
+Cursor = Tuple[str, str]
+
+
+def encode_cursor(key: Optional[Cursor]) -> Optional[str]:
+    return f"{key[0]}|{key[1]}" if key else None
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Cursor]:
+    if not cursor or "|" not in cursor:
+        return None
+    placed_at, bet_id = cursor.rsplit("|", 1)
+    return placed_at, bet_id
+
+
+def bet_key(bet: Dict) -> Cursor:
+    return bet.get("placed_at") or "", bet.get("id") or ""
+
+
+class BetArchive:
+    """Settled bets moved out of the hot store, one segment per guild per month.
+
+    Layout: ``<base>/<guild_id>/<YYYY-MM>.jsonl`` keyed by the month the bet
+    was *placed*, one compact JSON object per line.  Segments are only ever
+    appended to (and fsync'd), so a crash mid-archive can at worst leave a
+    duplicate line — readers de-duplicate by bet ID.
+
+    ``page()`` walks segments newest → oldest and stops as soon as it has
+    enough matches, so paging through history only reads the months it
+    actually shows.  Synchronous — BetsManager calls it from the executor
+    where it can.
+    """
+
+    def __init__(self, base: Path) -> None:
+        self._base = base
+
+    def _dir(self, guild_id: int) -> Path:
+        return self._base / str(guild_id)
+
+    # ── Writing ───────────────────────────────────────────────────────────────
+
+    def append(self, guild_id: int, bets: Iterable[Dict]) -> int:
+        by_month: Dict[str, List[Dict]] = {}
+        for bet in bets:
+            by_month.setdefault((bet.get("placed_at") or "0000-00")[:7], []).append(bet)
+        if not by_month:
+            return 0
+        folder = self._dir(guild_id)
+        folder.mkdir(parents=True, exist_ok=True)
+        written = 0
+        for month, chunk in by_month.items():
+            with open(folder / f"{month}.jsonl", "a", encoding="utf-8") as f:
+                for bet in chunk:
+                    f.write(json.dumps(bet, separators=(",", ":")))
+                    f.write("\n")
+                f.flush()
+                os.fsync(f.fileno())
+            written += len(chunk)
+        return written
+
+    def clear(self, guild_id: int) -> None:
+        shutil.rmtree(self._dir(guild_id), ignore_errors=True)
+
+    # ── Reading ───────────────────────────────────────────────────────────────
+
+    def _segments(self, guild_id: int) -> List[Path]:
+        folder = self._dir(guild_id)
+        if not folder.is_dir():
+            return []
+        return sorted(folder.glob("*.jsonl"), reverse=True)
+
+    def page(
+        self,
+        guild_id: int,
+        user_id: int,
+        status: Optional[str],
+        limit: int,
+        before: Optional[Cursor] = None,
+    ) -> List[Dict]:
+        """Up to ``limit`` of the user's archived bets older than ``before``, newest first."""
+        # Compact separators make this an exact pre-filter: only lines for
+        # this user are decoded.
+        needle = f'"user_id":"{user_id}"'
+        out:  List[Dict] = []
+        seen: Set[str]   = set()
+        for segment in self._segments(guild_id):
+            if before is not None and segment.stem > before[0][:7]:
+                continue
+            found: List[Dict] = []
+            try:
+                with open(segment, "r", encoding="utf-8") as f:
+                    for line in f:
+                        if needle not in line:
+                            continue
+                        try:
+                            bet = json.loads(line)
+                        except ValueError:
+                            continue   # torn line from a crash mid-append
+                        if bet.get("id") in seen:
+                            continue
+                        if status is not None and bet.get("status") != status:
+                            continue
+                        if before is not None and bet_key(bet) >= before:
+                            continue
+                        seen.add(bet["id"])
+                        found.append(bet)
+            except OSError:
+                continue
+            found.sort(key=bet_key, reverse=True)
+            out.extend(found)
+            if len(out) >= limit:
+                break
+        return out[:limit]
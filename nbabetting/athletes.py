@@ -0,0 +1,217 @@
+"""athletes.py – Durable ESPN athlete-ID → name/team/headshot-ID registry."""
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path, PurePosixPath
+from urllib.parse import urlsplit
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional
+
+# Upper bound on concurrent athlete $ref lookups while resolving unknown IDs
+RESOLVE_CONCURRENCY = 8
+# Seconds to batch registry changes before writing them to disk
+FLUSH_DELAY = 5.0
+
+HEADSHOT_URL = "https://a.espncdn.com/i/headshots/nba/players/full/{}.png"
+
+
+def headshot_url(headshot_id: str) -> str:
+    """ESPN CDN image URL for a headshot ID (built where the image is rendered)."""
+    return HEADSHOT_URL.format(headshot_id)
+
+
+def _headshot_id(href: str, aid: str) -> str:
+    """The image ID in an ESPN headshot href (".../full/<id>.png"); the athlete ID otherwise."""
+    stem = PurePosixPath(urlsplit(href).path).stem if href else ""
+    return stem if stem.isdigit() else aid
+
+
+class AthleteRegistry:
+    """ESPN athlete ID → {"name", "team", "headshot_id"}.
+
+    Seeded for free from every roster / leaders payload the fetcher already
+    downloads, so prop ingestion rarely has to look an athlete up on its own.
+    The few IDs still unknown are resolved through ``resolve()`` with bounded
+    concurrency.  With a ``path`` the registry persists across restarts;
+    writes are batched (FLUSH_DELAY) and run in the default executor.
+    """
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        self._path = path
+        self._data: Dict[str, Dict[str, str]] = {}
+        self._dirty = False
+        self._flush_task: Optional[asyncio.Task] = None
+
+        self.hits     = 0
+        self.misses   = 0
+        self.resolved = 0   # IDs fetched individually by resolve()
+
+        if path is not None and path.exists():
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    raw = json.load(f)
+                if isinstance(raw, dict):
+                    self._data = {aid: self._upgrade(aid, rec) for aid, rec in raw.items()}
+            except Exception:
+                self._data = {}
+
+    # ── Lookup ────────────────────────────────────────────────────────────────
+
+    def __contains__(self, aid: str) -> bool:
+        return aid in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, aid: str) -> Optional[Dict[str, str]]:
+        rec = self._data.get(aid)
+        if rec is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return rec
+
+    def name(self, aid: str) -> Optional[str]:
+        rec = self.get(aid)
+        return rec.get("name") if rec else None
+
+    def headshot_id(self, aid: str) -> str:
+        rec = self._data.get(aid)
+        return (rec or {}).get("headshot_id") or aid
+
+    @staticmethod
+    def _upgrade(aid: str, rec: Dict[str, str]) -> Dict[str, str]:
+        """Convert records saved with a "headshot" URL to the headshot_id form."""
+        if "headshot" not in rec:
+            return rec
+        rec = dict(rec)
+        rec["headshot_id"] = _headshot_id(rec.pop("headshot") or "", aid)
+        return rec
+
+    # ── Seeding ───────────────────────────────────────────────────────────────
+
+    def add(
+        self,
+        aid: str,
+        name: str,
+        team: Optional[str] = None,
+        headshot_id: Optional[str] = None,
+    ) -> None:
+        """Record one athlete; existing fields are only overwritten by non-empty values."""
+        if not aid or not name:
+            return
+        rec = self._data.get(aid)
+        new = {
+            "name":        name,
+            "team":        team or (rec or {}).get("team", ""),
+            "headshot_id": headshot_id or (rec or {}).get("headshot_id", "") or aid,
+        }
+        if rec != new:
+            self._data[aid] = new
+            self._mark_dirty()
+
+    def seed(self, athlete: Dict[str, Any], team: Optional[str] = None) -> None:
+        """Record an ESPN athlete object (roster, leaders or $ref payload shape)."""
+        aid  = str(athlete.get("id") or "")
+        name = (
+            athlete.get("displayName")
+            or athlete.get("fullName")
+            or athlete.get("shortName")
+            or ""
+        )
+        href = (athlete.get("headshot") or {}).get("href", "")
+        self.add(aid, name, team, _headshot_id(href, aid) if href else None)
+
+    def seed_many(self, athletes: Iterable[Dict[str, Any]], team: Optional[str] = None) -> None:
+        for athlete in athletes:
+            if isinstance(athlete, dict):
+                self.seed(athlete, team)
+
+    # ── Resolution ────────────────────────────────────────────────────────────
+
+    async def resolve(
+        self,
+        refs: Dict[str, str],
+        fetch: Callable[[str], Awaitable[Optional[Dict[str, Any]]]],
+    ) -> None:
+        """Look up every ID in ``refs`` (aid → $ref URL) not already known.
+
+        ``fetch`` returns the athlete JSON for a $ref URL (or None); at most
+        RESOLVE_CONCURRENCY lookups run at once.
+        """
+        missing = [aid for aid in refs if aid not in self._data]
+        if not missing:
+            return
+        sem = asyncio.Semaphore(RESOLVE_CONCURRENCY)
+
+        async def _one(aid: str) -> None:
+            async with sem:
+                try:
+                    athlete = await fetch(refs[aid])
+                except Exception:
+                    return
+            if athlete:
+                athlete = dict(athlete, id=aid)
+                self.seed(athlete)
+                self.resolved += 1
+
+        await asyncio.gather(*[_one(aid) for aid in missing])
+
+    # ── Persistence ───────────────────────────────────────────────────────────
+
+    def _mark_dirty(self) -> None:
+        self._dirty = True
+        if self._path is None:
+            return
+        if self._flush_task is None or self._flush_task.done():
+            try:
+                self._flush_task = asyncio.get_running_loop().create_task(self._delayed_flush())
+            except RuntimeError:
+                pass   # no running loop (e.g. during construction) — flush() later
+
+    async def _delayed_flush(self) -> None:
+        await asyncio.sleep(FLUSH_DELAY)
+        await self.flush()
+
+    def _write_sync(self, data: Dict[str, Dict[str, str]]) -> None:
+        path = self._path
+        tmp  = path.with_suffix(".tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            tmp.replace(path)
+        except Exception:
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+
+    async def flush(self) -> None:
+        """Write pending changes to disk now."""
+        if self._path is None or not self._dirty:
+            return
+        self._dirty = False
+        snapshot    = dict(self._data)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._write_sync, snapshot)
+
+    async def close(self) -> None:
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+        await self.flush()
+
+    # ── Reporting ─────────────────────────────────────────────────────────────
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "name":       "athletes",
+            "size":       len(self._data),
+            "bytes":      0,
+            "hits":       self.hits,
+            "stale_hits": 0,
+            "misses":     self.misses,
+            "evictions":  0,
+            "hit_rate":   self.hits / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,182 @@
+"""cache.py – Bounded TTL/LRU cache used for every OddsFetcher namespace."""
+from __future__ import annotations
+
+import sys
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterator, Optional, Tuple
+
+# Sentinel for "use the namespace default TTL" (None already means "never expires")
+DEFAULT_TTL: Any = object()
+
+
+def approx_size(obj: Any, _depth: int = 0) -> int:
+    """Rough deep size in bytes of a JSON-like object (dict / list / str / number).
+
+    Only used to enforce max_bytes bounds, so it trades accuracy for speed:
+    containers are walked, everything else is sys.getsizeof.
+    """
+    if _depth > 32:
+        return 0
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        for k, v in obj.items():
+            size += approx_size(k, _depth + 1) + approx_size(v, _depth + 1)
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        for v in obj:
+            size += approx_size(v, _depth + 1)
+    return size
+
+
+class _Entry:
+    __slots__ = ("value", "expires_at", "size")
+
+    def __init__(self, value: Any, expires_at: Optional[float], size: int) -> None:
+        self.value      = value
+        self.expires_at = expires_at   # None = never expires
+        self.size       = size
+
+
+class TTLCache:
+    """One cache namespace: per-entry TTL, LRU bound, stale-while-revalidate window.
+
+    - ``ttl``        default lifetime in seconds; ``None`` means entries never expire.
+    - ``stale_ttl``  how long past expiry an entry may still be served as *stale*
+                     (the caller refreshes it in the background meanwhile).
+    - ``max_entries`` / ``max_bytes``  whichever bound is set evicts least-recently
+                     used entries first.  ``max_bytes`` uses the size passed to
+                     set(), or approx_size() when none is given.
+
+    Hit / miss / stale-hit / eviction counters are kept for admin reporting.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl: Optional[float],
+        *,
+        stale_ttl: float = 0.0,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+    ) -> None:
+        self.name        = name
+        self.ttl         = ttl
+        self.stale_ttl   = stale_ttl
+        self.max_entries = max_entries
+        self.max_bytes   = max_bytes
+        self._data: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._bytes      = 0
+
+        self.hits       = 0
+        self.stale_hits = 0
+        self.misses     = 0
+        self.evictions  = 0
+
+    # ── Lookup ────────────────────────────────────────────────────────────────
+
+    def get_entry(self, key: Hashable) -> Optional[Tuple[Any, bool]]:
+        """Return (value, is_fresh), or None when absent or past the stale window."""
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        now = time.monotonic()
+        if entry.expires_at is None or now < entry.expires_at:
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry.value, True
+        if now < entry.expires_at + self.stale_ttl:
+            self._data.move_to_end(key)
+            self.stale_hits += 1
+            return entry.value, False
+        self._drop(key)
+        self.misses += 1
+        return None
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the fresh value for key, or default."""
+        entry = self.get_entry(key)
+        if entry is None or not entry[1]:
+            return default
+        return entry[0]
+
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        """Return whatever is stored for key (even expired) without touching stats or LRU order."""
+        entry = self._data.get(key)
+        return entry.value if entry is not None else default
+
+    def expires_in(self, key: Hashable) -> Optional[float]:
+        """Seconds until key goes stale (negative once expired, inf if it never
+        expires), or None when absent.  Does not touch stats or LRU order."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at is None:
+            return float("inf")
+        return entry.expires_at - time.monotonic()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def keys(self) -> Iterator[Hashable]:
+        return iter(list(self._data.keys()))
+
+    # ── Mutation ──────────────────────────────────────────────────────────────
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        *,
+        ttl: Any = DEFAULT_TTL,
+        size: Optional[int] = None,
+    ) -> None:
+        if ttl is DEFAULT_TTL:
+            ttl = self.ttl
+        expires_at = None if ttl is None else time.monotonic() + ttl
+        if size is None:
+            size = approx_size(value) if self.max_bytes is not None else 0
+        if key in self._data:
+            self._drop(key)
+        self._data[key] = _Entry(value, expires_at, size)
+        self._bytes += size
+        self._evict()
+
+    def invalidate(self, key: Hashable) -> None:
+        if key in self._data:
+            self._drop(key)
+
+    def clear(self) -> None:
+        self._data.clear()
+        self._bytes = 0
+
+    def _drop(self, key: Hashable) -> None:
+        entry = self._data.pop(key)
+        self._bytes -= entry.size
+
+    def _evict(self) -> None:
+        while self._data and (
+            (self.max_entries is not None and len(self._data) > self.max_entries)
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            key = next(iter(self._data))
+            self._drop(key)
+            self.evictions += 1
+
+    # ── Reporting ─────────────────────────────────────────────────────────────
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            "name":       self.name,
+            "size":       len(self._data),
+            "bytes":      self._bytes,
+            "hits":       self.hits,
+            "stale_hits": self.stale_hits,
+            "misses":     self.misses,
+            "evictions":  self.evictions,
+            "hit_rate":   (self.hits + self.stale_hits) / lookups if lookups else 0.0,
+        }
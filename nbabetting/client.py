@@ -0,0 +1,212 @@
+"""client.py – Shared ESPN HTTP client: pooled connections, rate limits, retries, circuit breaker."""
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from typing import Any, Dict, Mapping, Optional, Tuple
+from urllib.parse import urlsplit
+
+import aiohttp
+
+# ── Connection pool ───────────────────────────────────────────────────────────
+POOL_LIMIT          = 32      # total open connections
+POOL_LIMIT_PER_HOST = 12      # open connections per ESPN host
+DNS_CACHE_TTL       = 300     # seconds
+KEEPALIVE_TIMEOUT   = 30      # seconds an idle connection is kept
+CONNECT_TIMEOUT     = 3.0     # seconds to establish a connection
+
+# ── Per-host limits ───────────────────────────────────────────────────────────
+HOST_CONCURRENCY = 8          # in-flight requests per host
+HOST_RATE        = 20.0       # sustained requests / second per host
+HOST_BURST       = 40         # token-bucket capacity
+
+# ── Retries ───────────────────────────────────────────────────────────────────
+MAX_RETRIES  = 2              # extra attempts after the first
+BACKOFF_BASE = 0.4            # seconds; doubles each attempt, full jitter
+BACKOFF_CAP  = 4.0
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# ── Circuit breaker ───────────────────────────────────────────────────────────
+BREAKER_THRESHOLD = 5         # consecutive failed requests that open the circuit
+BREAKER_COOLDOWN  = 30.0      # seconds before a half-open trial request
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request while a host's circuit is open."""
+
+
+class _TokenBucket:
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate    = rate
+        self.burst   = burst
+        self._tokens = float(burst)
+        self._ts     = time.monotonic()
+        self._lock   = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._ts) * self.rate)
+                self._ts     = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class _Host:
+    """Concurrency cap, rate limit and circuit-breaker state for one host."""
+
+    def __init__(self) -> None:
+        self.sem       = asyncio.Semaphore(HOST_CONCURRENCY)
+        self.bucket    = _TokenBucket(HOST_RATE, HOST_BURST)
+        self.failures  = 0                  # consecutive failed requests
+        self.opened_at: Optional[float] = None
+
+    def allow(self) -> bool:
+        if self.opened_at is None:
+            return True
+        now = time.monotonic()
+        if now - self.opened_at < BREAKER_COOLDOWN:
+            return False
+        # Half-open: let this one trial request through and re-arm the cooldown
+        # so concurrent callers keep failing fast until it reports back.
+        self.opened_at = now
+        return True
+
+    def record(self, ok: bool) -> None:
+        if ok:
+            self.failures  = 0
+            self.opened_at = None
+            return
+        self.failures += 1
+        if self.failures >= BREAKER_THRESHOLD or self.opened_at is not None:
+            self.opened_at = time.monotonic()
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= BREAKER_COOLDOWN:
+            return "half-open"
+        return "open"
+
+
+class ESPNClient:
+    """One pooled aiohttp session shared by every ESPN request.
+
+    get_json() waits for a per-host concurrency slot and a rate-limit token,
+    retries 429 / 5xx / transport errors with jittered exponential backoff
+    inside the caller's overall timeout, and trips a per-host circuit breaker
+    after BREAKER_THRESHOLD consecutive failures.  While the circuit is open
+    requests fail immediately with CircuitOpenError so callers fall back to
+    cached data instead of sitting on a timeout.
+    """
+
+    def __init__(self) -> None:
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._hosts: Dict[str, _Host] = {}
+
+        self.requests        = 0
+        self.retries         = 0
+        self.failures        = 0
+        self.short_circuited = 0
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=POOL_LIMIT,
+                limit_per_host=POOL_LIMIT_PER_HOST,
+                ttl_dns_cache=DNS_CACHE_TTL,
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def close(self) -> None:
+        if self._session and not self._session.closed:
+            await self._session.close()
+
+    def _host(self, url: str) -> _Host:
+        netloc = urlsplit(url).netloc
+        host   = self._hosts.get(netloc)
+        if host is None:
+            host = self._hosts[netloc] = _Host()
+        return host
+
+    async def get_json(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 10,
+    ) -> Tuple[int, Any, Mapping[str, str]]:
+        """GET url; return (status, decoded JSON or None, response headers).
+
+        Only 200 responses are decoded.  Raises CircuitOpenError when the host
+        is short-circuited, and the last transport error once retries and the
+        ``timeout`` budget are exhausted.
+        """
+        host = self._host(url)
+        if not host.allow():
+            self.short_circuited += 1
+            raise CircuitOpenError(urlsplit(url).netloc)
+
+        session  = await self._get_session()
+        deadline = time.monotonic() + timeout
+        attempt  = 0
+        while True:
+            remaining = deadline - time.monotonic()
+            error: Optional[BaseException] = None
+            retry_after: Optional[float] = None
+            status, resp_headers = 0, {}   # type: Tuple[int, Mapping[str, str]]
+            try:
+                async with host.sem:
+                    await host.bucket.acquire()
+                    self.requests += 1
+                    async with session.get(
+                        url,
+                        params=params,
+                        headers=headers,
+                        timeout=aiohttp.ClientTimeout(
+                            total=max(remaining, 0.1), connect=CONNECT_TIMEOUT
+                        ),
+                    ) as resp:
+                        status       = resp.status
+                        resp_headers = resp.headers
+                        if status not in RETRY_STATUSES:
+                            data = await resp.json(content_type=None) if status == 200 else None
+                            host.record(True)
+                            return status, data, resp.headers
+                        if status == 429:
+                            try:
+                                retry_after = float(resp.headers.get("Retry-After", ""))
+                            except ValueError:
+                                retry_after = None
+            except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+                error = exc
+
+            # Retryable status or transport error
+            delay = min(BACKOFF_CAP, BACKOFF_BASE * (2 ** attempt)) * random.random()
+            if retry_after is not None:
+                delay = max(delay, retry_after)
+            attempt += 1
+            if attempt > MAX_RETRIES or time.monotonic() + delay >= deadline:
+                self.failures += 1
+                host.record(False)
+                if error is not None:
+                    raise error
+                return status, None, resp_headers
+            self.retries += 1
+            await asyncio.sleep(delay)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "requests":        self.requests,
+            "retries":         self.retries,
+            "failures":        self.failures,
+            "short_circuited": self.short_circuited,
+            "open_hosts":      [n for n, h in self._hosts.items() if h.state != "closed"],
+        }
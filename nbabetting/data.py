@@ -1,63 +1,586 @@
-"""data.py – Persistent bet storage (per-guild JSON files)."""
+"""data.py – Persistent bet storage (SQLite WAL by default; backends in storage.py)."""
 from __future__ import annotations
 
-import json
+import asyncio
+import bisect
+import itertools
+import logging
 import uuid
-from datetime import datetime, timezone
-from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 from redbot.core.data_manager import cog_data_path
 
+from .archive import BetArchive, Cursor, bet_key, decode_cursor, encode_cursor
+from .storage import BetJournal, BetStore, Op, SQLiteBetStore, migrate_json_to_sqlite
+
+log = logging.getLogger("red.jaffar-cogs.nbabetting")
+
+# Write-behind: journalled mutations are applied to the store in one batch
+# every FLUSH_INTERVAL seconds, or as soon as FLUSH_BATCH of them are queued.
+FLUSH_INTERVAL = 2.0
+FLUSH_BATCH    = 256
+
+# Settled bets older than this move from the store to the monthly archive
+ARCHIVE_AFTER_DAYS = 30
+ARCHIVE_BATCH      = 5000   # max bets archived per guild per pass
+
+# Index versions are drawn from one process-wide counter so a rebuilt index
+# never reuses a version an earlier one already handed out.
+_INDEX_VERSIONS = itertools.count(1)
+
 
 def _now() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+def _today() -> str:
+    return datetime.now(timezone.utc).date().isoformat()
+
+
+def bet_event_ids(bet: Dict) -> Set[str]:
+    """Every event a bet depends on — its own, or each parlay leg's."""
+    if bet.get("bet_type") == "parlay":
+        return {leg["event_id"] for leg in bet.get("legs", []) if leg.get("event_id")}
+    return {bet["event_id"]} if bet.get("event_id") else set()
+
+
+def bet_prop_players(bet: Dict) -> Set[str]:
+    """Players a bet's props depend on — selection format is "Player|stat|side"."""
+    if bet.get("bet_type") == "parlay":
+        selections = [
+            leg.get("selection", "") for leg in bet.get("legs", [])
+            if leg.get("leg_type") == "player_props"
+        ]
+    elif bet.get("bet_type") == "player_props":
+        selections = [bet.get("selection", "")]
+    else:
+        return set()
+    return {sel.split("|", 1)[0] for sel in selections if sel and sel.split("|", 1)[0]}
+
+
+class _GuildIndex:
+    """In-memory secondary indexes over one guild's bets.
+
+    Built from a single BetStore.index_rows() scan the first time the guild
+    is touched, then kept current by BetsManager on place / settle / clear:
+
+    - ``pending``    bet_id → full bet dict for every active bet
+    - ``status``     bet_id → status, for every bet
+    - ``by_user``    user_id → [(placed_at, bet_id)] in time order
+    - ``user_pending`` user_id → [(placed_at, bet_id)] of pending bets only
+    - ``by_event``   event_id → pending non-prop bet IDs
+    - ``dist``       event_id → {selection: pending stake}
+    - ``daily``      (user_id, UTC day) → [count, wagered], cancelled excluded
+    - ``version``    changes on every place / settle / archive; views key
+                     their rendered embeds on it
+
+    Only the current day's counters are kept; older days are dropped the
+    first time a new day is recorded.
+    """
+
+    __slots__ = (
+        "pending", "status", "by_user", "user_pending", "by_event", "dist", "daily",
+        "version", "_day",
+    )
+
+    def __init__(self) -> None:
+        self.pending:  Dict[str, Dict] = {}
+        self.status:   Dict[str, str] = {}
+        self.by_user:  Dict[str, List[Tuple[str, str]]] = {}
+        self.user_pending: Dict[str, List[Tuple[str, str]]] = {}
+        self.by_event: Dict[str, Set[str]] = {}
+        self.dist:     Dict[str, Dict[str, float]] = {}
+        self.daily:    Dict[Tuple[str, str], List[float]] = {}
+        self.version   = next(_INDEX_VERSIONS)
+        self._day      = _today()
+
+    @classmethod
+    def build(cls, store: BetStore, guild_id: int) -> "_GuildIndex":
+        idx = cls()
+        for row in store.index_rows(guild_id):
+            idx._add_row(row)
+        for lst in idx.by_user.values():
+            lst.sort()
+        for lst in idx.user_pending.values():
+            lst.sort()
+        for bet in store.pending(guild_id):
+            idx.pending[bet["id"]] = bet
+        return idx
+
+    # ── Maintenance ───────────────────────────────────────────────────────────
+
+    def _add_row(self, bet: Dict) -> None:
+        bid, uid = bet["id"], str(bet["user_id"])
+        status   = bet["status"]
+        self.status[bid] = status
+        self.by_user.setdefault(uid, []).append((bet["placed_at"], bid))
+        if status == "pending":
+            self.user_pending.setdefault(uid, []).append((bet["placed_at"], bid))
+            self._track_event(bet, +1)
+        if status != "cancelled":
+            self._count_daily(bet, +1)
+
+    def add(self, bet: Dict) -> None:
+        """Record a newly placed bet (placed_at is always the newest)."""
+        bid, uid = bet["id"], str(bet["user_id"])
+        self.version      = next(_INDEX_VERSIONS)
+        self.status[bid]  = bet["status"]
+        self.pending[bid] = bet
+        bisect.insort(self.by_user.setdefault(uid, []), (bet["placed_at"], bid))
+        bisect.insort(self.user_pending.setdefault(uid, []), (bet["placed_at"], bid))
+        self._track_event(bet, +1)
+        self._count_daily(bet, +1)
+
+    def settle(self, bet: Dict) -> None:
+        """Move a bet out of the pending indexes (``bet`` carries the new status)."""
+        bid = bet["id"]
+        self.version     = next(_INDEX_VERSIONS)
+        self.status[bid] = bet["status"]
+        self.pending.pop(bid, None)
+        self._drop_pending(str(bet["user_id"]), (bet["placed_at"], bid))
+        self._track_event(bet, -1)
+        if bet["status"] == "cancelled":   # refunds free the daily slot and wager
+            self._count_daily(bet, -1)
+
+    def _drop_pending(self, uid: str, entry: Tuple[str, str]) -> None:
+        lst = self.user_pending.get(uid)
+        if not lst:
+            return
+        i = bisect.bisect_left(lst, entry)
+        if i < len(lst) and lst[i] == entry:
+            del lst[i]
+        if not lst:
+            del self.user_pending[uid]
+
+    def _track_event(self, bet: Dict, sign: int) -> None:
+        event_id = bet.get("event_id")
+        if not event_id or not bet.get("selection") or bet.get("bet_type") == "player_props":
+            return   # parlays and props don't move spread/total lines
+        bid = bet["id"]
+        ids = self.by_event.setdefault(event_id, set())
+        if sign > 0:
+            if bid in ids:
+                return
+            ids.add(bid)
+        else:
+            if bid not in ids:
+                return
+            ids.discard(bid)
+        dist = self.dist.setdefault(event_id, {})
+        sel  = bet["selection"]
+        dist[sel] = dist.get(sel, 0.0) + sign * float(bet.get("stake", 0.0))
+        if not ids:
+            self.by_event.pop(event_id, None)
+            self.dist.pop(event_id, None)
+        elif dist[sel] <= 1e-9:
+            dist.pop(sel, None)
+
+    def _count_daily(self, bet: Dict, sign: int) -> None:
+        day = (bet.get("placed_at") or "")[:10]
+        if day != self._roll_day():
+            return
+        counts = self.daily.setdefault((str(bet["user_id"]), day), [0, 0.0])
+        counts[0] += sign
+        counts[1] += sign * float(bet.get("stake", 0.0))
+
+    def _roll_day(self) -> str:
+        today = _today()
+        if today != self._day:
+            self._day  = today
+            self.daily = {k: v for k, v in self.daily.items() if k[1] == today}
+        return today
+
+    def forget(self, bet_ids: Set[str]) -> None:
+        """Drop settled bets that moved to the archive."""
+        self.version = next(_INDEX_VERSIONS)
+        users: Set[str] = set()
+        for uid, lst in self.by_user.items():
+            if any(bid in bet_ids for _, bid in lst):
+                users.add(uid)
+        for uid in users:
+            self.by_user[uid] = [e for e in self.by_user[uid] if e[1] not in bet_ids]
+            if not self.by_user[uid]:
+                del self.by_user[uid]
+        for uid in users:
+            if uid in self.user_pending:
+                self.user_pending[uid] = [e for e in self.user_pending[uid] if e[1] not in bet_ids]
+                if not self.user_pending[uid]:
+                    del self.user_pending[uid]
+        for bid in bet_ids:
+            self.status.pop(bid, None)
+
+    # ── Queries ───────────────────────────────────────────────────────────────
+
+    def today(self, user_id: str) -> Tuple[int, float]:
+        counts = self.daily.get((user_id, self._roll_day()))
+        return (int(counts[0]), max(counts[1], 0.0)) if counts else (0, 0.0)
+
+
 class BetsManager:
-    """Per-guild JSON-backed bet storage with in-memory caching."""
+    """Per-guild bet storage on a pluggable BetStore backend.
+
+    Defaults to a single SQLite (WAL) database under the cog's data path.
+    Legacy ``bets/<guild_id>.json`` files are imported into it the first time
+    it starts (see storage.migrate_json_to_sqlite).
+
+    Hot queries — pending bets, per-event distribution, a user's history and
+    daily limits — are answered from per-guild in-memory indexes (_GuildIndex)
+    rather than by scanning the store.
+
+    Writes are write-behind: each mutation is queued at once and handed to a
+    journal writer that appends and fsyncs everything recorded since its last
+    pass (group commit) to an append-only BetJournal from a worker thread;
+    a second background task applies the queue to the store in one
+    transaction, also off the loop.  Bets not yet flushed are served from an
+    in-memory overlay.  The journal is replayed on start-up; call ``flush()``
+    before ``close()`` on shutdown.
 
-    def __init__(self, cog) -> None:
-        self._base: Path = cog_data_path(cog) / "bets"
-        self._base.mkdir(parents=True, exist_ok=True)
-        self._cache: Dict[str, Dict] = {}   # str(guild_id) -> {"active": {}, "settled": {}}
+    Settled bets older than ``archive_after_days`` are moved out of the store
+    (and the indexes) into a BetArchive by ``archive_settled()``; history
+    queries page through it lazily with an opaque cursor.
+    """
 
-    # ── Internal ───────────────────────────────────────────────────────────────
+    def __init__(
+        self,
+        cog,
+        store: Optional[BetStore] = None,
+        *,
+        archive_after_days: int = ARCHIVE_AFTER_DAYS,
+    ) -> None:
+        base = cog_data_path(cog)
+        if store is None:
+            sqlite_store = SQLiteBetStore(base / "bets.sqlite3")
+            migrated     = migrate_json_to_sqlite(base / "bets", sqlite_store)
+            if migrated:
+                log.info("Migrated %d bet(s) from JSON files to SQLite", migrated)
+            store = sqlite_store
+        self._store: BetStore = store
+        self._indexes: Dict[int, _GuildIndex] = {}
+        # event_id -> {(guild_id, bet_id)} for every pending bet (single or parlay leg)
+        self._event_refs: Dict[str, Set[Tuple[int, str]]] = {}
+        # player name -> {(guild_id, bet_id)} for pending prop bets and parlay prop legs
+        self._player_refs: Dict[str, Set[Tuple[int, str]]] = {}
+        self._new_prop_players: Set[str] = set()   # players with refs added since last drain
+        self._all_indexed = False
+        self._archive  = BetArchive(base / "archive")
+        self.archive_after_days = archive_after_days
+        self.archived = 0
+
+        # ── Write-behind state ────────────────────────────────────────────────
+        self._journal = BetJournal(base / "bets.journal")
+        self._unjournalled: List[Op] = []                    # recorded, not yet fsync'd
+        self._journal_lock = asyncio.Lock()                  # one journal file op at a time
+        self._journal_task: Optional[asyncio.Task] = None
+        self._queue:   List[Op] = []                         # journalled, not yet sealed
+        self._sealed:  Optional[List[Op]] = None             # batch being / to be applied
+        self._sealed_seq = 0
+        self._seq      = 0                                   # last op sequence number
+        self._overlay: Dict[int, Dict[str, Tuple[int, Dict]]] = {}   # gid -> bid -> (seq, bet)
+        self._cleared: Dict[int, int] = {}                   # gid -> seq of unflushed clear
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._wake       = asyncio.Event()
 
-    def _path(self, guild_id: int) -> Path:
-        return self._base / f"{guild_id}.json"
+        self.flushes = 0
+        self.flushed = 0
 
-    def _load(self, guild_id: int) -> Dict:
-        gid = str(guild_id)
-        if gid in self._cache:
-            return self._cache[gid]
-        path = self._path(guild_id)
-        if path.exists():
+        replayed = self._journal.replay()
+        if replayed:
+            self._store.apply(replayed)
+            log.info("Replayed %d journalled bet change(s)", len(replayed))
+        self._journal.reset()
+
+    def close(self) -> None:
+        """Stop the flusher and close the store.
+
+        Anything still queued is applied synchronously when possible; if a
+        flush is mid-flight the journal keeps it for replay on next start.
+        """
+        for task in (self._flush_task, self._journal_task):
+            if task is not None and not task.done():
+                task.cancel()
+        # An append still running in a worker thread owns the journal file
+        journal_busy = self._journal_lock.locked()
+        if not self._flush_lock.locked():
+            pending = (self._sealed or []) + self._queue
             try:
-                with open(path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                if pending:
+                    self._store.apply(pending)
+                if not journal_busy:
+                    self._journal.reset()
+                    self._unjournalled = []
             except Exception:
-                data = {"active": {}, "settled": {}}
-        else:
-            data = {"active": {}, "settled": {}}
-        self._cache[gid] = data
-        return data
+                log.exception("Final bet flush failed; journal kept for replay")
+        if not journal_busy:
+            if self._unjournalled:
+                try:
+                    self._journal.append(self._unjournalled)
+                except Exception:
+                    log.exception("Could not journal %d bet change(s)", len(self._unjournalled))
+            self._journal.close()
+        self._store.close()
 
-    def _save(self, guild_id: int) -> None:
-        gid = str(guild_id)
-        if gid not in self._cache:
-            return
-        path = self._path(guild_id)
-        tmp  = path.with_suffix(".tmp")
+    # ── Write-behind ──────────────────────────────────────────────────────────
+
+    def _record(self, ops: List[Op]) -> None:
+        """Queue mutations for the journal writer and the store flush."""
+        self._unjournalled.extend(ops)
+        for guild_id, op, bet in ops:
+            self._seq += 1
+            if op == "clear":
+                self._overlay[guild_id] = {}
+                self._cleared[guild_id] = self._seq
+            else:
+                self._overlay.setdefault(guild_id, {})[bet["id"]] = (self._seq, bet)
+        self._queue.extend(ops)
+        if len(self._queue) >= FLUSH_BATCH:
+            self._wake.set()
         try:
-            with open(tmp, "w", encoding="utf-8") as f:
-                json.dump(self._cache[gid], f, indent=2)
-            tmp.replace(path)   # atomic rename on POSIX — no partial-write corruption
-        except Exception:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return   # no running loop — close() applies the queue
+        if self._journal_task is None or self._journal_task.done():
+            self._journal_task = loop.create_task(self._journal_loop())
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = loop.create_task(self._flush_loop())
+
+    async def _journal_loop(self) -> None:
+        """Append + fsync everything recorded since the last pass, in the executor.
+
+        Ops recorded while a write is in progress go out together in the next
+        one, so a burst of bets costs one fsync rather than one each.
+        """
+        loop = asyncio.get_running_loop()
+        while self._unjournalled:
+            async with self._journal_lock:
+                batch, self._unjournalled = self._unjournalled, []
+                try:
+                    await loop.run_in_executor(None, self._journal.append, batch)
+                except Exception:
+                    self._unjournalled[:0] = batch
+                    log.exception("Bet journal write failed; retrying in %.0fs", FLUSH_INTERVAL)
+                    await asyncio.sleep(FLUSH_INTERVAL)
+
+    async def _flush_loop(self) -> None:
+        while self._queue or self._sealed:
             try:
-                tmp.unlink(missing_ok=True)
-            except Exception:
+                await asyncio.wait_for(self._wake.wait(), FLUSH_INTERVAL)
+            except asyncio.TimeoutError:
                 pass
+            self._wake.clear()
+            try:
+                await self.flush()
+            except Exception:
+                log.exception("Bet flush failed; retrying in %.0fs", FLUSH_INTERVAL)
+
+    async def flush(self) -> None:
+        """Apply every queued mutation to the store now (in a worker thread)."""
+        async with self._flush_lock:
+            loop = asyncio.get_running_loop()
+            while self._sealed or self._queue:
+                if self._sealed is None:
+                    # Ops sealed here but still unjournalled land in the new
+                    # live file; replay is idempotent, so that is harmless
+                    async with self._journal_lock:
+                        self._journal.rotate()
+                    self._sealed, self._queue = self._queue, []
+                    self._sealed_seq = self._seq
+                # A failed batch stays sealed (memory and disk) and is retried first
+                await loop.run_in_executor(None, self._store.apply, self._sealed)
+                self._journal.commit()
+                self.flushes += 1
+                self.flushed += len(self._sealed)
+                self._sealed = None
+                self._trim_overlay(self._sealed_seq)
+
+    def _trim_overlay(self, upto: int) -> None:
+        for gid in list(self._overlay):
+            bets = self._overlay[gid]
+            for bid in [b for b, (seq, _) in bets.items() if seq <= upto]:
+                del bets[bid]
+            if not bets:
+                del self._overlay[gid]
+        for gid in [g for g, seq in self._cleared.items() if seq <= upto]:
+            del self._cleared[gid]
+
+    def _lookup(self, guild_id: int, bet_ids: List[str]) -> Dict[str, Dict]:
+        """Bodies for non-pending bets: unflushed overlay first, then the store."""
+        overlay = self._overlay.get(guild_id, {})
+        out     = {bid: overlay[bid][1] for bid in bet_ids if bid in overlay}
+        rest    = [bid for bid in bet_ids if bid not in out]
+        if rest and guild_id not in self._cleared:
+            out.update(self._store.get_many(guild_id, rest))
+        return out
+
+    def flush_stats(self) -> Dict[str, int]:
+        return {
+            "queued":   len(self._queue) + len(self._sealed or ()),
+            "flushes":  self.flushes,
+            "flushed":  self.flushed,
+            "archived": self.archived,
+        }
+
+    # ── Cold tier ─────────────────────────────────────────────────────────────
+
+    async def archive_settled(self) -> int:
+        """Move settled bets older than ``archive_after_days`` into the archive.
+
+        Bets are appended (fsync'd) to the archive before they are deleted
+        from the store, so a crash in between only leaves duplicates, which
+        readers skip.  Returns the number of bets moved.
+        """
+        await self.flush()
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=self.archive_after_days)).isoformat()
+        loop   = asyncio.get_running_loop()
+        moved  = 0
+        for guild_id in self._store.guilds():
+            old = self._store.settled_before(guild_id, cutoff, ARCHIVE_BATCH)
+            if not old:
+                continue
+            ops: List[Op] = [(guild_id, "delete", bet) for bet in old]
+            async with self._flush_lock:
+                await loop.run_in_executor(None, self._archive.append, guild_id, old)
+                await loop.run_in_executor(None, self._store.apply, ops)
+            idx = self._indexes.get(guild_id)
+            if idx is not None:
+                idx.forget({bet["id"] for bet in old})
+            moved += len(old)
+        if moved:
+            self.archived += moved
+            log.info("Archived %d settled bet(s) older than %d days", moved, self.archive_after_days)
+        return moved
+
+    def _hot_page(
+        self,
+        guild_id: int,
+        user_id: int,
+        status: Optional[str],
+        limit: int,
+        before: Optional[Cursor],
+    ) -> List[Dict]:
+        idx     = self._index(guild_id)
+        if status == "pending":   # served straight from the pending index
+            entries = idx.user_pending.get(str(user_id), [])
+            end     = bisect.bisect_left(entries, before) if before is not None else len(entries)
+            page    = (idx.pending.get(bid) for _, bid in reversed(entries[max(0, end - limit):end]))
+            return [bet for bet in page if bet is not None]
+        entries = idx.by_user.get(str(user_id), [])
+        end     = bisect.bisect_left(entries, before) if before is not None else len(entries)
+        ids: List[str] = []
+        for _, bid in reversed(entries[:end]):
+            if status is None or idx.status.get(bid) == status:
+                ids.append(bid)
+                if len(ids) >= limit:
+                    break
+        missing = [bid for bid in ids if bid not in idx.pending]
+        loaded  = self._lookup(guild_id, missing) if missing else {}
+        out: List[Dict] = []
+        for bid in ids:
+            bet = idx.pending.get(bid) or loaded.get(bid)
+            if bet is not None:
+                out.append(bet)
+        return out
+
+    @staticmethod
+    def _merge_page(hot: List[Dict], cold: List[Dict], limit: int) -> Tuple[List[Dict], Optional[str]]:
+        seen = {b["id"] for b in hot}
+        page = sorted(hot + [b for b in cold if b["id"] not in seen], key=bet_key, reverse=True)[:limit]
+        cursor = encode_cursor(bet_key(page[-1])) if len(page) >= limit else None
+        return page, cursor
+
+    async def user_bets_page(
+        self,
+        guild_id: int,
+        user_id: int,
+        status: Optional[str] = None,
+        limit: int = 30,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Dict], Optional[str]]:
+        """One page of a user's bets, newest first, plus the cursor for the next page.
+
+        Recent bets come from the hot store; archived months are read in the
+        executor and only as far back as the page needs.  The returned cursor
+        is None once history is exhausted.
+        """
+        before = decode_cursor(cursor)
+        hot    = self._hot_page(guild_id, user_id, status, limit, before)
+        cold: List[Dict] = []
+        if status != "pending":
+            loop = asyncio.get_running_loop()
+            cold = await loop.run_in_executor(
+                None, self._archive.page, guild_id, user_id, status, limit, before
+            )
+        return self._merge_page(hot, cold, limit)
+
+    def _index(self, guild_id: int) -> _GuildIndex:
+        idx = self._indexes.get(guild_id)
+        if idx is None:
+            idx = self._indexes[guild_id] = _GuildIndex.build(self._store, guild_id)
+            for bet in idx.pending.values():
+                self._ref_bet(guild_id, bet, True)
+        return idx
+
+    def _ref_bet(self, guild_id: int, bet: Dict, add: bool) -> None:
+        """Add / drop a pending bet in the cross-guild event and player indexes."""
+        key = (guild_id, bet["id"])
+        for index, names in (
+            (self._event_refs,  bet_event_ids(bet)),
+            (self._player_refs, bet_prop_players(bet)),
+        ):
+            for name in names:
+                if add:
+                    index.setdefault(name, set()).add(key)
+                else:
+                    refs = index.get(name)
+                    if refs is not None:
+                        refs.discard(key)
+                        if not refs:
+                            del index[name]
+        if add:
+            self._new_prop_players |= bet_prop_players(bet)
+
+    # ── Cross-guild lookups (settlement, injury refunds) ──────────────────────
+
+    def _index_all(self) -> None:
+        if not self._all_indexed:
+            for guild_id in self._store.guilds():
+                self._index(guild_id)
+            self._all_indexed = True
+
+    def pending_events(self) -> Set[str]:
+        """Every event ID at least one pending bet (in any guild) depends on."""
+        self._index_all()
+        return set(self._event_refs)
+
+    def pending_by_event(self, event_ids: Iterable[str]) -> Dict[int, List[Dict]]:
+        """guild_id → pending bets referencing any of ``event_ids`` (each bet once)."""
+        self._index_all()
+        return self._collect(self._event_refs, event_ids)
+
+    def pending_by_player(self, players: Iterable[str]) -> Dict[int, List[Dict]]:
+        """guild_id → pending prop bets / parlays with a prop on any of ``players``."""
+        self._index_all()
+        return self._collect(self._player_refs, players)
+
+    def drain_new_prop_players(self) -> Set[str]:
+        """Players that gained a pending prop reference since the last call."""
+        self._index_all()
+        players, self._new_prop_players = self._new_prop_players, set()
+        return players
+
+    def _collect(
+        self, index: Dict[str, Set[Tuple[int, str]]], names: Iterable[str]
+    ) -> Dict[int, List[Dict]]:
+        keys: Set[Tuple[int, str]] = set()
+        for name in names:
+            keys |= index.get(name, set())
+        out: Dict[int, List[Dict]] = {}
+        for guild_id, bet_id in keys:
+            out.setdefault(guild_id, []).append(self._indexes[guild_id].pending[bet_id])
+        for bets in out.values():
+            bets.sort(key=lambda b: b["placed_at"])   # settle in placement order
+        return out
 
     # ── Public API ─────────────────────────────────────────────────────────────
 
@@ -80,8 +603,7 @@ class BetsManager:
     ) -> str:
         """Save a new bet and return its ID."""
         bet_id = str(uuid.uuid4())[:8].upper()
-        data   = self._load(guild_id)
-        data["active"][bet_id] = {
+        bet = {
             "id":               bet_id,
             "guild_id":         str(guild_id),
             "user_id":          str(user_id),
@@ -102,34 +624,35 @@ class BetsManager:
             "result":           None,
             "actual_payout":    None,
         }
-        self._save(guild_id)
+        idx = self._index(guild_id)   # build before the insert so it isn't indexed twice
+        self._record([(guild_id, "insert", bet)])
+        idx.add(bet)
+        self._ref_bet(guild_id, bet, True)
         return bet_id
 
-    def get_user_bets(
+    async def get_user_bets(
         self,
         guild_id: int,
         user_id: int,
         status: Optional[str] = None,
         limit: int = 50,
     ) -> List[Dict]:
-        data  = self._load(guild_id)
-        uid   = str(user_id)
-        bets: List[Dict] = []
-        for pool in ("active", "settled"):
-            for bet in data[pool].values():
-                if bet["user_id"] == uid:
-                    if status is None or bet["status"] == status:
-                        bets.append(bet)
-        bets.sort(key=lambda b: b["placed_at"], reverse=True)
-        return bets[:limit]
+        """Newest first.  Only reaches into the archive (in the executor) if the hot tier is short."""
+        hot = self._hot_page(guild_id, user_id, status, limit, None)
+        if len(hot) >= limit or status == "pending":
+            return hot
+        loop = asyncio.get_running_loop()
+        cold = await loop.run_in_executor(
+            None, self._archive.page, guild_id, user_id, status, limit, None
+        )
+        return self._merge_page(hot, cold, limit)[0]
 
     def get_all_pending(self, guild_id: int) -> List[Dict]:
-        data = self._load(guild_id)
-        return [b for b in data["active"].values() if b["status"] == "pending"]
+        return list(self._index(guild_id).pending.values())
 
     def get_bet(self, guild_id: int, bet_id: str) -> Optional[Dict]:
-        data = self._load(guild_id)
-        return data["active"].get(bet_id) or data["settled"].get(bet_id)
+        bet = self._index(guild_id).pending.get(bet_id)
+        return bet if bet is not None else self._lookup(guild_id, [bet_id]).get(bet_id)
 
     def settle_bet(
         self,
@@ -138,29 +661,57 @@ class BetsManager:
         result: str,
         actual_payout: float,
     ) -> bool:
-        data = self._load(guild_id)
-        if bet_id not in data["active"]:
-            return False
-        bet                  = data["active"].pop(bet_id)
-        bet["status"]        = result
-        bet["result"]        = result
-        bet["settled_at"]    = _now()
-        bet["actual_payout"] = actual_payout
-        data["settled"][bet_id] = bet
-        self._save(guild_id)
-        return True
-
-    def clear_all_bets(self, guild_id: int) -> Tuple[int, List[Dict]]:
+        return bool(self.settle_many(guild_id, [(bet_id, result, actual_payout)]))
+
+    def settle_many(
+        self,
+        guild_id: int,
+        settlements: List[Tuple[str, str, float]],
+    ) -> List[Dict]:
+        """Settle a batch of (bet_id, result, actual_payout) in one journal write.
+
+        Returns the bets that actually moved out of pending — anything already
+        settled (or repeated within the batch) is skipped, so callers must only
+        pay out what comes back.
+        """
+        idx     = self._index(guild_id)
+        now     = _now()
+        settled: List[Dict] = []
+        seen:    Set[str]   = set()
+        for bet_id, result, actual_payout in settlements:
+            pending = idx.pending.get(bet_id)
+            if pending is None or bet_id in seen:
+                continue
+            seen.add(bet_id)
+            bet = dict(pending)
+            bet["status"]        = result
+            bet["result"]        = result
+            bet["settled_at"]    = now
+            bet["actual_payout"] = actual_payout
+            settled.append(bet)
+        if not settled:
+            return []
+        self._record([(guild_id, "settle", bet) for bet in settled])
+        for bet in settled:
+            idx.settle(bet)
+            self._ref_bet(guild_id, bet, False)
+        return settled
+
+    async def clear_all_bets(self, guild_id: int) -> Tuple[int, List[Dict]]:
         """
         Wipe ALL active and settled bets for a guild.
         Returns (active_count, list_of_active_bets_for_refund).
         Call this before resetting balances so the caller can refund stakes.
         """
-        data   = self._load(guild_id)
-        active = list(data["active"].values())
-        data["active"]   = {}
-        data["settled"]  = {}
-        self._save(guild_id)
+        active = list(self._index(guild_id).pending.values())
+        for bet in active:
+            self._ref_bet(guild_id, bet, False)
+        self._record([(guild_id, "clear", None)])
+        self._indexes[guild_id] = _GuildIndex()
+        # Under the flush lock so an archive pass can't append mid-delete
+        async with self._flush_lock:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._archive.clear, guild_id)
         return len(active), active
 
     def get_bet_distribution(self, guild_id: int, event_id: str) -> Dict[str, float]:
@@ -172,19 +723,11 @@ class BetsManager:
         Only PENDING (active) bets are counted — settled bets from prior games
         must not permanently skew the line for future sessions.
         """
-        data = self._load(guild_id)
-        dist: Dict[str, float] = {}
-        for bet in data["active"].values():
-            if bet.get("status") != "pending":
-                continue
-            if bet.get("event_id") != event_id:
-                continue
-            if bet.get("bet_type") == "player_props":
-                continue   # props don't affect spread/total lines
-            sel = bet.get("selection", "")
-            if sel:
-                dist[sel] = dist.get(sel, 0.0) + bet.get("stake", 0.0)
-        return dist
+        return dict(self._index(guild_id).dist.get(event_id, {}))
+
+    def index_version(self, guild_id: int) -> int:
+        """Changes whenever the guild's bets do — a cache key for rendered views."""
+        return self._index(guild_id).version
 
     def place_parlay(
         self,
@@ -198,8 +741,7 @@ class BetsManager:
     ) -> str:
         """Save a parlay bet and return its ID (prefixed 'P')."""
         bet_id = "P" + str(uuid.uuid4())[:7].upper()
-        data   = self._load(guild_id)
-        data["active"][bet_id] = {
+        bet = {
             "id":               bet_id,
             "guild_id":         str(guild_id),
             "user_id":          str(user_id),
@@ -214,7 +756,10 @@ class BetsManager:
             "result":           None,
             "actual_payout":    None,
         }
-        self._save(guild_id)
+        idx = self._index(guild_id)   # build before the insert so it isn't indexed twice
+        self._record([(guild_id, "insert", bet)])
+        idx.add(bet)
+        self._ref_bet(guild_id, bet, True)
         return bet_id
 
     def get_bets_placed_today(self, guild_id: int, user_id: int) -> int:
@@ -223,19 +768,7 @@ class BetsManager:
         Cancelled bets (injury refunds) are excluded so refunded bets do not
         burn the user's daily bet allowance.
         """
-        today = datetime.now(timezone.utc).date().isoformat()
-        data  = self._load(guild_id)
-        uid   = str(user_id)
-        count = 0
-        for pool in ("active", "settled"):
-            for bet in data[pool].values():
-                if bet.get("user_id") != uid:
-                    continue
-                if bet.get("status") == "cancelled":
-                    continue   # injury refunds don't consume daily bet slots
-                if (bet.get("placed_at") or "").startswith(today):
-                    count += 1
-        return count
+        return self._index(guild_id).today(str(user_id))[0]
 
     def get_wagered_today(self, guild_id: int, user_id: int) -> float:
         """Return total amount wagered today (UTC) by this user.
@@ -243,19 +776,8 @@ class BetsManager:
         Cancelled bets (injury refunds) are excluded so refunded stakes are
         not counted against the user's daily wagering limit.
         """
-        today = datetime.now(timezone.utc).date().isoformat()
-        data  = self._load(guild_id)
-        uid   = str(user_id)
-        total = 0.0
-        for pool in ("active", "settled"):
-            for bet in data[pool].values():
-                if bet.get("user_id") != uid:
-                    continue
-                if bet.get("status") == "cancelled":
-                    continue   # refunded bets don't count against daily wager limits
-                if (bet.get("placed_at") or "").startswith(today):
-                    total += float(bet.get("stake", 0.0))
-        return total
+        return self._index(guild_id).today(str(user_id))[1]
 
     def get_all_guilds(self) -> List[int]:
-        return [int(p.stem) for p in self._base.glob("*.json")]
+        unflushed = {gid for gid, idx in self._indexes.items() if idx.status}
+        return sorted(set(self._store.guilds()) | unflushed)
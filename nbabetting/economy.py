@@ -2,7 +2,9 @@
 from __future__ import annotations
 
 import asyncio
-from typing import TYPE_CHECKING, Dict, List
+import bisect
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
 
 import discord
 from redbot.core import Config
@@ -17,14 +19,141 @@ CURRENCY: str = "\U0001f4b0"
 DEFAULT_MAX_BET_PCT: float  = 0.50   # max single bet as fraction of current balance
 DEFAULT_MAX_DAILY_BETS: int = 20     # max individual bets placed per user per day
 
+# Member fields Economy.apply() accepts deltas for; money fields are rounded to cents
+_MONEY_FIELDS = ("balance", "total_wagered", "total_returned")
+_COUNT_FIELDS = ("bets_placed", "bets_won", "bets_lost", "bets_push", "current_streak")
+
+# Member stats the leaderboard shows next to the balance, with their defaults
+LEADERBOARD_FIELDS: Dict[str, float] = {
+    "bets_won":       0,
+    "bets_lost":      0,
+    "total_wagered":  0.0,
+    "total_returned": 0.0,
+}
+
+# Bulk admin operations yield to the loop every BULK_CHUNK members
+BULK_CHUNK = 500
+
+# progress(done, total)
+Progress = Callable[[int, int], Awaitable[None]]
+
+
+def _leaderboard_stats(data: Dict) -> Dict:
+    return {field: data.get(field, default) for field, default in LEADERBOARD_FIELDS.items()}
+
+
+class _GuildGate:
+    """Shared / exclusive gate over one guild's member records.
+
+    Per-user writes (apply, add, deduct, …) hold it shared, alongside their
+    per-user lock; a bulk rewrite holds it exclusively, so it waits for the
+    writes already in progress and holds off new ones until its single
+    Config write has landed.
+    """
+
+    def __init__(self) -> None:
+        self._open   = asyncio.Event()
+        self._idle   = asyncio.Event()
+        self._bulk   = asyncio.Lock()
+        self._active = 0
+        self._open.set()
+        self._idle.set()
+
+    @asynccontextmanager
+    async def shared(self) -> AsyncIterator[None]:
+        while not self._open.is_set():
+            await self._open.wait()
+        self._active += 1
+        self._idle.clear()
+        try:
+            yield
+        finally:
+            self._active -= 1
+            if not self._active:
+                self._idle.set()
+
+    @asynccontextmanager
+    async def exclusive(self) -> AsyncIterator[None]:
+        async with self._bulk:
+            self._open.clear()
+            try:
+                await self._idle.wait()
+                yield
+            finally:
+                self._open.set()
+
+
+class _RankIndex:
+    """One guild's members ordered by balance (desc), ties by user ID.
+
+    ``_order`` is a sorted list of (-balance, user_id) so top-K is a slice
+    and a user's rank is one bisect.  Updates are a bisect remove + insort.
+    ``_stats`` keeps each member's LEADERBOARD_FIELDS so a leaderboard
+    page never has to go back to Config.
+    """
+
+    __slots__ = ("_order", "_balance", "_stats")
+
+    def __init__(self) -> None:
+        self._order:   List[Tuple[float, str]] = []
+        self._balance: Dict[str, float] = {}
+        self._stats:   Dict[str, Dict] = {}
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    @classmethod
+    def build(cls, members: Dict[str, Dict]) -> "_RankIndex":
+        """Index ``{user_id: member data}``; only balance + LEADERBOARD_FIELDS are kept."""
+        idx = cls()
+        for uid, data in members.items():
+            idx._balance[uid] = float(data.get("balance", STARTING_BALANCE))
+            idx._stats[uid]   = _leaderboard_stats(data)
+        idx._order = sorted((-bal, uid) for uid, bal in idx._balance.items())
+        return idx
+
+    def update(self, user_id: str, balance: float, data: Optional[Dict] = None) -> None:
+        """Move ``user_id`` to ``balance``; ``data`` (full member data) refreshes its stats."""
+        if data is not None or user_id not in self._stats:
+            self._stats[user_id] = _leaderboard_stats(data or {})
+        old = self._balance.get(user_id)
+        if old == balance:
+            return
+        if old is not None:
+            i = bisect.bisect_left(self._order, (-old, user_id))
+            if i < len(self._order) and self._order[i] == (-old, user_id):
+                del self._order[i]
+        self._balance[user_id] = balance
+        bisect.insort(self._order, (-balance, user_id))
+
+    def top(self, k: int) -> List[Tuple[str, float, Dict]]:
+        return [(uid, -neg, self._stats[uid]) for neg, uid in self._order[:k]]
+
+    def rank(self, user_id: str) -> Optional[int]:
+        """1-based rank, or None if the user has no economy data."""
+        bal = self._balance.get(user_id)
+        if bal is None:
+            return None
+        return bisect.bisect_left(self._order, (-bal, user_id)) + 1
+
 
 class Economy:
-    """Wraps Red Config to provide per-guild, per-user economy operations."""
+    """Wraps Red Config to provide per-guild, per-user economy operations.
+
+    Balances (and the leaderboard stats) are mirrored into a per-guild
+    _RankIndex, built from Config the first time a guild's leaderboard or a
+    rank is requested and then kept in step by every member write, so
+    leaderboards never re-sort or re-read the guild.
+    """
 
     def __init__(self, config: Config, bot: "Red") -> None:
         self.config = config
         self.bot = bot
         self._locks: Dict[str, asyncio.Lock] = {}
+        self._gates: Dict[int, _GuildGate] = {}
+        self._ranks: Dict[int, _RankIndex] = {}
+        self._rank_building: Dict[int, Dict[str, Dict]] = {}   # writes seen mid-build
+        self._rank_locks: Dict[int, asyncio.Lock] = {}
 
     def _lock(self, guild_id: int, user_id: int) -> asyncio.Lock:
         key = f"{guild_id}:{user_id}"
@@ -32,6 +161,60 @@ class Economy:
             self._locks[key] = asyncio.Lock()
         return self._locks[key]
 
+    def _gate(self, guild_id: int) -> _GuildGate:
+        gate = self._gates.get(guild_id)
+        if gate is None:
+            gate = self._gates[guild_id] = _GuildGate()
+        return gate
+
+    @asynccontextmanager
+    async def _member(self, guild_id: int, user_id: int) -> AsyncIterator[None]:
+        """Guild gate (shared) + the user's lock — held by every member write."""
+        async with self._gate(guild_id).shared():
+            async with self._lock(guild_id, user_id):
+                yield
+
+    # ── Rank index ─────────────────────────────────────────────────────────────
+
+    def _note_balance(
+        self, guild_id: int, user_id: int, balance: float, data: Optional[Dict] = None
+    ) -> None:
+        """Mirror a member write into the rank index; pass ``data`` when stats changed too."""
+        idx = self._ranks.get(guild_id)
+        if idx is not None:
+            idx.update(str(user_id), balance, data)
+        building = self._rank_building.get(guild_id)
+        if building is not None:
+            seen = building.setdefault(str(user_id), {})
+            if data is not None:
+                seen.update(_leaderboard_stats(data))
+            seen["balance"] = balance
+
+    async def _ranking(self, guild_id: int) -> _RankIndex:
+        idx = self._ranks.get(guild_id)
+        if idx is not None:
+            return idx
+        lock = self._rank_locks.setdefault(guild_id, asyncio.Lock())
+        async with lock:
+            idx = self._ranks.get(guild_id)
+            if idx is None:
+                self._rank_building[guild_id] = {}
+                try:
+                    all_data = await self.config.all_members(discord.Object(id=guild_id))
+                    members  = {str(uid): data for uid, data in all_data.items()}
+                    # Writes that landed while Config was being read win
+                    for uid, seen in self._rank_building[guild_id].items():
+                        members[uid] = {**members.get(uid, {}), **seen}
+                finally:
+                    del self._rank_building[guild_id]
+                idx = self._ranks[guild_id] = _RankIndex.build(members)
+        return idx
+
+    async def get_rank(self, guild_id: int, user_id: int) -> Tuple[Optional[int], int]:
+        """(1-based rank or None, number of ranked players)."""
+        idx = await self._ranking(guild_id)
+        return idx.rank(str(user_id)), len(idx)
+
     # ── Single-user helpers ────────────────────────────────────────────────────
 
     async def get_data(self, guild_id: int, user_id: int) -> Dict:
@@ -46,11 +229,12 @@ class Economy:
         Uses the same per-user lock as deduct() to prevent concurrent win
         payouts or refunds from overwriting each other's balance write.
         """
-        async with self._lock(guild_id, user_id):
+        async with self._member(guild_id, user_id):
             conf    = self.config.member_from_ids(guild_id, user_id)
             bal     = await conf.balance()
             new_bal = round(bal + amount, 2)
             await conf.balance.set(new_bal)
+            self._note_balance(guild_id, user_id, new_bal)
             return new_bal
 
     async def deduct(self, guild_id: int, user_id: int, amount: float) -> bool:
@@ -59,89 +243,185 @@ class Economy:
         Uses a per-user asyncio lock to prevent race conditions when two
         concurrent sessions both read the balance before either write it.
         """
-        async with self._lock(guild_id, user_id):
+        async with self._member(guild_id, user_id):
             conf = self.config.member_from_ids(guild_id, user_id)
             bal  = await conf.balance()
             if bal < amount:
                 return False
-            await conf.balance.set(round(bal - amount, 2))
+            new_bal = round(bal - amount, 2)
+            await conf.balance.set(new_bal)
+            self._note_balance(guild_id, user_id, new_bal)
             return True
 
+    async def apply(
+        self,
+        guild_id: int,
+        user_id: int,
+        delta: Dict[str, float],
+        *,
+        reset_streak: bool = False,
+        streak_bonus_at: int = 0,
+        streak_bonus_coins: int = 0,
+    ) -> Dict:
+        """Apply several member changes in one read and one write.
+
+        ``delta`` maps member fields (balance, total_wagered, total_returned,
+        bets_placed/won/lost/push, current_streak) to amounts added to them.
+        ``reset_streak`` zeroes the streak before the delta is applied.  When
+        the resulting streak is a positive multiple of ``streak_bonus_at`` and
+        the delta extended it, ``streak_bonus_coins`` are credited as well.
+
+        Runs under the same per-user lock as add() / deduct().  Returns the
+        updated member data plus ``"streak_bonus"`` — the bonus credited (0 if none).
+        """
+        async with self._member(guild_id, user_id):
+            conf = self.config.member_from_ids(guild_id, user_id)
+            data = await conf.all()
+            if reset_streak:
+                data["current_streak"] = 0
+            for field, amount in delta.items():
+                if field in _MONEY_FIELDS:
+                    data[field] = round(data.get(field, 0.0) + amount, 2)
+                elif field in _COUNT_FIELDS:
+                    data[field] = int(data.get(field, 0) + amount)
+                else:
+                    raise KeyError(f"Unknown member field {field!r}")
+            data["current_streak"] = max(0, data.get("current_streak", 0))
+
+            bonus  = 0
+            streak = data["current_streak"]
+            if (
+                delta.get("current_streak", 0) > 0
+                and streak_bonus_at > 0 and streak_bonus_coins > 0
+                and streak > 0 and streak % streak_bonus_at == 0
+            ):
+                bonus = streak_bonus_coins
+                data["balance"] = round(data.get("balance", 0.0) + bonus, 2)
+
+            await conf.set(data)
+            self._note_balance(guild_id, user_id, data["balance"], data)
+            return dict(data, streak_bonus=bonus)
+
     async def set_balance(self, guild_id: int, user_id: int, amount: float) -> None:
-        await self.config.member_from_ids(guild_id, user_id).balance.set(round(amount, 2))
+        async with self._member(guild_id, user_id):
+            await self.config.member_from_ids(guild_id, user_id).balance.set(round(amount, 2))
+            self._note_balance(guild_id, user_id, round(amount, 2))
 
     async def record_bet_placed(self, guild_id: int, user_id: int, stake: float) -> None:
-        conf = self.config.member_from_ids(guild_id, user_id)
-        tw   = await conf.total_wagered()
-        await conf.total_wagered.set(round(tw + stake, 2))
-        bp   = await conf.bets_placed()
-        await conf.bets_placed.set(bp + 1)
+        await self.apply(guild_id, user_id, {"total_wagered": stake, "bets_placed": 1})
 
     async def record_win(self, guild_id: int, user_id: int, payout: float) -> None:
         """
         Record a win.  payout = full amount returned to player (stake + profit).
         This is what gets added to total_returned so that P/L = returned - wagered is correct.
         """
-        conf = self.config.member_from_ids(guild_id, user_id)
-        tr   = await conf.total_returned()
-        await conf.total_returned.set(round(tr + payout, 2))
-        bw   = await conf.bets_won()
-        await conf.bets_won.set(bw + 1)
+        await self.apply(guild_id, user_id, {"total_returned": payout, "bets_won": 1})
 
     async def record_loss(self, guild_id: int, user_id: int) -> None:
-        conf = self.config.member_from_ids(guild_id, user_id)
-        bl   = await conf.bets_lost()
-        await conf.bets_lost.set(bl + 1)
+        await self.apply(guild_id, user_id, {"bets_lost": 1})
 
     async def record_push(self, guild_id: int, user_id: int, stake: float) -> None:
         """Record a push.  stake is returned, so add it to total_returned."""
-        conf = self.config.member_from_ids(guild_id, user_id)
-        tr   = await conf.total_returned()
-        await conf.total_returned.set(round(tr + stake, 2))
-        bpush = await conf.bets_push()
-        await conf.bets_push.set(bpush + 1)
+        await self.apply(guild_id, user_id, {"total_returned": stake, "bets_push": 1})
 
     async def get_streak(self, guild_id: int, user_id: int) -> int:
         return await self.config.member_from_ids(guild_id, user_id).current_streak()
 
     async def set_streak(self, guild_id: int, user_id: int, value: int) -> None:
-        await self.config.member_from_ids(guild_id, user_id).current_streak.set(max(0, value))
+        async with self._member(guild_id, user_id):
+            await self.config.member_from_ids(guild_id, user_id).current_streak.set(max(0, value))
 
     # ── Bulk operations (admin) ────────────────────────────────────────────────
 
     async def reset_balance(self, guild_id: int, user_id: int) -> None:
-        await self.config.member_from_ids(guild_id, user_id).balance.set(STARTING_BALANCE)
+        async with self._member(guild_id, user_id):
+            await self.config.member_from_ids(guild_id, user_id).balance.set(STARTING_BALANCE)
+            self._note_balance(guild_id, user_id, STARTING_BALANCE)
+
+    async def _bulk_update(
+        self,
+        guild_id: int,
+        fn: Callable[[str, Dict], None],
+        progress: Optional[Progress] = None,
+        only: Optional[List[str]] = None,
+    ) -> int:
+        """Rewrite the guild's member scope with one Config read and one write.
+
+        ``fn(user_id, data)`` mutates each member dict in place (``only``
+        restricts it to those user IDs, creating missing records from the
+        registered defaults).  The guild gate is held exclusively for the
+        whole read-modify-write, so a payout or bet placed meanwhile waits
+        instead of being overwritten; ``progress`` is only awaited once the
+        write has landed and the gate is released.  Returns the number of
+        members updated.
+        """
+        async with self._gate(guild_id).exclusive():
+            stored   = await self.config.all_members(discord.Object(id=guild_id))
+            members  = {str(uid): data for uid, data in stored.items()}
+            defaults = self.config.defaults.get(Config.MEMBER, {})
+            uids     = list(members) if only is None else list(only)
+            for i, uid in enumerate(uids, 1):
+                fn(uid, members.setdefault(uid, dict(defaults)))
+                if i % BULK_CHUNK == 0:
+                    await asyncio.sleep(0)
+            # The guild's member scope as a single Config value — one write
+            await self.config._get_base_group(Config.MEMBER, str(guild_id)).set(members)
+            for uid in uids:
+                self._note_balance(guild_id, int(uid), members[uid]["balance"], members[uid])
+        if progress is not None:
+            await progress(len(uids), len(uids))
+        return len(uids)
 
-    async def reset_all_balances(self, guild: discord.Guild) -> int:
+    async def reset_all_balances(
+        self, guild: discord.Guild, progress: Optional[Progress] = None
+    ) -> int:
         """Reset every member's balance to starting value. Returns count."""
-        all_data = await self.config.all_members(guild)
-        count = 0
-        for uid in all_data:
-            await self.config.member_from_ids(guild.id, int(uid)).balance.set(STARTING_BALANCE)
-            count += 1
-        return count
-
-    async def reset_all_stats(self, guild: discord.Guild) -> int:
+        def _reset(uid: str, data: Dict) -> None:
+            data["balance"] = STARTING_BALANCE
+
+        return await self._bulk_update(guild.id, _reset, progress)
+
+    async def reset_all_stats(
+        self, guild: discord.Guild, progress: Optional[Progress] = None
+    ) -> int:
         """Clear all betting stats (not balance). Returns count."""
-        all_data = await self.config.all_members(guild)
-        count = 0
-        for uid in all_data:
-            conf = self.config.member_from_ids(guild.id, int(uid))
-            await conf.total_wagered.set(0.0)
-            await conf.total_returned.set(0.0)
-            await conf.bets_placed.set(0)
-            await conf.bets_won.set(0)
-            await conf.bets_lost.set(0)
-            await conf.bets_push.set(0)
-            await conf.current_streak.set(0)
-            count += 1
-        return count
+        def _reset(uid: str, data: Dict) -> None:
+            data.update(
+                total_wagered=0.0,
+                total_returned=0.0,
+                bets_placed=0,
+                bets_won=0,
+                bets_lost=0,
+                bets_push=0,
+                current_streak=0,
+            )
+
+        return await self._bulk_update(guild.id, _reset, progress)
+
+    async def credit_many(
+        self,
+        guild_id: int,
+        amounts: Dict[int, float],
+        progress: Optional[Progress] = None,
+    ) -> int:
+        """Add ``amounts[user_id]`` to each balance. Returns count."""
+        credits = {str(uid): amt for uid, amt in amounts.items() if amt}
+
+        def _credit(uid: str, data: Dict) -> None:
+            data["balance"] = round(data.get("balance", STARTING_BALANCE) + credits[uid], 2)
+
+        return await self._bulk_update(guild_id, _credit, progress, only=list(credits))
 
     # ── Leaderboard ───────────────────────────────────────────────────────────
 
-    async def get_leaderboard(self, guild: discord.Guild) -> List[Dict]:
-        """Return top-100 members sorted by balance desc."""
-        all_data = await self.config.all_members(guild)
-        entries  = [{"user_id": str(uid), **data} for uid, data in all_data.items()]
-        entries.sort(key=lambda e: e.get("balance", 0.0), reverse=True)
-        return entries[:100]
+    async def get_leaderboard(self, guild: discord.Guild, limit: int = 100) -> List[Dict]:
+        """Return the top ``limit`` members sorted by balance desc.
+
+        Served entirely from the rank index — balance plus LEADERBOARD_FIELDS
+        per entry — so no Config read happens once the guild is indexed.
+        """
+        idx = await self._ranking(guild.id)
+        return [
+            {**stats, "user_id": uid, "balance": bal}
+            for uid, bal, stats in idx.top(limit)
+        ]
@@ -0,0 +1,199 @@
+"""httpcache.py – On-disk ESPN response store for warm restarts and conditional GETs."""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlencode
+
+# Mutable responses older than this are deleted by prune() — they would only
+# be revalidated with a full 200 anyway.
+MUTABLE_MAX_AGE = 2 * 86400
+# Total size bound for the whole store (oldest files go first)
+STORE_MAX_BYTES = 256 * 1024 * 1024
+
+
+class StoredResponse:
+    __slots__ = ("data", "etag", "last_modified", "immutable", "fetched_at")
+
+    def __init__(
+        self,
+        data: Any,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        immutable: bool,
+        fetched_at: float,
+    ) -> None:
+        self.data          = data
+        self.etag          = etag
+        self.last_modified = last_modified
+        self.immutable     = immutable
+        self.fetched_at    = fetched_at   # wall clock (file mtime)
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.fetched_at
+
+    def conditional_headers(self) -> Dict[str, str]:
+        headers: Dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseStore:
+    """One JSON file per (URL, params) under ``base``.
+
+    Each file holds the decoded JSON body plus the ETag / Last-Modified
+    validators; the file mtime is the time the body was last confirmed fresh
+    (a 304 just touches it).  Entries flagged ``immutable`` — completed-game
+    summaries, athlete records — are served without ever going upstream.
+
+    All disk I/O runs in the default executor so the event loop never blocks.
+    """
+
+    def __init__(self, base: Path) -> None:
+        self._base = base
+        self._base.mkdir(parents=True, exist_ok=True)
+        self._pruned = False
+
+    # ── Keys ──────────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        query = urlencode(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+        return hashlib.sha1(f"{url}?{query}".encode("utf-8")).hexdigest()
+
+    def _path(self, key: str, immutable: bool = False) -> Path:
+        # Two-level fan-out keeps directories small over a full season; the
+        # ".imm" suffix lets prune() skip immutable files without opening them.
+        suffix = ".imm.json" if immutable else ".json"
+        return self._base / key[:2] / f"{key}{suffix}"
+
+    # ── Sync internals (executor) ─────────────────────────────────────────────
+
+    def _load_sync(self, key: str) -> Optional[StoredResponse]:
+        for immutable in (True, False):
+            path = self._path(key, immutable)
+            try:
+                mtime = path.stat().st_mtime
+                with open(path, "r", encoding="utf-8") as f:
+                    raw = json.load(f)
+            except (OSError, ValueError):
+                continue
+            return StoredResponse(
+                raw.get("data"),
+                raw.get("etag"),
+                raw.get("last_modified"),
+                immutable,
+                mtime,
+            )
+        return None
+
+    def _save_sync(self, key: str, payload: Dict[str, Any], immutable: bool) -> None:
+        path = self._path(key, immutable)
+        tmp  = path.with_suffix(".tmp")
+        try:
+            path.parent.mkdir(exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(payload, f, separators=(",", ":"))
+            tmp.replace(path)
+        except Exception:
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+            return
+        if immutable:
+            # The response is final now — drop the superseded mutable copy
+            try:
+                self._path(key).unlink()
+            except OSError:
+                pass
+
+    def _touch_sync(self, key: str) -> None:
+        try:
+            os.utime(self._path(key))
+        except OSError:
+            pass
+
+    def _prune_sync(self, max_age: float, max_bytes: int) -> int:
+        now     = time.time()
+        removed = 0
+        files: List[Tuple[float, int, Path]] = []
+        for path in self._base.glob("*/*.json"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            if now - st.st_mtime > max_age and not path.name.endswith(".imm.json"):
+                try:
+                    path.unlink()
+                    removed += 1
+                except OSError:
+                    pass
+                continue
+            files.append((st.st_mtime, st.st_size, path))
+
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= max_bytes:
+                break
+            try:
+                path.unlink()
+                removed += 1
+                total -= size
+            except OSError:
+                pass
+        return removed
+
+    # ── Async API ─────────────────────────────────────────────────────────────
+
+    async def load(self, url: str, params: Optional[Dict[str, Any]] = None) -> Optional[StoredResponse]:
+        loop = asyncio.get_running_loop()
+        if not self._pruned:
+            self._pruned = True
+            await self.prune()
+        return await loop.run_in_executor(None, self._load_sync, self.key(url, params))
+
+    async def save(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        data: Any,
+        *,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        immutable: bool = False,
+    ) -> None:
+        payload = {
+            "url":           url,
+            "params":        params or {},
+            "etag":          etag,
+            "last_modified": last_modified,
+            "data":          data,
+        }
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            None, self._save_sync, self.key(url, params), payload, immutable
+        )
+
+    async def touch(self, url: str, params: Optional[Dict[str, Any]] = None) -> None:
+        """Mark a stored response as just revalidated (HTTP 304)."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._touch_sync, self.key(url, params))
+
+    async def prune(
+        self,
+        max_age: float = MUTABLE_MAX_AGE,
+        max_bytes: int = STORE_MAX_BYTES,
+    ) -> int:
+        """Delete expired mutable responses, then oldest files beyond max_bytes."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._prune_sync, max_age, max_bytes)
@@ -0,0 +1,96 @@
+"""injuries.py – League-wide injury-report diffing (one pass per poll, shared by every guild)."""
+from __future__ import annotations
+
+from typing import Dict, List, Optional
+
+
+class InjuryChange:
+    """One player's status moving between two injury-report polls."""
+
+    __slots__ = ("name", "team", "old_status", "new_status", "comment")
+
+    def __init__(
+        self,
+        name: str,
+        team: str,
+        old_status: str,
+        new_status: str,
+        comment: str = "",
+    ) -> None:
+        self.name       = name
+        self.team       = team
+        self.old_status = old_status
+        self.new_status = new_status
+        self.comment    = comment
+
+    @property
+    def severe(self) -> bool:
+        return self.new_status in ("Out", "Doubtful")
+
+    def __repr__(self) -> str:
+        return f"InjuryChange({self.name!r}: {self.old_status} → {self.new_status})"
+
+
+class InjuryTracker:
+    """Keeps the previous league-wide injury snapshot and diffs each new report.
+
+    ``update()`` takes the fetcher's ``{team_abbr: [{"name", "status",
+    "description"}]}`` payload once per poll and returns structured
+    InjuryChange records; guilds only format and post them.  The snapshot is
+    a plain ``{player: status}`` dict so the cog can persist it (Config
+    global) and hand it back through ``load()`` after a restart — the first
+    poll after a reload then still reports changes instead of only
+    re-establishing a baseline.
+    """
+
+    def __init__(self, snapshot: Optional[Dict[str, str]] = None) -> None:
+        self._snapshot: Dict[str, str] = dict(snapshot or {})
+
+    @property
+    def snapshot(self) -> Dict[str, str]:
+        return dict(self._snapshot)
+
+    @property
+    def has_baseline(self) -> bool:
+        return bool(self._snapshot)
+
+    def load(self, snapshot: Dict[str, str]) -> None:
+        if snapshot and not self._snapshot:
+            self._snapshot = dict(snapshot)
+
+    def statuses(self) -> Dict[str, str]:
+        """Current {player: status} (players listed without a status are omitted)."""
+        return {name: st for name, st in self._snapshot.items() if st}
+
+    def update(self, injuries: Optional[Dict[str, List[Dict]]]) -> List[InjuryChange]:
+        """Replace the snapshot with ``injuries``; return the status changes.
+
+        An empty / failed payload leaves the snapshot untouched.  With no
+        baseline yet, the first report only becomes the baseline.
+        """
+        if not injuries:
+            return []
+        current: Dict[str, str] = {}
+        detail:  Dict[str, Dict[str, str]] = {}
+        for team_abbr, players in injuries.items():
+            for info in players:
+                name = info.get("name", "")
+                if not name:
+                    continue
+                current[name] = info.get("status") or ""
+                detail[name]  = {"team": team_abbr, "comment": info.get("description", "")}
+
+        changes: List[InjuryChange] = []
+        if self._snapshot:
+            for name, new_status in current.items():
+                old_status = self._snapshot.get(name)
+                if old_status and new_status and old_status != new_status:
+                    changes.append(InjuryChange(
+                        name,
+                        detail[name]["team"],
+                        old_status,
+                        new_status,
+                        detail[name]["comment"],
+                    ))
+        self._snapshot = current
+        return changes
@@ -3,18 +3,33 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from datetime import datetime
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 
 import discord
 from discord import app_commands
 from redbot.core import Config, commands
 from redbot.core.bot import Red
+from redbot.core.data_manager import cog_data_path
 
-from .data import BetsManager
+from .data import BetsManager, bet_prop_players
 from .economy import CURRENCY, DEFAULT_MAX_BET_PCT, DEFAULT_MAX_DAILY_BETS, STARTING_BALANCE, Economy
-from .odds import OddsFetcher, calc_parlay_odds, calc_profit, evaluate_bet, fmt_odds, fmt_prop_selection
+from .injuries import InjuryTracker
+from .notifications import Notifier
+from .odds import (
+    GAME_COMPLETED,
+    GAME_POSTPONED,
+    GameEvent,
+    OddsFetcher,
+    calc_parlay_odds,
+    calc_profit,
+    evaluate_bet,
+    fmt_odds,
+    fmt_prop_selection,
+)
 from .views import (
+    RENDERS,
     BetFlowView,
     ConfirmView,
     GamesView,
@@ -26,6 +41,19 @@ from .views import (
 
 log = logging.getLogger("red.jaffar-cogs.nbabetting")
 
+# "no_action" (DNP player leg) is treated like "push": the leg is removed and
+# the parlay continues with the remaining legs.
+_INACTIVE_LEGS = frozenset({"push", "no_action"})
+
+# Bets fetched per /bet history chunk (older chunks load while paging)
+HISTORY_CHUNK = 30
+# Seconds between passes moving old settled bets to the archive
+ARCHIVE_INTERVAL = 6 * 3600
+# Box scores fetched concurrently during a settlement pass
+BOX_SCORE_CONCURRENCY = 6
+# Injury statuses that auto-void player-prop bets (see _refund_injured_player_bets)
+VOID_INJURY_STATUSES = frozenset({"out", "inactive", "suspension", "doubtful"})
+
 
 # ── Admin check ───────────────────────────────────────────────────────────────
 
@@ -77,37 +105,59 @@ class NBABetting(commands.Cog):
             streak_bonus_at=0,          # 0 = disabled; e.g. 3 = bonus every 3 consecutive wins
             streak_bonus_coins=0,       # coins awarded at each streak milestone
         )
+        self.config.register_global(
+            injury_snapshot={},         # {player: status} from the last injury poll
+        )
 
         # ── Helpers ───────────────────────────────────────────────────────────
         self.economy = Economy(self.config, bot)
-        self.fetcher = OddsFetcher()
+        self.fetcher = OddsFetcher(cache_dir=cog_data_path(self) / "espn_cache")
         self.bets    = BetsManager(self)
 
         self._settlement_task: Optional[asyncio.Task] = None
         self._news_task:       Optional[asyncio.Task] = None
+        self._prewarm_task:    Optional[asyncio.Task] = None
+        # Set by scoreboard GameEvents (a game went final) — see _settlement_loop
+        self._settle_wake = asyncio.Event()
+        self._settle_last: Optional[datetime] = None
+        self._archive_last: Optional[datetime] = None
+        self._settle_stats: Optional[Dict[str, float]] = None   # last pass that graded anything
+        self._unsubscribe_games = self.fetcher.subscribe(self._on_game_event)
+        self._prewarm_last:    Optional[datetime]     = None
 
         # Track which news article IDs have already been posted per guild
         self._news_posted: Dict[int, Set[str]] = {}
-        # Track last known injury statuses per guild for change detection
-        self._injury_snapshot: Dict[int, Dict[str, str]] = {}
+        # Result / refund DMs and channel posts, delivered off the settlement path
+        self.notifier = Notifier(bot, self.config)
+        # League-wide injury statuses from the last poll, diffed once per poll
+        self.injuries = InjuryTracker()   # baseline restored from Config in cog_load
         # Track bet IDs already refunded due to injury (prevents double-refund)
         self._injury_refunded: Dict[int, Set[str]] = {}
+        self._void_players: Dict[str, str] = {}   # voidable players at the last news check
+        self._void_retry:   Set[str]       = set()  # players whose refunds failed or were skipped
 
     # ── Lifecycle ─────────────────────────────────────────────────────────────
 
     async def cog_load(self) -> None:
+        self.injuries.load(await self.config.injury_snapshot())
+        self.notifier.start()
         self._settlement_task = asyncio.create_task(self._settlement_loop())
         self._news_task       = asyncio.create_task(self._news_loop())
+        self._prewarm_task    = asyncio.create_task(self._prewarm_loop())
 
     async def cog_unload(self) -> None:
-        for task in (self._settlement_task, self._news_task):
+        self._unsubscribe_games()
+        for task in (self._settlement_task, self._news_task, self._prewarm_task):
             if task:
                 task.cancel()
                 try:
                     await task
                 except asyncio.CancelledError:
                     pass
+        await self.notifier.close()
         await self.fetcher.close()
+        await self.bets.flush()
+        self.bets.close()
 
     # ── Error handler ─────────────────────────────────────────────────────────
 
@@ -123,11 +173,38 @@ class NBABetting(commands.Cog):
     # Auto-settlement background task
     # ══════════════════════════════════════════════════════════════════════════
 
+    def _on_game_event(self, event: GameEvent) -> None:
+        if event.kind == GAME_COMPLETED:
+            self._settle_wake.set()
+        elif event.kind == GAME_POSTPONED:
+            log.info("Game %s postponed (%s)", event.event_id, event.game.get("name", ""))
+
     async def _settlement_loop(self) -> None:
+        """Poll the scoreboards every 2 minutes; settle only when a game went final.
+
+        Polling is a cached, mostly-304 scoreboard refresh that publishes
+        GameEvents — a GAME_COMPLETED event sets ``_settle_wake``.  A full pass
+        still runs every 30 minutes as a safety net.
+        """
         await self.bot.wait_until_ready()
+        self._settle_wake.set()   # catch up on anything that finished while unloaded
         while True:
             try:
-                await self._run_settlement()
+                await self.fetcher.get_completed_games(days_back=2)
+                overdue = (
+                    self._settle_last is None
+                    or (datetime.now() - self._settle_last).total_seconds() >= 1800
+                )
+                if self._settle_wake.is_set() or overdue:
+                    self._settle_wake.clear()
+                    self._settle_last = datetime.now()
+                    await self._run_settlement()
+                if (
+                    self._archive_last is None
+                    or (datetime.now() - self._archive_last).total_seconds() >= ARCHIVE_INTERVAL
+                ):
+                    self._archive_last = datetime.now()
+                    await self.bets.archive_settled()
             except asyncio.CancelledError:
                 raise
             except Exception as exc:
@@ -135,222 +212,294 @@ class NBABetting(commands.Cog):
             await asyncio.sleep(120)   # every 2 minutes
 
     async def _run_settlement(self) -> None:
-        guild_ids = self.bets.get_all_guilds()
-        if not guild_ids:
+        """Settle every pending bet whose games are final, event-first.
+
+        BetsManager keeps a cross-guild event_id → pending-bet index, so
+        only events some bet depends on are considered, each completed
+        event's box score is fetched once, and only the guilds / bets that
+        reference a completed event are graded.
+        """
+        t_start        = time.monotonic()
+        pending_events = self.bets.pending_events()
+        if not pending_events:
             return
 
         completed = await self.fetcher.get_completed_games(days_back=2)
         if not completed:
             return
 
-        completed_by_id = {g["event_id"]: g for g in completed}
-
-        for guild_id in guild_ids:
-            pending = self.bets.get_all_pending(guild_id)
-            if not pending:
-                continue
+        completed_by_id = {
+            g["event_id"]: g for g in completed
+            if g["event_id"] in pending_events and g.get("home_score") is not None
+        }
+        if not completed_by_id:
+            return
 
-            # Fetch guild config once per guild — used for insurance & streak bonus
-            guild_cfg          = await self.config.guild_from_id(guild_id).all()
-            insurance_pct      = float(guild_cfg.get("parlay_insurance_pct", 0.0))
-            streak_bonus_at    = int(guild_cfg.get("streak_bonus_at",    0))
-            streak_bonus_coins = int(guild_cfg.get("streak_bonus_coins", 0))
+        affected = self.bets.pending_by_event(completed_by_id)
 
-            # Pre-fetch box scores for all events with player-prop or parlay bets
-            prop_event_ids: set = set()
-            for b in pending:
+        # Box scores once per completed event that any prop bet / parlay leg needs
+        prop_event_ids: Set[str] = set()
+        for bets in affected.values():
+            for b in bets:
                 if b["bet_type"] == "player_props":
                     prop_event_ids.add(b["event_id"])
                 elif b["bet_type"] == "parlay":
                     for leg in b.get("legs", []):
                         if leg.get("leg_type") == "player_props":
                             prop_event_ids.add(leg["event_id"])
-            box_scores: dict = {}
-            for eid in prop_event_ids:
-                if eid in completed_by_id:
-                    bs = await self.fetcher.get_game_box_score(eid)
-                    if bs:
-                        box_scores[eid] = bs
+        needed = sorted(prop_event_ids & set(completed_by_id))
+        sem    = asyncio.Semaphore(BOX_SCORE_CONCURRENCY)
 
+        async def _box(eid: str):
+            async with sem:
+                try:
+                    return eid, await self.fetcher.get_game_box_score(eid)
+                except Exception as exc:
+                    log.warning("Box score fetch failed for %s: %s", eid, exc)
+                    return eid, None
+
+        t_box = time.monotonic()
+        box_scores: dict = {}
+        for eid, bs in await asyncio.gather(*[_box(eid) for eid in needed]):
+            if bs:
+                box_scores[eid] = bs
+            else:
+                self._settle_wake.set()   # box score not final yet — retry next cycle
+        box_elapsed = time.monotonic() - t_box
+
+        # ── Grade every affected bet in one pass ──────────────────────────────
+        # guild_id -> [(bet, result, payout, leg_results — None for singles)]
+        graded_by_guild: Dict[int, List[Tuple[dict, str, float, Optional[List[str]]]]] = {}
+        n_graded = 0
+        for guild_id, pending in affected.items():
             for bet in pending:
-                user_id = int(bet["user_id"])
-                stake   = bet["stake"]
-
-                # ── Parlay settlement ──────────────────────────────────────────
-                if bet["bet_type"] == "parlay":
-                    legs = bet.get("legs", [])
-                    if not legs:
-                        continue
-
-                    leg_results: List[str] = []
-                    can_settle = True
-
-                    for leg in legs:
-                        leg_game = completed_by_id.get(leg["event_id"])
-                        if not leg_game or leg_game.get("home_score") is None:
-                            can_settle = False
-                            break
-
-                        if leg.get("leg_type") == "player_props":
-                            ps = box_scores.get(leg["event_id"])
-                            if ps is None:
-                                can_settle = False
-                                break
-                            leg_result = evaluate_bet(
-                                bet_type="player_props",
-                                selection=leg["selection"],
-                                point=leg.get("point"),
-                                home_team=leg_game["home_team"],
-                                away_team=leg_game["away_team"],
-                                home_score=leg_game["home_score"],
-                                away_score=leg_game["away_score"],
-                                player_stats=ps,
-                            )
-                        else:
-                            leg_result = evaluate_bet(
-                                bet_type=leg["leg_type"],
-                                selection=leg["selection"],
-                                point=leg.get("point"),
-                                home_team=leg_game["home_team"],
-                                away_team=leg_game["away_team"],
-                                home_score=leg_game["home_score"],
-                                away_score=leg_game["away_score"],
-                            )
-                        leg_results.append(leg_result)
+                grade = self._grade_bet(bet, completed_by_id, box_scores)
+                if grade is not None:
+                    graded_by_guild.setdefault(guild_id, []).append((bet, *grade))
+                    n_graded += 1
 
-                    if not can_settle:
-                        continue
+        n_settled = 0
+        for guild_id, graded in graded_by_guild.items():
+            # Fetch guild config once per guild — used for insurance & streak bonus
+            guild_cfg          = await self.config.guild_from_id(guild_id).all()
+            insurance_pct      = float(guild_cfg.get("parlay_insurance_pct", 0.0))
+            streak_bonus_at    = int(guild_cfg.get("streak_bonus_at",    0))
+            streak_bonus_coins = int(guild_cfg.get("streak_bonus_coins", 0))
 
-                    # "no_action" (DNP player leg) is treated like "push":
-                    # the leg is removed and the parlay continues with remaining legs.
-                    _inactive = {"push", "no_action"}
+            # Settle the whole batch first, in one write — moves bets out of
+            # active before any money is credited, so a restart mid-loop can
+            # never pay twice.  Only bets that actually transitioned are paid.
+            settled_ids = {
+                b["id"] for b in self.bets.settle_many(
+                    guild_id, [(bet["id"], result, payout) for bet, result, payout, _ in graded]
+                )
+            }
+            n_settled += len(settled_ids)
 
-                    if "lost" in leg_results:
-                        result = "lost"
-                        payout = 0.0
-                    elif all(r == "won" for r in leg_results):
-                        result = "won"
-                        payout = stake + bet["potential_payout"]
-                    else:
-                        # Remove push/no_action legs — parlay recalculates on survivors
-                        surviving = [
-                            legs[i] for i, r in enumerate(leg_results)
-                            if r not in _inactive
-                        ]
-                        if len(surviving) < 2:
-                            result = "push"
-                            payout = stake
-                        else:
-                            new_odds   = calc_parlay_odds([lg["odds"] for lg in surviving])
-                            new_profit = calc_profit(stake, new_odds)
-                            result     = "won"
-                            payout     = stake + new_profit
-
-                    if result not in ("won", "push"):
-                        payout = 0.0
-
-                    # Settle first — moves bet out of active before crediting money.
-                    settled = self.bets.settle_bet(guild_id, bet["id"], result, payout)
-                    if not settled:
-                        continue  # already settled (safety guard)
+            for bet, result, payout, leg_results in graded:
+                if bet["id"] not in settled_ids:
+                    continue  # already settled (safety guard)
+                user_id = int(bet["user_id"])
+                stake   = bet["stake"]
 
+                # ── Parlay payout ──────────────────────────────────────────────
+                # Balance, stats, streak and milestone bonus land in one
+                # Economy.apply() — one Config read and one write per bet.
+                if leg_results is not None:
                     insurance_refund = 0.0
                     if result == "won":
-                        await self.economy.add(guild_id, user_id, payout)
-                        await self.economy.record_win(guild_id, user_id, payout)
-                        # Streak tracking
-                        streak = await self.economy.get_streak(guild_id, user_id) + 1
-                        await self.economy.set_streak(guild_id, user_id, streak)
+                        rec = await self.economy.apply(
+                            guild_id, user_id,
+                            {"balance": payout, "total_returned": payout,
+                             "bets_won": 1, "current_streak": 1},
+                            streak_bonus_at=streak_bonus_at,
+                            streak_bonus_coins=streak_bonus_coins,
+                        )
                     elif result == "push":
-                        await self.economy.add(guild_id, user_id, payout)
-                        await self.economy.record_push(guild_id, user_id, stake)
                         # Push doesn't break streak but doesn't extend it either
+                        rec = await self.economy.apply(
+                            guild_id, user_id,
+                            {"balance": payout, "total_returned": stake, "bets_push": 1},
+                        )
                     else:
-                        await self.economy.record_loss(guild_id, user_id)
-                        await self.economy.set_streak(guild_id, user_id, 0)
                         # ── Parlay insurance: 1-leg miss on 3+ leg parlay ──────
-                        n_settled = sum(1 for r in leg_results if r not in _inactive)
-                        n_lost    = leg_results.count("lost")
-                        if insurance_pct > 0 and n_lost == 1 and n_settled >= 3:
+                        n_active_legs = sum(1 for r in leg_results if r not in _INACTIVE_LEGS)
+                        n_lost        = leg_results.count("lost")
+                        if insurance_pct > 0 and n_lost == 1 and n_active_legs >= 3:
                             insurance_refund = max(1.0, round(stake * insurance_pct))
-                            await self.economy.add(guild_id, user_id, insurance_refund)
-
-                    # ── Streak milestone bonus ─────────────────────────────────
-                    streak_bonus = 0
-                    if result == "won" and streak_bonus_at > 0 and streak_bonus_coins > 0:
-                        streak = await self.economy.get_streak(guild_id, user_id)
-                        if streak > 0 and streak % streak_bonus_at == 0:
-                            streak_bonus = streak_bonus_coins
-                            await self.economy.add(guild_id, user_id, streak_bonus)
+                        rec = await self.economy.apply(
+                            guild_id, user_id,
+                            {"balance": insurance_refund, "bets_lost": 1},
+                            reset_streak=True,
+                        )
+                    streak_bonus = rec["streak_bonus"]
 
-                    await self._notify_result(
+                    self._notify_result(
                         guild_id, user_id, bet, result, payout,
                         insurance_refund=insurance_refund,
                         streak_bonus=streak_bonus,
                     )
                     continue
 
-                # ── Single bet settlement ──────────────────────────────────────
-                game = completed_by_id.get(bet["event_id"])
-                if not game:
-                    continue
-                if game.get("home_score") is None or game.get("away_score") is None:
-                    continue
-
-                player_stats = None
-                if bet["bet_type"] == "player_props":
-                    player_stats = box_scores.get(bet["event_id"])
-                    if player_stats is None:
-                        continue
-
-                result = evaluate_bet(
-                    bet_type=bet["bet_type"],
-                    selection=bet["selection"],
-                    point=bet.get("point"),
-                    home_team=bet["home_team"],
-                    away_team=bet["away_team"],
-                    home_score=game["home_score"],
-                    away_score=game["away_score"],
-                    player_stats=player_stats,
-                )
-
-                profit = bet["potential_payout"]
-
-                # "no_action" = player DNP late scratch → refund stake, same as push
-                if result in ("won", "push", "no_action"):
-                    payout = stake + profit if result == "won" else stake
-                else:
-                    payout = 0.0
-
-                # Settle first — prevents double payout if the bot restarts mid-loop.
-                settled = self.bets.settle_bet(guild_id, bet["id"], result, payout)
-                if not settled:
-                    continue  # already settled (safety guard)
-
-                streak_bonus = 0
+                # ── Single bet payout ──────────────────────────────────────────
                 if result == "won":
-                    await self.economy.add(guild_id, user_id, payout)
-                    await self.economy.record_win(guild_id, user_id, payout)
-                    streak = await self.economy.get_streak(guild_id, user_id) + 1
-                    await self.economy.set_streak(guild_id, user_id, streak)
-                    # Streak milestone bonus
-                    if streak_bonus_at > 0 and streak_bonus_coins > 0 and streak % streak_bonus_at == 0:
-                        streak_bonus = streak_bonus_coins
-                        await self.economy.add(guild_id, user_id, streak_bonus)
+                    rec = await self.economy.apply(
+                        guild_id, user_id,
+                        {"balance": payout, "total_returned": payout,
+                         "bets_won": 1, "current_streak": 1},
+                        streak_bonus_at=streak_bonus_at,
+                        streak_bonus_coins=streak_bonus_coins,
+                    )
                 elif result in ("push", "no_action"):
-                    await self.economy.add(guild_id, user_id, payout)
-                    await self.economy.record_push(guild_id, user_id, stake)
                     # Push / no_action doesn't break streak
+                    rec = await self.economy.apply(
+                        guild_id, user_id,
+                        {"balance": payout, "total_returned": stake, "bets_push": 1},
+                    )
                 else:
-                    await self.economy.record_loss(guild_id, user_id)
-                    await self.economy.set_streak(guild_id, user_id, 0)
+                    rec = await self.economy.apply(
+                        guild_id, user_id, {"bets_lost": 1}, reset_streak=True
+                    )
+                streak_bonus = rec["streak_bonus"]
 
-                await self._notify_result(
+                self._notify_result(
                     guild_id, user_id, bet, result, payout,
                     streak_bonus=streak_bonus,
                 )
 
-    async def _notify_result(
+        self.notifier.flush()
+
+        if n_graded:
+            elapsed = time.monotonic() - t_start
+            self._settle_stats = {
+                "at":         time.time(),
+                "elapsed":    elapsed,
+                "box_scores": len(needed),
+                "box_time":   box_elapsed,
+                "events":     len(completed_by_id),
+                "guilds":     len(graded_by_guild),
+                "settled":    n_settled,
+            }
+            log.info(
+                "Settled %d bet(s) across %d guild(s) for %d event(s) in %.2fs "
+                "(%d box score(s) in %.2fs)",
+                n_settled, len(graded_by_guild), len(completed_by_id), elapsed,
+                len(needed), box_elapsed,
+            )
+
+    @staticmethod
+    def _grade_bet(
+        bet: dict,
+        completed_by_id: Dict[str, dict],
+        box_scores: Dict[str, dict],
+    ) -> Optional[Tuple[str, float, Optional[List[str]]]]:
+        """(result, payout, leg_results — None for singles), or None if not gradable yet."""
+        stake = bet["stake"]
+
+        # ── Parlay grading ────────────────────────────────────────────────────
+        if bet["bet_type"] == "parlay":
+            legs = bet.get("legs", [])
+            if not legs:
+                return None
+
+            leg_results: List[str] = []
+            can_settle = True
+
+            for leg in legs:
+                leg_game = completed_by_id.get(leg["event_id"])
+                if not leg_game or leg_game.get("home_score") is None:
+                    can_settle = False
+                    break
+
+                if leg.get("leg_type") == "player_props":
+                    ps = box_scores.get(leg["event_id"])
+                    if ps is None:
+                        can_settle = False
+                        break
+                    leg_result = evaluate_bet(
+                        bet_type="player_props",
+                        selection=leg["selection"],
+                        point=leg.get("point"),
+                        home_team=leg_game["home_team"],
+                        away_team=leg_game["away_team"],
+                        home_score=leg_game["home_score"],
+                        away_score=leg_game["away_score"],
+                        player_stats=ps,
+                    )
+                else:
+                    leg_result = evaluate_bet(
+                        bet_type=leg["leg_type"],
+                        selection=leg["selection"],
+                        point=leg.get("point"),
+                        home_team=leg_game["home_team"],
+                        away_team=leg_game["away_team"],
+                        home_score=leg_game["home_score"],
+                        away_score=leg_game["away_score"],
+                    )
+                leg_results.append(leg_result)
+
+            if not can_settle:
+                return None
+
+            if "lost" in leg_results:
+                result = "lost"
+                payout = 0.0
+            elif all(r == "won" for r in leg_results):
+                result = "won"
+                payout = stake + bet["potential_payout"]
+            else:
+                # Remove push/no_action legs — parlay recalculates on survivors
+                surviving = [
+                    legs[i] for i, r in enumerate(leg_results)
+                    if r not in _INACTIVE_LEGS
+                ]
+                if len(surviving) < 2:
+                    result = "push"
+                    payout = stake
+                else:
+                    new_odds   = calc_parlay_odds([lg["odds"] for lg in surviving])
+                    new_profit = calc_profit(stake, new_odds)
+                    result     = "won"
+                    payout     = stake + new_profit
+
+            if result not in ("won", "push"):
+                payout = 0.0
+            return result, payout, leg_results
+
+        # ── Single bet grading ────────────────────────────────────────────────
+        game = completed_by_id.get(bet["event_id"])
+        if not game:
+            return None
+        if game.get("home_score") is None or game.get("away_score") is None:
+            return None
+
+        player_stats = None
+        if bet["bet_type"] == "player_props":
+            player_stats = box_scores.get(bet["event_id"])
+            if player_stats is None:
+                return None
+
+        result = evaluate_bet(
+            bet_type=bet["bet_type"],
+            selection=bet["selection"],
+            point=bet.get("point"),
+            home_team=bet["home_team"],
+            away_team=bet["away_team"],
+            home_score=game["home_score"],
+            away_score=game["away_score"],
+            player_stats=player_stats,
+        )
+
+        profit = bet["potential_payout"]
+
+        # "no_action" = player DNP late scratch → refund stake, same as push
+        if result in ("won", "push", "no_action"):
+            payout = stake + profit if result == "won" else stake
+        else:
+            payout = 0.0
+        return result, payout, None
+
+    def _notify_result(
         self,
         guild_id: int,
         user_id: int,
@@ -361,7 +510,7 @@ class NBABetting(commands.Cog):
         insurance_refund: float = 0.0,
         streak_bonus: int = 0,
     ) -> None:
-        """DM the user their bet result AND post to the guild's notify_channel if set."""
+        """Queue the bet result for the user's DM digest and the guild's notify_channel."""
         _EMOJI = {
             "won":       "✅",
             "lost":      "❌",
@@ -429,25 +578,70 @@ class NBABetting(commands.Cog):
                 inline=False,
             )
 
-        # ── DM the user ───────────────────────────────────────────────────────
-        user = self.bot.get_user(user_id)
-        if user:
-            try:
-                await user.send(embed=embed)
-            except (discord.Forbidden, discord.HTTPException):
-                pass
+        returned = payout + insurance_refund + streak_bonus
+        if result == "won":
+            outcome = f"won {CURRENCY}{payout:.0f}"
+        elif result == "lost":
+            outcome = f"lost {CURRENCY}{bet['stake']:.0f}"
+        else:
+            outcome = "stake returned"
+        if insurance_refund > 0:
+            outcome += f" · 🛡️ {CURRENCY}{insurance_refund:.0f} insurance"
+        if streak_bonus > 0:
+            outcome += f" · 🔥 {CURRENCY}{streak_bonus} streak bonus"
+        line = f"{emoji} `{bet['id']}` {sel_display} — {outcome}"
 
-        # ── Post to notify_channel if configured ──────────────────────────────
-        channel_id: Optional[int] = await self.config.guild_from_id(guild_id).notify_channel()
-        if channel_id:
-            channel = self.bot.get_channel(channel_id)
-            if channel:
-                try:
-                    member  = channel.guild.get_member(user_id)
-                    mention = member.mention if member else f"<@{user_id}>"
-                    await channel.send(content=mention, embed=embed)
-                except (discord.Forbidden, discord.HTTPException):
-                    pass
+        self.notifier.add(guild_id, user_id, embed, line, returned)
+
+    # ══════════════════════════════════════════════════════════════════════════
+    # Odds pre-warm background task
+    # ══════════════════════════════════════════════════════════════════════════
+
+    async def _prewarm_loop(self) -> None:
+        """Background task: rebuild each upcoming event's odds snapshot just before it expires.
+
+        Snapshot lifetimes shrink as tip-off approaches (odds.snapshot_ttl), so
+        games about to start are refreshed every couple of minutes while
+        tomorrow's slate is touched every quarter hour.  Interactive commands
+        then always read a warm snapshot instead of paying for the ESPN fan-out.
+        """
+        await self.bot.wait_until_ready()
+        while True:
+            try:
+                delay = await self._run_prewarm()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                log.exception("Odds pre-warm error: %s", exc)
+                delay = 60
+            await asyncio.sleep(delay)
+
+    async def _run_prewarm(self) -> float:
+        """Refresh every snapshot within 20 s of expiry; return seconds until the next one is due."""
+        lead  = 20
+        games = await self.fetcher.get_games()
+        due: List[str] = []
+        next_due = 600.0   # idle re-check when there is nothing on the slate
+        for g in games:
+            if g.get("completed"):
+                continue
+            expires_in = self.fetcher.snapshot_expires_in(g["event_id"])
+            if expires_in is None or expires_in <= lead:
+                due.append(g["event_id"])
+            else:
+                next_due = min(next_due, expires_in - lead)
+
+        if due:
+            await asyncio.gather(
+                *[self.fetcher.get_event_snapshot(eid, force=True) for eid in due],
+                return_exceptions=True,
+            )
+            self._prewarm_last = datetime.now()
+            for eid in due:
+                expires_in = self.fetcher.snapshot_expires_in(eid)
+                if expires_in is not None:
+                    next_due = min(next_due, expires_in - lead)
+        return max(next_due, 5.0)
 
     # ══════════════════════════════════════════════════════════════════════════
     # ESPN news background task
@@ -471,22 +665,53 @@ class NBABetting(commands.Cog):
         news_articles = await self.fetcher.get_news(limit=8)
         injuries      = await self.fetcher.get_injuries()
 
-        # ── Flatten all injuries to {player_name: status} for injury-refund logic ──
-        all_injured: Dict[str, str] = {}
-        for team_abbr_key, players in (injuries or {}).items():
-            for player_info in players:
-                pname  = player_info.get("name", "")
-                status = player_info.get("status", "")
-                if pname and status:
-                    all_injured[pname] = status
+        # ── Diff the league-wide report once; every guild shares the result ──
+        baseline    = self.injuries.snapshot
+        inj_changes = self.injuries.update(injuries)
+        if self.injuries.snapshot != baseline:
+            await self.config.injury_snapshot.set(self.injuries.snapshot)
+        all_injured = self.injuries.statuses()
 
         # Refund bets for any "Out" player across ALL guilds (not just those with a
         # news channel) — every guild with pending bets deserves the refund.
-        for guild in self.bot.guilds:
-            try:
-                await self._refund_injured_player_bets(guild.id, all_injured)
-            except Exception as exc:
-                log.warning("Injury refund check failed for guild %s: %s", guild.id, exc)
+        # Only players who just became voidable, voidable players who just
+        # gained a prop bet, or players whose refunds failed last time (a guild
+        # raised or was unavailable) are looked up in the cross-guild player index.
+        void_players: Dict[str, str] = {
+            pname: status.lower()
+            for pname, status in all_injured.items()
+            if status.lower() in VOID_INJURY_STATUSES
+        }
+        newly_void  = {p for p, st in void_players.items() if self._void_players.get(p) != st}
+        new_props   = self.bets.drain_new_prop_players() & set(void_players)
+        lookup      = newly_void | new_props | (self._void_retry & set(void_players))
+        retry: Set[str] = set()
+        if lookup:
+            affected = self.bets.pending_by_player(lookup)
+            for guild_id, bets in affected.items():
+                if self.bot.get_guild(guild_id) is not None:
+                    try:
+                        await self._refund_injured_player_bets(guild_id, bets, void_players)
+                        continue
+                    except Exception as exc:
+                        log.warning("Injury refund check failed for guild %s: %s", guild_id, exc)
+                for bet in bets:
+                    retry |= bet_prop_players(bet) & lookup
+            self.notifier.flush()
+        self._void_players = void_players
+        self._void_retry   = retry
+
+        injury_lines: List[str] = []
+        for change in inj_changes:
+            emoji = "🔴" if change.severe else (
+                    "🟡" if change.new_status == "Questionable" else "🟢")
+            line = (
+                f"{emoji} **{change.name}** ({change.team}): "
+                f"{change.old_status} → **{change.new_status}**"
+            )
+            if change.comment:
+                line += f"\n　_{change.comment[:120]}_"
+            injury_lines.append(line)
 
         for guild in self.bot.guilds:
             guild_id   = guild.id
@@ -498,7 +723,6 @@ class NBABetting(commands.Cog):
                 continue
 
             posted_ids = self._news_posted.get(guild_id, set())
-            old_inj    = self._injury_snapshot.get(guild_id, {})
 
             # ── Post new news articles ─────────────────────────────────────────
             new_articles = [
@@ -532,54 +756,21 @@ class NBABetting(commands.Cog):
                     log.warning("Failed posting news article: %s", exc)
 
             # ── Post injury status CHANGES ─────────────────────────────────────
-            # get_injuries() returns {team_abbr: [{"name", "status", "description"}]}
-            # Flatten to {player_name: status} and keep a detail map for display.
-            new_inj: Dict[str, str] = {}
-            inj_detail: Dict[str, Dict] = {}
-            for team_abbr_key, players in (injuries or {}).items():
-                for player_info in players:
-                    pname  = player_info.get("name", "")
-                    status = player_info.get("status", "Active")
-                    if not pname:
-                        continue
-                    new_inj[pname] = status
-                    inj_detail[pname] = {
-                        "team":    team_abbr_key,
-                        "comment": player_info.get("description", ""),
-                    }
-
-            if old_inj:  # Only compare after we have a baseline snapshot
-                changes: List[str] = []
-                for pname, new_status in new_inj.items():
-                    old_status = old_inj.get(pname)
-                    if old_status and old_status != new_status:
-                        # Status changed — worth flagging
-                        inj_info = inj_detail.get(pname, {})
-                        team     = inj_info.get("team", "")
-                        comment  = inj_info.get("comment", "")
-                        emoji    = "🔴" if new_status in ("Out", "Doubtful") else (
-                                   "🟡" if new_status == "Questionable" else "🟢")
-                        line = f"{emoji} **{pname}** ({team}): {old_status} → **{new_status}**"
-                        if comment:
-                            line += f"\n　_{comment[:120]}_"
-                        changes.append(line)
-
-                if changes:
-                    try:
-                        embed = discord.Embed(
-                            title="🏥 NBA Injury Report Update",
-                            description="\n".join(changes[:10]),
-                            color=discord.Color.red(),
-                        )
-                        embed.set_footer(text="Source: ESPN  ·  Updates every 5 minutes")
-                        await channel.send(embed=embed)
-                    except (discord.Forbidden, discord.HTTPException):
-                        pass
-                    except Exception as exc:
-                        log.warning("Failed posting injury update: %s", exc)
+            if injury_lines:
+                try:
+                    embed = discord.Embed(
+                        title="🏥 NBA Injury Report Update",
+                        description="\n".join(injury_lines[:10]),
+                        color=discord.Color.red(),
+                    )
+                    embed.set_footer(text="Source: ESPN  ·  Updates every 5 minutes")
+                    await channel.send(embed=embed)
+                except (discord.Forbidden, discord.HTTPException):
+                    pass
+                except Exception as exc:
+                    log.warning("Failed posting injury update: %s", exc)
 
-            self._news_posted[guild_id]       = posted_ids
-            self._injury_snapshot[guild_id]   = new_inj
+            self._news_posted[guild_id] = posted_ids
 
     # ══════════════════════════════════════════════════════════════════════════
     # Injury-based auto-refund
@@ -588,12 +779,15 @@ class NBABetting(commands.Cog):
     async def _refund_injured_player_bets(
         self,
         guild_id: int,
-        all_injured: Dict[str, str],
+        pending: List[Dict],
+        void_players: Dict[str, str],
     ) -> None:
         """
-        Scan all pending bets in a guild.  Any player-prop or parlay-leg bet
-        whose player is now listed as "Out", "Inactive", or "Doubtful" is
-        cancelled and the full stake is refunded to the bettor via DM.
+        Check a guild's pending bets (those the player index matched).  Any
+        player-prop or parlay-leg bet whose player is now listed as "Out",
+        "Inactive", or "Doubtful" (``void_players``: name → lower-case status)
+        is cancelled and the full stake is refunded; the notice is queued on
+        the notifier and delivered once the caller flushes it.
 
         Why Doubtful is included: when a player goes doubtful their expected
         output drops ~22% and the line moves significantly lower.  A bet
@@ -605,19 +799,10 @@ class NBABetting(commands.Cog):
 
         Each bet ID is only refunded once (tracked in self._injury_refunded).
         """
-        # Players who definitely won't play or are severely compromised
-        _VOID_STATUSES = {"out", "inactive", "suspension", "doubtful"}
-
-        void_players: Dict[str, str] = {
-            pname: status.lower()
-            for pname, status in all_injured.items()
-            if status.lower() in _VOID_STATUSES
-        }
         if not void_players:
             return
 
         refunded_ids = self._injury_refunded.setdefault(guild_id, set())
-        pending = self.bets.get_all_pending(guild_id)
 
         for bet in pending:
             bet_id = bet["id"]
@@ -669,21 +854,13 @@ class NBABetting(commands.Cog):
                 embed.add_field(name="Pick",     value=f"{selection} (voided)", inline=False)
                 embed.set_footer(text=footer)
 
-                user = self.bot.get_user(user_id)
-                if user:
-                    try:
-                        await user.send(embed=embed)
-                    except (discord.Forbidden, discord.HTTPException):
-                        pass
-
-                channel_id: Optional[int] = await self.config.guild_from_id(guild_id).notify_channel()
-                if channel_id:
-                    channel = self.bot.get_channel(channel_id)
-                    if channel:
-                        try:
-                            await channel.send(content=f"<@{user_id}>", embed=embed)
-                        except (discord.Forbidden, discord.HTTPException):
-                            pass
+                reason = "doubtful" if inj_status == "doubtful" else "ruled out"
+                self.notifier.add(
+                    guild_id, user_id, embed,
+                    f"🚫 `{bet_id}` {fmt_prop_selection(selection)} — voided, {player_name} "
+                    f"{reason} · {CURRENCY}{stake:.0f} refunded",
+                    stake,
+                )
 
             # ── Parlay bet — check each player-prop leg ────────────────────
             elif bet.get("bet_type") == "parlay":
@@ -743,21 +920,12 @@ class NBABetting(commands.Cog):
                 embed.add_field(name="Refunded", value=f"💰 **{stake:.0f}**", inline=True)
                 embed.set_footer(text=footer)
 
-                user = self.bot.get_user(user_id)
-                if user:
-                    try:
-                        await user.send(embed=embed)
-                    except (discord.Forbidden, discord.HTTPException):
-                        pass
-
-                channel_id2: Optional[int] = await self.config.guild_from_id(guild_id).notify_channel()
-                if channel_id2:
-                    channel2 = self.bot.get_channel(channel_id2)
-                    if channel2:
-                        try:
-                            await channel2.send(content=f"<@{user_id}>", embed=embed)
-                        except (discord.Forbidden, discord.HTTPException):
-                            pass
+                self.notifier.add(
+                    guild_id, user_id, embed,
+                    f"🚫 `{bet_id}` {len(legs)}-leg parlay — voided "
+                    f"({', '.join(p for p, _ in void_legs)}) · {CURRENCY}{stake:.0f} refunded",
+                    stake,
+                )
 
     # ══════════════════════════════════════════════════════════════════════════
     # /economy  commands
@@ -955,7 +1123,7 @@ class NBABetting(commands.Cog):
         # h2h/spreads/totals block the whole bet-type for that game (can't bet both sides).
         # Player props block the specific player only (other players are still available).
         _OUTCOME_TYPES = {"h2h", "spreads", "totals"}
-        pending_bets   = self.bets.get_user_bets(ctx.guild.id, ctx.author.id, status="pending")
+        pending_bets   = await self.bets.get_user_bets(ctx.guild.id, ctx.author.id, status="pending")
 
         locked_types:   Dict[str, Set[str]] = {}
         locked_players: Dict[str, Set[str]] = {}
@@ -1019,11 +1187,15 @@ class NBABetting(commands.Cog):
     @bet_group.command(name="mybets")
     async def bet_mybets(self, ctx: commands.Context) -> None:
         """View your active (pending) bets."""
-        bets = self.bets.get_user_bets(ctx.guild.id, ctx.author.id, "pending")
+        version = self.bets.index_version(ctx.guild.id)
+        bets    = await self.bets.get_user_bets(ctx.guild.id, ctx.author.id, "pending")
         if not bets:
             return await ctx.send("You have no pending bets. Use `/bet place` to get started!")
-        view = MyBetsView(bets, self, ctx.author.id, ctx.guild.id,
-                          title="📋 My Active Bets")
+        rank, players = await self.economy.get_rank(ctx.guild.id, ctx.author.id)
+        title = "📋 My Active Bets"
+        if rank is not None:
+            title += f"  ·  🏆 Rank #{rank} of {players}"
+        view = MyBetsView(bets, self, ctx.author.id, ctx.guild.id, title=title, version=version)
         msg  = await ctx.send(embed=view.build_embed(), view=view)
         view.message = msg
 
@@ -1032,15 +1204,24 @@ class NBABetting(commands.Cog):
     async def bet_history(
         self, ctx: commands.Context, user: Optional[discord.Member] = None
     ) -> None:
-        """View your full bet history (last 50 bets)."""
-        target = user or ctx.author
-        bets   = self.bets.get_user_bets(ctx.guild.id, target.id, limit=50)
+        """View your full bet history, newest first."""
+        target  = user or ctx.author
+        version = self.bets.index_version(ctx.guild.id)
+        bets, cursor = await self.bets.user_bets_page(ctx.guild.id, target.id, limit=HISTORY_CHUNK)
         if not bets:
             return await ctx.send(
                 f"{'You have' if target == ctx.author else f'{target.display_name} has'} no bet history yet."
             )
+
+        async def _more(cur: str):
+            return await self.bets.user_bets_page(
+                ctx.guild.id, target.id, limit=HISTORY_CHUNK, cursor=cur
+            )
+
         view = MyBetsView(bets, self, ctx.author.id, ctx.guild.id,
-                          title=f"📜 Bet History — {target.display_name}")
+                          title=f"📜 Bet History — {target.display_name}",
+                          cursor=cursor, load_more=_more,
+                          user_id=target.id, version=version)
         msg  = await ctx.send(embed=view.build_embed(), view=view)
         view.message = msg
 
@@ -1101,6 +1282,23 @@ class NBABetting(commands.Cog):
             f"✅ Set **{user.display_name}**'s balance to {CURRENCY}**{amount:.0f}**."
         )
 
+    @staticmethod
+    def _progress_editor(msg: discord.Message, label: str):
+        """Economy bulk-op progress callback that edits ``msg`` at most every 2s."""
+        last = [0.0]
+
+        async def _progress(done: int, total: int) -> None:
+            now = asyncio.get_running_loop().time()
+            if done < total and now - last[0] < 2.0:
+                return
+            last[0] = now
+            try:
+                await msg.edit(content=f"⏳ {label}… {done}/{total}", view=None)
+            except discord.HTTPException:
+                pass
+
+        return _progress
+
     @admin_group.command(name="reseteco")
     async def admin_reseteco(self, ctx: commands.Context) -> None:
         """Reset ALL members' balances AND clear all bet history."""
@@ -1115,8 +1313,10 @@ class NBABetting(commands.Cog):
         await view.wait()
         if not view.confirmed:
             return await msg.edit(content="Reset cancelled.", view=None)
-        self.bets.clear_all_bets(ctx.guild.id)
-        count = await self.economy.reset_all_balances(ctx.guild)
+        await self.bets.clear_all_bets(ctx.guild.id)
+        count = await self.economy.reset_all_balances(
+            ctx.guild, progress=self._progress_editor(msg, "Resetting balances")
+        )
         await msg.edit(
             content=(
                 f"✅ Reset {count} member balance(s) to {CURRENCY}**{STARTING_BALANCE:.0f}**"
@@ -1142,15 +1342,18 @@ class NBABetting(commands.Cog):
 
         # Refund stakes for all pending bets before wiping — otherwise users
         # permanently lose the coins they staked on bets that never settled.
-        active_cleared, active_bets = self.bets.clear_all_bets(ctx.guild.id)
+        active_cleared, active_bets = await self.bets.clear_all_bets(ctx.guild.id)
+        refunds: Dict[int, float] = {}
         refunded = 0
         for bet in active_bets:
             if bet.get("status") == "pending" and bet.get("stake", 0) > 0:
-                try:
-                    await self.economy.add(ctx.guild.id, int(bet["user_id"]), bet["stake"])
-                    refunded += 1
-                except Exception:
-                    pass
+                uid = int(bet["user_id"])
+                refunds[uid] = refunds.get(uid, 0.0) + bet["stake"]
+                refunded += 1
+        if refunds:
+            await self.economy.credit_many(
+                ctx.guild.id, refunds, progress=self._progress_editor(msg, "Refunding stakes")
+            )
 
         detail = f" ({refunded} stake(s) refunded)" if refunded else ""
         await msg.edit(
@@ -1170,7 +1373,9 @@ class NBABetting(commands.Cog):
         await view.wait()
         if not view.confirmed:
             return await msg.edit(content="Reset cancelled.", view=None)
-        count = await self.economy.reset_all_stats(ctx.guild)
+        count = await self.economy.reset_all_stats(
+            ctx.guild, progress=self._progress_editor(msg, "Clearing stats")
+        )
         await msg.edit(
             content=f"✅ Cleared betting stats for {count} member(s).",
             view=None,
@@ -1181,7 +1386,7 @@ class NBABetting(commands.Cog):
     async def admin_lookup(self, ctx: commands.Context, user: discord.Member) -> None:
         """Admin view of a user's full economy data and recent bets."""
         data = await self.economy.get_data(ctx.guild.id, user.id)
-        bets = self.bets.get_user_bets(ctx.guild.id, user.id, limit=5)
+        bets = await self.bets.get_user_bets(ctx.guild.id, user.id, limit=5)
 
         embed = discord.Embed(
             title=f"🔍 Admin Lookup — {user.display_name}", color=discord.Color.blurple()
@@ -1251,8 +1456,10 @@ class NBABetting(commands.Cog):
             settled = self.bets.settle_bet(ctx.guild.id, bet["id"], "push", bet["stake"])
             if not settled:
                 continue  # already settled by loop — skip to avoid double-refund
-            await self.economy.add(ctx.guild.id, int(bet["user_id"]), bet["stake"])
-            await self.economy.record_push(ctx.guild.id, int(bet["user_id"]), bet["stake"])
+            await self.economy.apply(
+                ctx.guild.id, int(bet["user_id"]),
+                {"balance": bet["stake"], "total_returned": bet["stake"], "bets_push": 1},
+            )
             count += 1
 
         await msg.edit(content=f"✅ Voided {count} bet(s). All stakes refunded.", view=None)
@@ -1296,8 +1503,10 @@ class NBABetting(commands.Cog):
                 content="❌ Could not void — bet may have already settled.", view=None
             )
 
-        await self.economy.add(ctx.guild.id, user_id, bet["stake"])
-        await self.economy.record_push(ctx.guild.id, user_id, bet["stake"])
+        await self.economy.apply(
+            ctx.guild.id, user_id,
+            {"balance": bet["stake"], "total_returned": bet["stake"], "bets_push": 1},
+        )
         await msg.edit(
             content=f"✅ Bet `{bet_id}` voided. {CURRENCY}**{bet['stake']:.0f}** refunded to <@{user_id}>.",
             view=None,
@@ -1419,6 +1628,7 @@ class NBABetting(commands.Cog):
     ) -> None:
         """Set a channel to announce bet results publicly (in addition to DMs)."""
         await self.config.guild(ctx.guild).notify_channel.set(channel.id if channel else None)
+        self.notifier.set_channel(ctx.guild.id, channel.id if channel else None)
         if channel:
             await ctx.send(f"✅ Settlement announcements will post in {channel.mention}.")
         else:
@@ -1434,7 +1644,6 @@ class NBABetting(commands.Cog):
         if channel:
             # Reset cached state so it posts fresh articles to the new channel
             self._news_posted.pop(ctx.guild.id, None)
-            self._injury_snapshot.pop(ctx.guild.id, None)
             await ctx.send(
                 f"✅ ESPN NBA news & injury updates will post in {channel.mention}.\n"
                 f"New articles and injury status changes will appear every ~5 minutes."
@@ -1492,13 +1701,54 @@ class NBABetting(commands.Cog):
             inline=True,
         )
 
+        embed.add_field(
+            name="ESPN Coalesced",
+            value=(
+                f"{self.fetcher.coalesced_waiters} duplicate request(s) merged\n"
+                f"{self.fetcher.disk_hits} served from disk · "
+                f"{self.fetcher.not_modified} not modified (304)"
+            ),
+            inline=True,
+        )
+        cs = self.fetcher.client_stats()
+        embed.add_field(
+            name="ESPN Client",
+            value=(
+                f"{cs['requests']} request(s) · {cs['retries']} retried · "
+                f"{cs['failures']} failed\n"
+                f"Circuit: {', '.join(cs['open_hosts']) + ' open' if cs['open_hosts'] else 'closed'}"
+                f" ({cs['short_circuited']} short-circuited)"
+            ),
+            inline=True,
+        )
+        cache_lines = [
+            f"`{s['name']}` {s['size']} · {s['hit_rate']:.0%} hit"
+            for s in self.fetcher.cache_stats()
+            if s["hits"] or s["stale_hits"] or s["misses"]
+        ]
+        embed.add_field(
+            name="ESPN Caches",
+            value="\n".join(cache_lines) or "No lookups yet",
+            inline=False,
+        )
+
         settle_task = self._settlement_task
         settle_ok   = settle_task is not None and not settle_task.done()
         news_task   = self._news_task
         news_ok     = news_task is not None and not news_task.done()
+        warm_task   = self._prewarm_task
+        warm_ok     = warm_task is not None and not warm_task.done()
+        settle_val = f"{'🟢 Running' if settle_ok else '🔴 Stopped'} (polls every 2 min)"
+        ss = self._settle_stats
+        if ss:
+            settle_val += (
+                f"\nLast pass <t:{int(ss['at'])}:R>: {ss['settled']} bet(s) · "
+                f"{ss['guilds']} guild(s) · {ss['elapsed']:.2f}s "
+                f"({ss['box_scores']} box score(s) in {ss['box_time']:.2f}s)"
+            )
         embed.add_field(
             name="Settlement Loop",
-            value=f"{'🟢 Running' if settle_ok else '🔴 Stopped'} (every 10 min)",
+            value=settle_val,
             inline=True,
         )
         embed.add_field(
@@ -1506,6 +1756,35 @@ class NBABetting(commands.Cog):
             value=f"{'🟢 Running' if news_ok else '🔴 Stopped'} (every 15 min)",
             inline=True,
         )
+        embed.add_field(
+            name="Odds Pre-warm",
+            value=(
+                f"{'🟢 Running' if warm_ok else '🔴 Stopped'}"
+                + (f" (last <t:{int(self._prewarm_last.timestamp())}:R>)" if self._prewarm_last else "")
+            ),
+            inline=True,
+        )
+        fs = self.bets.flush_stats()
+        embed.add_field(
+            name="Bet Writes",
+            value=(
+                f"{fs['queued']} queued · {fs['flushed']} written in {fs['flushes']} batch(es)"
+                f" · {fs['archived']} archived"
+            ),
+            inline=True,
+        )
+        ns = self.notifier.stats()
+        embed.add_field(
+            name="Notifications",
+            value=f"{ns['sent']} sent · {ns['pending']} pending · {ns['failed']} failed",
+            inline=True,
+        )
+        rs = RENDERS.stats()
+        embed.add_field(
+            name="Rendered Embeds",
+            value=f"{rs['entries']} cached · {rs['hits']} hits · {rs['misses']} misses",
+            inline=True,
+        )
         embed.set_footer(
             text="Use /admin settle to trigger settlement  ·  "
                  "/admin setinsurance  ·  /admin setstreakbonus"
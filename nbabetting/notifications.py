@@ -0,0 +1,241 @@
+"""notifications.py – Queued, coalescing delivery of bet results and refunds (DMs + notify channels)."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import discord
+
+from .economy import CURRENCY
+
+log = logging.getLogger("red.jaffar-cogs.nbabetting")
+
+# ── Pacing ────────────────────────────────────────────────────────────────────
+# Minimum seconds between sends to the same Discord rate-limit bucket.  Channel
+# messages are limited to 5 / 5 s per channel; DM-channel creation and sends
+# share a tighter per-bot budget, so every DM goes through one bucket.
+CHANNEL_INTERVAL = 1.1
+DM_INTERVAL      = 0.5
+MAX_RETRIES      = 2       # extra attempts after a 429 / 5xx
+DRAIN_TIMEOUT    = 15.0    # seconds close() waits for queued notices to go out
+
+# ── Message limits ────────────────────────────────────────────────────────────
+EMBEDS_PER_MESSAGE = 10
+EMBED_CHARS_TOTAL  = 6000
+DIGEST_DESC_LIMIT  = 3800
+
+
+class _Note:
+    """One bet's notification: the full embed plus a one-line digest summary."""
+
+    __slots__ = ("embed", "line", "returned")
+
+    def __init__(self, embed: discord.Embed, line: str, returned: float) -> None:
+        self.embed    = embed
+        self.line     = line
+        self.returned = returned
+
+
+# guild_id → user_id → notes, in the order they were added
+Batch = Dict[int, Dict[int, List[_Note]]]
+
+
+def _count(batch: Batch) -> int:
+    return sum(len(notes) for users in batch.values() for notes in users.values())
+
+
+class Notifier:
+    """Delivers settlement results and refunds off the settlement path.
+
+    Producers call ``add()`` for every bet and ``flush()`` once at the end of
+    a pass; neither awaits Discord.  The flushed batch goes onto a queue that
+    a single worker drains: each user gets one DM per batch (the bet's own
+    embed for a single result, a digest embed for several), and each guild's
+    notify channel gets those embeds packed up to ten per message.  Sends are
+    paced per rate-limit bucket and retried on 429 / 5xx.
+
+    Notify-channel IDs are cached; the cog calls ``set_channel()`` when an
+    admin changes one.  ``close()`` flushes and drains the queue (for up to
+    DRAIN_TIMEOUT seconds) before stopping the worker — the bets behind
+    these notices are already settled.
+    """
+
+    def __init__(self, bot: Any, config: Any) -> None:
+        self.bot     = bot
+        self.config  = config
+        self._buffer: Batch = {}
+        self._queue: "asyncio.Queue[Batch]" = asyncio.Queue()
+        self._task:  Optional[asyncio.Task] = None
+        self._in_flight = 0   # notes of the batch being delivered not yet DM'd
+        self._channels:  Dict[int, Optional[int]] = {}
+        self._next_send: Dict[Tuple[str, int], float] = {}
+
+        self.queued  = 0   # notes accepted
+        self.sent    = 0   # Discord messages delivered
+        self.failed  = 0   # Discord messages given up on
+
+    # ── Lifecycle ─────────────────────────────────────────────────────────────
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._worker())
+
+    async def close(self) -> None:
+        self.flush()
+        if self._task and not self._task.done():
+            try:
+                await asyncio.wait_for(self._queue.join(), DRAIN_TIMEOUT)
+            except asyncio.TimeoutError:
+                pass
+        undelivered = 0
+        while not self._queue.empty():
+            undelivered += _count(self._queue.get_nowait())
+            self._queue.task_done()
+        undelivered += self._in_flight
+        if undelivered:
+            log.warning("Notifier closed with %d notification(s) undelivered", undelivered)
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    # ── Producers ─────────────────────────────────────────────────────────────
+
+    def add(
+        self,
+        guild_id: int,
+        user_id: int,
+        embed: discord.Embed,
+        line: str,
+        returned: float = 0.0,
+    ) -> None:
+        """Buffer one notification until the next ``flush()``."""
+        self._buffer.setdefault(guild_id, {}).setdefault(user_id, []).append(
+            _Note(embed, line, returned)
+        )
+        self.queued += 1
+
+    def flush(self) -> None:
+        """Hand everything buffered since the last flush to the worker."""
+        if self._buffer:
+            batch, self._buffer = self._buffer, {}
+            self._queue.put_nowait(batch)
+
+    def set_channel(self, guild_id: int, channel_id: Optional[int]) -> None:
+        self._channels[guild_id] = channel_id
+
+    def stats(self) -> Dict[str, int]:
+        pending = _count(self._buffer)
+        return {
+            "queued":  self.queued,
+            "pending": pending + self._queue.qsize(),
+            "sent":    self.sent,
+            "failed":  self.failed,
+        }
+
+    # ── Worker ────────────────────────────────────────────────────────────────
+
+    async def _worker(self) -> None:
+        while True:
+            batch = await self._queue.get()
+            self._in_flight = _count(batch)
+            try:
+                await self._deliver(batch)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                log.exception("Notification delivery failed: %s", exc)
+            finally:
+                self._in_flight = 0
+                self._queue.task_done()
+
+    async def _deliver(self, batch: Batch) -> None:
+        for guild_id, users in batch.items():
+            posts: List[Tuple[int, discord.Embed]] = []
+            for user_id, notes in users.items():
+                embed = notes[0].embed if len(notes) == 1 else self._digest(notes)
+                posts.append((user_id, embed))
+                user = self.bot.get_user(user_id)
+                if user is not None:
+                    await self._send(("dm", 0), user, embed=embed)
+                self._in_flight -= len(notes)
+
+            channel_id = await self._channel_id(guild_id)
+            channel    = self.bot.get_channel(channel_id) if channel_id else None
+            if channel is None:
+                continue
+            for chunk in self._pack(posts):
+                mentions = " ".join(dict.fromkeys(f"<@{uid}>" for uid, _ in chunk))
+                await self._send(
+                    ("channel", channel.id), channel,
+                    content=mentions, embeds=[e for _, e in chunk],
+                )
+
+    async def _channel_id(self, guild_id: int) -> Optional[int]:
+        if guild_id not in self._channels:
+            self._channels[guild_id] = await self.config.guild_from_id(guild_id).notify_channel()
+        return self._channels[guild_id]
+
+    @staticmethod
+    def _pack(posts: List[Tuple[int, discord.Embed]]) -> List[List[Tuple[int, discord.Embed]]]:
+        """Group embeds into messages within Discord's count and size limits."""
+        chunks: List[List[Tuple[int, discord.Embed]]] = []
+        current: List[Tuple[int, discord.Embed]] = []
+        size = 0
+        for user_id, embed in posts:
+            n = len(embed)
+            if current and (len(current) >= EMBEDS_PER_MESSAGE or size + n > EMBED_CHARS_TOTAL):
+                chunks.append(current)
+                current, size = [], 0
+            current.append((user_id, embed))
+            size += n
+        if current:
+            chunks.append(current)
+        return chunks
+
+    @staticmethod
+    def _digest(notes: List[_Note]) -> discord.Embed:
+        """One embed summarising several results for the same user."""
+        lines: List[str] = []
+        used = 0
+        for i, note in enumerate(notes):
+            if used + len(note.line) + 1 > DIGEST_DESC_LIMIT:
+                lines.append(f"…and {len(notes) - i} more")
+                break
+            lines.append(note.line)
+            used += len(note.line) + 1
+        returned = sum(n.returned for n in notes)
+        embed = discord.Embed(
+            title=f"📋 Bet Update — {len(notes)} bets",
+            description="\n".join(lines),
+            color=discord.Color.green() if returned > 0 else discord.Color.red(),
+        )
+        embed.add_field(name="Total Returned", value=f"{CURRENCY}**{returned:.0f}**", inline=True)
+        embed.set_footer(text="Use /bet history for full details.")
+        return embed
+
+    async def _send(self, bucket: Tuple[str, int], target: Any, **kwargs: Any) -> None:
+        """Send once the bucket's interval has passed; retry 429 / 5xx with backoff."""
+        interval = DM_INTERVAL if bucket[0] == "dm" else CHANNEL_INTERVAL
+        for attempt in range(MAX_RETRIES + 1):
+            wait = self._next_send.get(bucket, 0.0) - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._next_send[bucket] = time.monotonic() + interval
+            try:
+                await target.send(**kwargs)
+                self.sent += 1
+                return
+            except discord.Forbidden:
+                break   # DMs closed / missing channel permissions — not retryable
+            except discord.HTTPException as exc:
+                if exc.status != 429 and exc.status < 500:
+                    break
+                retry_after = getattr(exc, "retry_after", None) or interval * (2 ** attempt)
+                self._next_send[bucket] = time.monotonic() + retry_after
+        self.failed += 1
@@ -3,12 +3,17 @@ ML-from-spread derivation, back-to-back detection, form weighting, line movement
 from __future__ import annotations
 
 import asyncio
+import functools
+import inspect
 import re
-import time
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Set, Tuple
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Set, Tuple, Union
 
-import aiohttp
+from .athletes import AthleteRegistry
+from .cache import TTLCache
+from .client import RETRY_STATUSES, ESPNClient
+from .httpcache import ResponseStore
 
 # ── ESPN endpoints ────────────────────────────────────────────────────────────
 ESPN_SCOREBOARD  = "https://site.api.espn.com/apis/site/v2/sports/basketball/nba/scoreboard"
@@ -50,9 +55,18 @@ GAMES_TTL             = 120     # 2 min
 INJURIES_TTL          = 300     # 5 min
 LEADERS_TTL           = 3600    # 1 hr
 TEAM_STATS_TTL        = 21600   # 6 hrs  — scoring avgs barely shift day-to-day
-YESTERDAY_TTL         = 3600    # 1 hr   — who played yesterday
+SCOREBOARD_TTL_PAST   = 21600   # 6 hrs  — a past day's scoreboard once every game is final
 RECENT_COMPLETED_TTL  = 3600    # 1 hr   — list of recent completed games
 LAST5_TTL             = 7200    # 2 hrs  — per-team last-5 player averages
+SUMMARY_TTL           = 120     # 2 min  — game summary doc (frozen once the game is final)
+
+# Per-event odds snapshot lifetime by distance to tip-off (see snapshot_ttl)
+SNAPSHOT_TTL_NEAR     = GAMES_TTL  # live, or tipping off within the hour
+SNAPSHOT_TTL_TODAY    = 300     # 5 min  — tip-off within 6 hrs
+SNAPSHOT_TTL_LATER    = 900     # 15 min — later today / tomorrow
+
+# ── Cache bounds ──────────────────────────────────────────────────────────────
+SUMMARY_CACHE_MAX_BYTES = 48 * 1024 * 1024   # raw summary docs are ~0.3–0.5 MB each
 
 # ── ESPN numeric team IDs (permanent, never change) ──────────────────────────
 TEAM_IDS: Dict[str, int] = {
@@ -786,6 +800,70 @@ def generate_odds_for_game(
     }
 
 
+def apply_guild_overlay(snapshot: Dict, bet_dist: Optional[Dict[str, float]] = None) -> Dict:
+    """
+    Layer one guild's bet distribution on top of a shared event snapshot.
+
+    Only the odds (line movement + public-action vig) and the public-action
+    percentages depend on the guild; player props and everything else are
+    shared as-is.  With no bet volume the snapshot's base odds are reused.
+    """
+    bet_dist = bet_dist or {}
+    game     = snapshot["game"]
+
+    if any(bet_dist.values()):
+        odds = generate_odds_for_game(
+            game,
+            snapshot["injuries"],
+            snapshot["stat_leaders"],
+            snapshot["home_ts"],
+            snapshot["away_ts"],
+            bet_dist,
+            real_odds=snapshot["real_odds"],
+        )
+    else:
+        odds = snapshot["odds"]
+
+    # Build public betting action percentages for UI display
+    h2h_money = bet_dist.get(game["home_team"], 0.0) + bet_dist.get(game["away_team"], 0.0)
+    ou_money  = bet_dist.get("Over", 0.0) + bet_dist.get("Under", 0.0)
+    public_action = {
+        "h2h_total": int(h2h_money),
+        "ou_total":  int(ou_money),
+        "home_pct":  round(bet_dist.get(game["home_team"], 0.0) / h2h_money, 3) if h2h_money > 0 else 0.5,
+        "away_pct":  round(bet_dist.get(game["away_team"], 0.0) / h2h_money, 3) if h2h_money > 0 else 0.5,
+        "over_pct":  round(bet_dist.get("Over",  0.0) / ou_money, 3) if ou_money > 0 else 0.5,
+        "under_pct": round(bet_dist.get("Under", 0.0) / ou_money, 3) if ou_money > 0 else 0.5,
+    }
+
+    return {
+        **game,
+        "odds":             odds,
+        "player_props":     snapshot["player_props"],
+        "public_action":    public_action,
+        "snapshot_version": snapshot["version"],
+        # Everything the odds board renders: the shared snapshot plus this
+        # guild's distribution (views cache rendered embeds on it)
+        "render_version":   (snapshot["version"], tuple(sorted(bet_dist.items()))),
+    }
+
+
+def snapshot_ttl(game: Dict, now: Optional[datetime] = None) -> float:
+    """How long an event snapshot stays fresh: shorter the closer to tip-off."""
+    if game.get("state") == "STATUS_IN_PROGRESS":
+        return SNAPSHOT_TTL_NEAR
+    try:
+        tip = datetime.fromisoformat(game.get("commence_time", "").replace("Z", "+00:00"))
+    except ValueError:
+        return SNAPSHOT_TTL_NEAR
+    until_tip = (tip - (now or datetime.now(timezone.utc))).total_seconds()
+    if until_tip <= 3600:
+        return SNAPSHOT_TTL_NEAR
+    if until_tip <= 6 * 3600:
+        return SNAPSHOT_TTL_TODAY
+    return SNAPSHOT_TTL_LATER
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 # Player props
 # ══════════════════════════════════════════════════════════════════════════════
@@ -1035,113 +1113,673 @@ def _parse_espn_event(event: Dict) -> Optional[Dict]:
 
 
 # ══════════════════════════════════════════════════════════════════════════════
-# ESPN Fetcher
+# ESPN game summary parsers
 # ══════════════════════════════════════════════════════════════════════════════
+#
+# One ESPN_SUMMARY document per event feeds the pickcenter odds, the pre-game
+# player pool and the post-game box score.  OddsFetcher fetches and caches the
+# raw document once (see OddsFetcher._get_summary); everything below is a pure
+# parser over that document so no consumer ever issues its own request.
 
-class OddsFetcher:
-    def __init__(self) -> None:
-        self._session: Optional[aiohttp.ClientSession] = None
+def _pickcenter_from_summary(data: Dict) -> Optional[Dict]:
+    """Extract real DraftKings odds from an ESPN summary's pickcenter section.
+
+    Returns a parsed real_odds dict (same shape as _parse_pickcenter output)
+    or None if the game hasn't had lines posted yet.
+    """
+    pc_list = data.get("pickcenter") or []
+    if not pc_list:
+        return None
+
+    # Prefer DraftKings provider; fall back to first available
+    pc: Optional[Dict] = None
+    for p in pc_list:
+        pname = (p.get("provider", {}).get("name") or "").lower()
+        if "draft" in pname or pc is None:
+            pc = p
+            if "draft" in pname:
+                break
+
+    if not pc:
+        return None
+    return _parse_pickcenter(pc)
+
+
+def _summary_completed(data: Dict) -> bool:
+    """True when an ESPN summary document describes a finished game."""
+    try:
+        comp = (data.get("header") or {}).get("competitions") or [{}]
+        return bool(comp[0].get("status", {}).get("type", {}).get("completed", False))
+    except (AttributeError, IndexError, TypeError):
+        return False
+
+
+def _roster_from_summary(data: Dict, home_abbr: str, away_abbr: str) -> Dict[str, Dict]:
+    """
+    Parse the player section of an ESPN game summary document.
+    Returns {player_name: {pts, reb, ast, pra, tier, team_abbr, available}}.
+    ESPN pre-game summaries include every expected player with season averages
+    and their game-day availability status.
+    Falls back to empty dict if the section is missing or malformed.
+    """
+    result: Dict[str, Dict] = {}
+    valid_abbrs = {home_abbr, away_abbr}
+    # Use dedicated canonical ID→abbr map (not reversed from TEAM_IDS which has
+    # duplicate values from 2-letter aliases).
+    _id_to_abbr: Dict[str, str] = _TEAM_ID_TO_ABBR
+
+    # ESPN stat name → our internal key
+    stat_name_map: Dict[str, str] = {
+        # ESPN category names (actual "name" field values)
+        "scoring":      "pts",
+        "rebounding":   "reb",
+        "assists":      "ast",
+        # Standard per-game names
+        "avgpoints":    "pts", "points":    "pts", "pointspergame":    "pts",
+        "avgrebounds":  "reb", "rebounds":  "reb", "reboundspergame":  "reb",
+        "avgassists":   "ast", "assistspergame":   "ast",
+        # Short abbreviations
+        "ppg": "pts", "rpg": "reb", "apg": "ast",
+        "pts": "pts", "reb": "reb", "ast": "ast",
+    }
+
+    def _extract_stats(athlete: Dict) -> Dict[str, float]:
+        """Walk every statistics tree shape ESPN uses."""
+        out: Dict[str, float] = {"pts": 0.0, "reb": 0.0, "ast": 0.0}
+
+        def _apply(name: str, value) -> None:
+            sname = name.lower().replace(" ", "").replace("_", "")
+            skey  = stat_name_map.get(sname)
+            if skey and value is not None:
+                try:
+                    v = float(value)
+                    # Reject season totals masquerading as per-game averages.
+                    # No player averages 55+ PPG, 28+ RPG, or 17+ APG per game.
+                    if v > _PER_GAME_MAX.get(skey, 9999.0):
+                        return
+                    # Only keep the highest VALID per-game value seen across
+                    # multiple ESPN stat shapes for the same player.
+                    if v > out.get(skey, 0.0):
+                        out[skey] = v
+                except (TypeError, ValueError):
+                    pass
+
+        stats_obj = athlete.get("statistics") or {}
+
+        # Shape A: statistics.splits.categories[].stats[]
+        splits     = stats_obj.get("splits") or {}
+        categories = splits.get("categories") or []
+        for cat in categories:
+            for s in cat.get("stats") or []:
+                _apply(s.get("name") or "", s.get("value"))
 
-        self._games_cache:      List[Dict] = []
-        self._games_ts:         float = 0.0
+        # Shape B: statistics.categories[].stats[] (no "splits" wrapper)
+        for cat in stats_obj.get("categories") or []:
+            for s in cat.get("stats") or []:
+                _apply(s.get("name") or "", s.get("value"))
 
-        self._injuries_cache:   Dict[str, List[Dict]] = {}
-        self._injuries_ts:      float = 0.0
+        # Shape C: flat statistics.stats[] list
+        for s in stats_obj.get("stats") or []:
+            _apply(s.get("name") or "", s.get("value"))
 
-        self._leaders_cache:    Dict[str, Dict] = {}
-        self._leaders_ts:       float = 0.0
+        # Shape D: athlete has top-level avgPoints / avgRebounds / avgAssists
+        for raw_name in ("avgPoints", "avgRebounds", "avgAssists", "avgPointsPerGame",
+                         "points", "rebounds", "assists", "ppg", "rpg", "apg"):
+            val = athlete.get(raw_name)
+            if val is not None:
+                _apply(raw_name, val)
 
-        # Per-team scoring stats cache: {abbr: {ppg, papg, ...}}
-        self._team_stats_cache: Dict[str, Dict] = {}
-        self._team_stats_ts:    Dict[str, float] = {}
+        return out
 
-        # Per-team roster cache: {abbr: {player_name: status_str}}
-        self._team_roster_cache: Dict[str, Dict] = {}
-        self._team_roster_ts:    Dict[str, float] = {}
+    def _idx_for(labels: List[str], candidates: List[str]) -> int:
+        """Return first matching column index from a labels list, or -1."""
+        for c in candidates:
+            try:
+                return labels.index(c)
+            except ValueError:
+                pass
+        return -1
+
+    def _stat_from_row(row: List[str], idx: int) -> float:
+        """Extract a float from a stats row at index idx.
+        Handles fractions like '7-18' (takes the first part) and plain ints/floats."""
+        if idx < 0 or idx >= len(row):
+            return 0.0
+        raw = str(row[idx]).split("-")[0].split("/")[0].strip()
+        try:
+            return float(raw)
+        except (TypeError, ValueError):
+            return 0.0
 
-        # Per-team player pool (leaders + roster stats): {abbr: {player_name: {pts,...}}}
-        self._team_player_pool_cache: Dict[str, Dict] = {}
-        self._team_player_pool_ts:    Dict[str, float] = {}
+    try:
+        # ── Primary: ESPN boxscore.players (live/completed games) ──────────
+        # Structure: boxscore.players[i].team.abbreviation
+        #            boxscore.players[i].statistics[0].labels  → column names
+        #            boxscore.players[i].statistics[0].athletes[j].athlete.displayName
+        #            boxscore.players[i].statistics[0].athletes[j].stats  → list of strings
+        boxscore   = data.get("boxscore") or {}
+        bp_entries = boxscore.get("players") or []
+        for team_block in bp_entries:
+            t_obj     = team_block.get("team") or {}
+            team_abbr = _canon_abbr(
+                (t_obj.get("abbreviation") or t_obj.get("abbrev") or "").upper()
+            )
+            if team_abbr not in valid_abbrs:
+                team_id_str = str(t_obj.get("id", ""))
+                team_abbr   = _id_to_abbr.get(team_id_str, team_abbr)
+            if team_abbr not in valid_abbrs:
+                continue
 
-        # Per-game summary roster cache: {event_id: {player_name: {pts,reb,ast,pra,team_abbr,available}}}
-        self._summary_roster_cache: Dict[str, Dict] = {}
-        self._summary_roster_ts:    Dict[str, float] = {}
+            for stats_group in team_block.get("statistics") or []:
+                raw_labels = stats_group.get("labels") or stats_group.get("names") or []
+                labels     = [str(l).upper() for l in raw_labels]
 
-        # Set of team abbrs that played yesterday (for B2B detection)
-        self._played_yesterday: Set[str] = set()
-        self._played_yesterday_ts: float = 0.0
+                pts_idx = _idx_for(labels, ["PTS", "POINTS"])
+                reb_idx = _idx_for(labels, ["REB", "REBOUNDS", "DREB"])
+                ast_idx = _idx_for(labels, ["AST", "ASSISTS"])
 
-        # Recent completed games list (shared across teams, 1-hr TTL)
-        self._recent_completed_cache: List[Dict] = []
-        self._recent_completed_ts: float = 0.0
+                for athlete_entry in stats_group.get("athletes") or []:
+                    athlete      = athlete_entry.get("athlete") or {}
+                    pname        = athlete.get("displayName") or athlete.get("fullName", "")
+                    if not pname:
+                        continue
+                    did_not_play = athlete_entry.get("didNotPlay", False)
+                    active       = athlete_entry.get("active", True)
+                    available    = active and not did_not_play
+
+                    raw_stats = athlete_entry.get("stats") or []
+                    pts = min(_stat_from_row(raw_stats, pts_idx), _PER_GAME_MAX["pts"])
+                    reb = min(_stat_from_row(raw_stats, reb_idx), _PER_GAME_MAX["reb"])
+                    ast = min(_stat_from_row(raw_stats, ast_idx), _PER_GAME_MAX["ast"])
+                    pra = pts + reb + ast
+                    tier = _player_tier(pts)
 
-        # Per-team last-5-game player averages: {abbr: {player_name: {pts,reb,ast}}}
-        self._last5_cache: Dict[str, Dict] = {}
-        self._last5_ts:    Dict[str, float] = {}
+                    if pname not in result or (pts + reb + ast) > (
+                        result[pname]["pts"] + result[pname]["reb"] + result[pname]["ast"]
+                    ):
+                        result[pname] = {
+                            "pts":       pts,
+                            "reb":       reb,
+                            "ast":       ast,
+                            "pra":       pra,
+                            "tier":      tier,
+                            "team_abbr": team_abbr,
+                            "available": available,
+                        }
 
-        # Completed game box scores (never expire — completed game stats don't change)
-        self._boxscore_cache: Dict[str, Dict] = {}
+        # ── Fallback: legacy ESPN "rosters" structure (pre-game summaries) ──
+        # Some game previews expose per-player season averages here.
+        for team_block in data.get("rosters") or []:
+            t_obj     = team_block.get("team") or {}
+            team_abbr = _canon_abbr(
+                (t_obj.get("abbreviation") or t_obj.get("abbrev") or "").upper()
+            )
+            if team_abbr not in valid_abbrs:
+                team_id_str = str(t_obj.get("id", ""))
+                team_abbr   = _id_to_abbr.get(team_id_str, team_abbr)
+            if team_abbr not in valid_abbrs:
+                continue
+
+            for entry in team_block.get("roster") or []:
+                athlete = entry.get("athlete") or {}
+                pname   = athlete.get("displayName") or athlete.get("fullName", "")
+                if not pname or pname in result:
+                    continue
+
+                did_not_play = entry.get("didNotPlay", False)
+                status_name  = (
+                    (entry.get("status") or {}).get("type", {}).get("name", "")
+                ).lower()
+                available = (
+                    not did_not_play
+                    and status_name not in ("inactive", "out", "suspended")
+                )
 
-        # Per-game DraftKings pickcenter (real game odds from ESPN): {event_id: parsed_dict}
-        self._pickcenter_cache: Dict[str, Dict] = {}
-        self._pickcenter_ts:    Dict[str, float] = {}
+                stats = _extract_stats(athlete)
+                pts, reb, ast = stats["pts"], stats["reb"], stats["ast"]
+                pra  = pts + reb + ast
+                tier = _player_tier(pts)
+
+                result[pname] = {
+                    "pts":       pts,
+                    "reb":       reb,
+                    "ast":       ast,
+                    "pra":       pra,
+                    "tier":      tier,
+                    "team_abbr": team_abbr,
+                    "available": available,
+                }
+
+    except Exception:
+        pass
 
+    return result
+
+
+def _box_score_from_summary(data: Dict) -> Optional[Dict[str, Dict]]:
+    """Parse a completed game's box score into {player_name: {pts, reb, ast, played}}.
+
+    `played` is True if the player logged any minutes.  A player who DNP'd
+    due to a late scratch will either be absent from the stat_map entirely
+    (ESPN omits them) or present with MIN == 0 / "--".  Either way the
+    `played` flag lets evaluate_bet return "no_action" so the stake is
+    refunded — matching how FanDuel / DraftKings grade late scratches.
+
+    Uses ESPN's 'labels' column headers (not 'keys') to locate columns.
+    """
+    try:
+        stat_map: Dict[str, Dict] = {}
+        for team_block in (data.get("boxscore") or {}).get("players") or []:
+            for stat_group in team_block.get("statistics") or []:
+                # ESPN sends both "labels" (display: "PTS") and "keys" (machine:
+                # "points", "fieldGoalsMade-fieldGoalsAttempted").  Always use
+                # labels for index lookup — keys contain compound strings like
+                # "fieldGoalsMade-fieldGoalsAttempted" that can't be floated.
+                raw_labels = stat_group.get("labels") or stat_group.get("names") or []
+                labels     = [str(l).upper() for l in raw_labels]
+                pts_idx    = next((i for i, l in enumerate(labels) if l == "PTS"),  -1)
+                reb_idx    = next((i for i, l in enumerate(labels) if l == "REB"),  -1)
+                ast_idx    = next((i for i, l in enumerate(labels) if l == "AST"),  -1)
+                min_idx    = next((i for i, l in enumerate(labels) if l == "MIN"),  -1)
+                threes_idx = next((i for i, l in enumerate(labels) if l == "3PM"),  -1)
+                stl_idx    = next((i for i, l in enumerate(labels) if l == "STL"),  -1)
+                blk_idx    = next((i for i, l in enumerate(labels) if l == "BLK"),  -1)
+
+                for athlete_entry in stat_group.get("athletes") or []:
+                    pname     = (athlete_entry.get("athlete") or {}).get("displayName", "")
+                    raw_stats = athlete_entry.get("stats") or []
+                    if not pname or not raw_stats:
+                        continue
+
+                    def _gs(idx: int) -> float:
+                        if idx < 0 or idx >= len(raw_stats):
+                            return 0.0
+                        try:
+                            return float(str(raw_stats[idx]).split("-")[0].split("/")[0])
+                        except (TypeError, ValueError):
+                            return 0.0
+
+                    def _parse_min(idx: int) -> float:
+                        """Return minutes played as a float (0 = DNP)."""
+                        if idx < 0 or idx >= len(raw_stats):
+                            return 0.0
+                        s = str(raw_stats[idx]).strip()
+                        if not s or s in ("--", "0", "0:00", "DNP"):
+                            return 0.0
+                        try:
+                            if ":" in s:
+                                m, sec = s.split(":", 1)
+                                return float(m) + float(sec) / 60
+                            return float(s)
+                        except (TypeError, ValueError):
+                            return 0.0
+
+                    pts     = _gs(pts_idx)
+                    reb     = _gs(reb_idx)
+                    ast     = _gs(ast_idx)
+                    threes  = _gs(threes_idx)
+                    stl     = _gs(stl_idx)
+                    blk     = _gs(blk_idx)
+                    minutes = _parse_min(min_idx)
+                    played  = minutes > 0 or (
+                        min_idx < 0 and (pts + reb + ast + threes + stl + blk) > 0
+                    )
+                    stat_map[pname] = {
+                        "pts":    pts,
+                        "reb":    reb,
+                        "ast":    ast,
+                        "threes": threes,
+                        "stl":    stl,
+                        "blk":    blk,
+                        "played": played,
+                    }
+
+        return stat_map or None
+    except Exception:
+        return None
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# Game state-change events (scoreboard diff)
+# ══════════════════════════════════════════════════════════════════════════════
+
+GAME_STARTED   = "started"
+SCORE_CHANGED  = "score_changed"
+GAME_COMPLETED = "completed"
+GAME_POSTPONED = "postponed"
+
+_POSTPONED_STATES = {"STATUS_POSTPONED", "STATUS_CANCELED", "STATUS_SUSPENDED"}
+
+
+class GameEvent:
+    """One state change for one game, published by OddsFetcher.subscribe()."""
+
+    __slots__ = ("kind", "event_id", "game", "previous")
+
+    def __init__(self, kind: str, game: Dict, previous: Optional[Dict] = None) -> None:
+        self.kind     = kind
+        self.event_id = game["event_id"]
+        self.game     = game
+        self.previous = previous   # last seen scoreboard entry (None on first sight)
+
+    def __repr__(self) -> str:
+        return f"<GameEvent {self.kind} {self.event_id}>"
+
+
+def diff_scoreboard(previous: Dict[str, Dict], games: List[Dict]) -> List[GameEvent]:
+    """Compare freshly parsed scoreboard games against the last seen state.
+
+    A game seen for the first time only produces events for the state it is
+    already in (so a restart catches up on games that finished meanwhile).
+    """
+    events: List[GameEvent] = []
+    for g in games:
+        old   = previous.get(g["event_id"])
+        state = g.get("state", "")
+        if old is None:
+            if g.get("completed"):
+                events.append(GameEvent(GAME_COMPLETED, g))
+            elif state == "STATUS_IN_PROGRESS":
+                events.append(GameEvent(GAME_STARTED, g))
+            elif state in _POSTPONED_STATES:
+                events.append(GameEvent(GAME_POSTPONED, g))
+            continue
+
+        old_state = old.get("state", "")
+        if state == "STATUS_IN_PROGRESS" and old_state != state and not old.get("completed"):
+            events.append(GameEvent(GAME_STARTED, g, old))
+        if (g.get("home_score"), g.get("away_score")) != (old.get("home_score"), old.get("away_score")):
+            events.append(GameEvent(SCORE_CHANGED, g, old))
+        if g.get("completed") and not old.get("completed"):
+            events.append(GameEvent(GAME_COMPLETED, g, old))
+        if state in _POSTPONED_STATES and old_state not in _POSTPONED_STATES:
+            events.append(GameEvent(GAME_POSTPONED, g, old))
+    return events
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# ESPN Fetcher
+# ══════════════════════════════════════════════════════════════════════════════
+
+def _coalesced(fn: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+    """Decorate an OddsFetcher getter so concurrent identical calls share one run.
+
+    The flight key is the method name plus its bound arguments (defaults
+    applied, so ``get_games()`` and ``get_games(force=False)`` coalesce).
+    Everything inside the getter — cache check, HTTP fetch, cache fill — runs
+    once; later callers await the same result.
+    """
+    sig = inspect.signature(fn)
+
+    @functools.wraps(fn)
+    async def wrapper(self: "OddsFetcher", *args: Any, **kwargs: Any) -> Any:
+        bound = sig.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        key = (fn.__name__,) + tuple(bound.arguments.items())[1:]
+        return await self._single_flight(key, lambda: fn(self, *args, **kwargs))
+
+    return wrapper
+
+
+
+class OddsFetcher:
+    def __init__(self, cache_dir: Optional[Path] = None) -> None:
+        # Pooled, rate-limited, circuit-broken HTTP client (client.py)
+        self._client = ESPNClient()
+        # Optional on-disk response store: survives reloads so startup is warm
+        # and revalidation uses conditional GETs (see _get_json)
+        self._store: Optional[ResponseStore] = (
+            ResponseStore(cache_dir) if cache_dir is not None else None
+        )
+        self.disk_hits:    int = 0   # served from disk without a request
+        self.not_modified: int = 0   # conditional GETs answered with 304
+
+        # ── Cache namespaces ──────────────────────────────────────────────────
+        # Every namespace is a bounded TTLCache: stale entries are served for
+        # `stale_ttl` seconds while _cached() refreshes them in the background,
+        # and per-event namespaces are LRU-bounded so memory stays flat over a
+        # full season.
+        # Per-date scoreboards: {"YYYYMMDD": [parsed game, ...]} — the single
+        # source for get_games, get_completed_games and back-to-back detection
+        self._scoreboards    = TTLCache("scoreboards",    GAMES_TTL,            stale_ttl=60,    max_entries=16)
+        self._injuries       = TTLCache("injuries",       INJURIES_TTL,         stale_ttl=1800,  max_entries=1)
+        self._leaders        = TTLCache("leaders",        LEADERS_TTL,          stale_ttl=21600, max_entries=1)
+        self._recent         = TTLCache("recent",         RECENT_COMPLETED_TTL, stale_ttl=3600,  max_entries=4)
+        # Per-team: {abbr: {ppg, papg, ...}} / {abbr: {player_name: status}} /
+        # {abbr: {player_name: {pts, reb, ast, ...}}}
+        self._team_stats     = TTLCache("team_stats",     TEAM_STATS_TTL,       stale_ttl=86400, max_entries=40)
+        self._team_roster    = TTLCache("team_roster",    LEADERS_TTL,          stale_ttl=21600, max_entries=40)
+        self._team_pool      = TTLCache("team_pool",      TEAM_STATS_TTL,       stale_ttl=86400, max_entries=40)
+        self._last5          = TTLCache("last5",          LAST5_TTL,            stale_ttl=21600, max_entries=40)
+        # Per-game ESPN summary documents: {event_id: raw summary JSON}.  One
+        # document serves pickcenter odds, the pre-game roster and the box
+        # score; completed games are stored without expiry (LRU-bounded by bytes).
+        self._summaries      = TTLCache("summary",        SUMMARY_TTL,          stale_ttl=300,
+                                        max_bytes=SUMMARY_CACHE_MAX_BYTES)
         # Per-game DraftKings player props (real prop lines from ESPN propBets endpoint)
-        self._props_dk_cache: Dict[str, Dict] = {}
-        self._props_dk_ts:    Dict[str, float] = {}
+        self._props_dk       = TTLCache("props_dk",       GAMES_TTL,            stale_ttl=300,   max_entries=64)
+        # Per-event guild-independent odds snapshots (see get_event_snapshot)
+        self._snapshots      = TTLCache("snapshots",      SNAPSHOT_TTL_NEAR,    stale_ttl=120,   max_entries=32)
+        self._snapshot_version = 0
+        self._scoreboard_version = 0   # bumped on every scoreboard load
+        # ESPN athlete ID → name / team / headshot, seeded from roster and
+        # leaders payloads and persisted next to the response store
+        self._athletes = AthleteRegistry(
+            cache_dir / "athletes.json" if cache_dir is not None else None
+        )
 
-        # Season-long ESPN athlete ID → display name (never expires within a session)
-        self._athlete_cache: Dict[str, str] = {}
+        # In-flight getter calls keyed by (method, args) — see _single_flight
+        self._inflight: Dict[Hashable, "asyncio.Future[Any]"] = {}
+        # Number of callers that joined an in-flight request instead of firing their own
+        self.coalesced_waiters: int = 0
+        # Background stale-while-revalidate refreshes (kept so they aren't GC'd)
+        self._revalidations: Set["asyncio.Future[Any]"] = set()
+
+        # Scoreboard diffing — last seen entry per event, and GameEvent listeners
+        self._game_states: Dict[str, Dict] = {}
+        self._subscribers: List[Callable[[GameEvent], Any]] = []
+        self._listener_tasks: Set["asyncio.Future[Any]"] = set()
+        self.subscribe(self._on_game_event)
+
+    def cache_stats(self) -> List[Dict[str, Any]]:
+        """Per-namespace cache statistics for admin reporting."""
+        return [
+            c.stats() for c in (
+                self._scoreboards, self._injuries, self._leaders,
+                self._recent, self._team_stats, self._team_roster, self._team_pool,
+                self._last5, self._summaries, self._props_dk, self._snapshots,
+                self._athletes,
+            )
+        ]
 
-    # ── Session ───────────────────────────────────────────────────────────────
+    # ── Request coalescing ────────────────────────────────────────────────────
 
-    async def _get_pickcenter(self, event_id: str) -> Optional[Dict]:
-        """Fetch real DraftKings odds from ESPN game summary's pickcenter section.
+    async def _single_flight(
+        self, key: Hashable, factory: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Run ``factory`` once per key; concurrent callers wait on the same task.
 
-        Uses a 2-minute TTL so lines stay fresh during active betting windows.
-        Returns a parsed real_odds dict (same shape as _parse_pickcenter output)
-        or None if the game hasn't had lines posted yet.
+        The shared work runs in its own task and each caller awaits it through
+        ``asyncio.shield`` so a cancelled caller (e.g. a timed-out interaction)
+        never cancels the fetch for everyone else.
         """
-        now = time.monotonic()
-        cached_ts = self._pickcenter_ts.get(event_id, 0.0)
-        if event_id in self._pickcenter_cache and now - cached_ts < GAMES_TTL:
-            return self._pickcenter_cache[event_id]
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            task.add_done_callback(functools.partial(self._flight_done, key))
+        else:
+            self.coalesced_waiters += 1
+        return await asyncio.shield(task)
+
+    def _flight_done(self, key: Hashable, task: "asyncio.Future[Any]") -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()   # mark retrieved even if every waiter was cancelled
 
-        session = await self._get_session()
+    # ── Cached loads with stale-while-revalidate ──────────────────────────────
+
+    async def _cached(
+        self,
+        cache: TTLCache,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        *,
+        force: bool = False,
+        ttl_for: Optional[Callable[[Any], Optional[float]]] = None,
+    ) -> Any:
+        """Return cache[key], loading it with ``loader`` on a miss.
+
+        - fresh hit  → returned immediately
+        - stale hit  → returned immediately; a background refresh is scheduled
+        - miss/force → ``loader`` is awaited (single-flight per key)
+
+        ``loader`` returns the value to store, or None on failure — in which case
+        the previous (possibly expired) value is returned instead.  ``ttl_for``
+        may pick a per-entry TTL from the loaded value (None = never expires).
+        """
+        if not force:
+            entry = cache.get_entry(key)
+            if entry is not None:
+                value, fresh = entry
+                if not fresh:
+                    task = asyncio.ensure_future(self._reload(cache, key, loader, ttl_for))
+                    self._revalidations.add(task)
+                    task.add_done_callback(self._revalidation_done)
+                return value
+        return await self._reload(cache, key, loader, ttl_for)
+
+    async def _reload(
+        self,
+        cache: TTLCache,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        ttl_for: Optional[Callable[[Any], Optional[float]]],
+    ) -> Any:
+        async def _run() -> Any:
+            value = await loader()
+            if value is None:
+                return cache.peek(key)
+            if ttl_for is not None:
+                cache.set(key, value, ttl=ttl_for(value))
+            else:
+                cache.set(key, value)
+            return value
+
+        return await self._single_flight(("reload", cache.name, key), _run)
+
+    def _revalidation_done(self, task: "asyncio.Future[Any]") -> None:
+        self._revalidations.discard(task)
+        if not task.cancelled():
+            task.exception()
+
+    # ── Game state-change events ─────────────────────────────────────────────
+
+    def subscribe(self, callback: Callable[[GameEvent], Any]) -> Callable[[], None]:
+        """Call ``callback(event)`` for every GameEvent; returns an unsubscribe function.
+
+        Callbacks may be plain functions or coroutine functions (run as tasks).
+        Events are produced whenever a scoreboard date is (re)loaded.
+        """
+        self._subscribers.append(callback)
+
+        def _unsubscribe() -> None:
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+
+        return _unsubscribe
+
+    @property
+    def scoreboard_version(self) -> int:
+        """Changes whenever any scoreboard is (re)loaded — a cache key for rendered views."""
+        return self._scoreboard_version
+
+    def _publish_scoreboard(self, games: List[Dict]) -> None:
+        self._scoreboard_version += 1
+        events = diff_scoreboard(self._game_states, games)
+        for g in games:
+            self._game_states.pop(g["event_id"], None)
+            self._game_states[g["event_id"]] = g
+        # Bounded: forget the oldest-seen games beyond two weeks of slates
+        while len(self._game_states) > 256:
+            self._game_states.pop(next(iter(self._game_states)))
+
+        for event in events:
+            for callback in list(self._subscribers):
+                try:
+                    result = callback(event)
+                except Exception:
+                    continue
+                if inspect.isawaitable(result):
+                    task = asyncio.ensure_future(result)
+                    self._listener_tasks.add(task)
+                    task.add_done_callback(self._listener_done)
+
+    def _listener_done(self, task: "asyncio.Future[Any]") -> None:
+        self._listener_tasks.discard(task)
+        if not task.cancelled():
+            task.exception()
+
+    def _on_game_event(self, event: GameEvent) -> None:
+        # Tip-off, final and postponement all change what an event's odds
+        # snapshot should show — drop it so the next read rebuilds.
+        if event.kind != SCORE_CHANGED:
+            self._snapshots.invalidate(event.event_id)
+
+    # ── Game summary document (shared by odds, roster and box score) ─────────
+
+    @_coalesced
+    async def _get_summary(self, event_id: str, final: bool = False) -> Optional[Dict]:
+        """Fetch the raw ESPN game summary document for an event.
+
+        Shared by every summary consumer (pickcenter odds, pre-game roster,
+        box score).  Cached for SUMMARY_TTL while the game is scheduled or
+        live; once ESPN reports the game completed the document is stored
+        without expiry.  ``final=True`` refuses a cached live document so
+        box-score grading never reads a stale in-progress copy.
+        """
+        force = False
+        if final:
+            cached = self._summaries.peek(event_id)
+            force  = cached is not None and not _summary_completed(cached)
+        return await self._cached(
+            self._summaries, event_id,
+            lambda: self._load_summary(event_id, max_age=0 if final else SUMMARY_TTL),
+            force=force,
+            ttl_for=lambda d: None if _summary_completed(d) else SUMMARY_TTL,
+        )
+
+    async def _load_summary(self, event_id: str, max_age: float = SUMMARY_TTL) -> Optional[Dict]:
         try:
-            async with session.get(
+            data = await self._get_json(
                 ESPN_SUMMARY,
-                params={"event": event_id},
-                timeout=aiohttp.ClientTimeout(total=10),
-            ) as resp:
-                if resp.status != 200:
-                    return None
-                data = await resp.json(content_type=None)
-
-            pc_list = data.get("pickcenter") or []
-            if not pc_list:
-                return None
-
-            # Prefer DraftKings provider; fall back to first available
-            pc: Optional[Dict] = None
-            for p in pc_list:
-                pname = (p.get("provider", {}).get("name") or "").lower()
-                if "draft" in pname or pc is None:
-                    pc = p
-                    if "draft" in pname:
-                        break
+                {"event": event_id},
+                timeout=12,
+                max_age=max_age,
+                immutable=_summary_completed,
+            )
+        except Exception:
+            return None
+        return data if isinstance(data, dict) else None
 
-            if not pc:
-                return None
+    async def _get_pickcenter(self, event_id: str) -> Optional[Dict]:
+        """Real DraftKings odds from the event's summary pickcenter section.
 
-            result = _parse_pickcenter(pc)
-            if result:
-                self._pickcenter_cache[event_id] = result
-                self._pickcenter_ts[event_id]    = now
-            return result
+        Returns a parsed real_odds dict (same shape as _parse_pickcenter output)
+        or None if the game hasn't had lines posted yet.
+        """
+        data = await self._get_summary(event_id)
+        if not data:
+            return None
+        try:
+            return _pickcenter_from_summary(data)
         except Exception:
             return None
 
+    # ── DraftKings player props ───────────────────────────────────────────────
+
+    @_coalesced
     async def _get_player_props_dk(self, event_id: str) -> Optional[Dict[str, Dict]]:
         """Fetch real DraftKings player prop lines from ESPN's propBets endpoint.
 
@@ -1152,24 +1790,20 @@ class OddsFetcher:
         team_abbr, tier, and status are injected by get_game_with_odds using the
         roster and injury data already fetched in that call.
         """
-        now = time.monotonic()
-        if (
-            event_id in self._props_dk_cache
-            and now - self._props_dk_ts.get(event_id, 0.0) < GAMES_TTL
-        ):
-            return self._props_dk_cache[event_id]
-
-        session = await self._get_session()
+        return await self._cached(
+            self._props_dk, event_id, lambda: self._load_player_props_dk(event_id)
+        )
+
+    async def _load_player_props_dk(self, event_id: str) -> Optional[Dict[str, Dict]]:
         try:
-            url = ESPN_PROPS_BASE.format(eid=event_id)
-            async with session.get(
-                url,
-                params={"lang": "en", "region": "us", "limit": 600},
-                timeout=aiohttp.ClientTimeout(total=15),
-            ) as resp:
-                if resp.status != 200:
-                    return None
-                data = await resp.json(content_type=None)
+            data = await self._get_json(
+                ESPN_PROPS_BASE.format(eid=event_id),
+                {"lang": "en", "region": "us", "limit": 600},
+                timeout=15,
+                max_age=GAMES_TTL,
+            )
+            if not data:
+                return None
 
             items: List[Dict] = data.get("items") or []
             if not items:
@@ -1185,40 +1819,23 @@ class OddsFetcher:
                     if aid not in athlete_refs:
                         athlete_refs[aid] = ref.split("?")[0]
 
-            # ── Resolve uncached athlete IDs → display names in parallel ──────
-            uncached = [aid for aid in athlete_refs if aid not in self._athlete_cache]
-            if uncached:
-                async def _fetch_name(aid: str, ref_url: str) -> None:
-                    try:
-                        async with session.get(
-                            ref_url,
-                            params={"lang": "en", "region": "us"},
-                            timeout=aiohttp.ClientTimeout(total=8),
-                        ) as r:
-                            if r.status == 200:
-                                ad = await r.json(content_type=None)
-                                name = (
-                                    ad.get("displayName")
-                                    or ad.get("fullName")
-                                    or ad.get("shortName")
-                                    or ""
-                                )
-                                if name:
-                                    self._athlete_cache[aid] = name
-                    except Exception:
-                        pass
-
-                await asyncio.gather(
-                    *[_fetch_name(a, athlete_refs[a]) for a in uncached]
-                )
+            # ── Resolve athlete IDs the registry doesn't know yet ─────────────
+            # Rosters and leaders seed the registry, so this is usually empty.
+            await self._athletes.resolve(
+                athlete_refs,
+                lambda ref_url: self._get_json(
+                    ref_url, {"lang": "en", "region": "us"}, timeout=8, persist=False
+                ),
+            )
 
             # ── Build name → ESPN athlete ID map (for headshot URLs) ─────────
             # Only include athletes that actually appear in this event's prop items.
-            name_to_aid: Dict[str, str] = {
-                self._athlete_cache[aid]: aid
-                for aid in athlete_refs
-                if aid in self._athlete_cache
-            }
+            aid_to_name: Dict[str, str] = {}
+            for aid in athlete_refs:
+                name = self._athletes.name(aid)
+                if name:
+                    aid_to_name[aid] = name
+            name_to_aid: Dict[str, str] = {name: aid for aid, name in aid_to_name.items()}
 
             # ── Group items by (player_name, stat_key) ────────────────────────
             # ESPN returns items in order: for each (athlete, type) pair there are
@@ -1229,7 +1846,7 @@ class OddsFetcher:
                 m = _AID_RE.search(ref)
                 if not m:
                     continue
-                name = self._athlete_cache.get(m.group(1))
+                name = aid_to_name.get(m.group(1))
                 if not name:
                     continue
                 type_name = (item.get("type") or {}).get("name", "")
@@ -1271,57 +1888,114 @@ class OddsFetcher:
                     entry[f"{stat_key}_under"] = _parse_dk_odds(under_item)
 
                 if any(k in entry for k in _PROP_TYPE_MAP.values()):
-                    # Store ESPN athlete ID so callers can build headshot URLs:
-                    # https://a.espncdn.com/i/headshots/nba/players/full/{athlete_id}.png
-                    entry["athlete_id"] = name_to_aid.get(player_name, "")
+                    # ESPN athlete + headshot IDs; views build the image URL
+                    # with athletes.headshot_url()
+                    aid = name_to_aid.get(player_name, "")
+                    entry["athlete_id"]  = aid
+                    entry["headshot_id"] = self._athletes.headshot_id(aid) if aid else ""
                     props[player_name] = entry
 
-            if props:
-                self._props_dk_cache[event_id] = props
-                self._props_dk_ts[event_id]    = now
             return props or None
         except Exception:
             return None
 
-    async def _get_session(self) -> aiohttp.ClientSession:
-        if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
-        return self._session
+    # ── HTTP ──────────────────────────────────────────────────────────────────
 
     async def close(self) -> None:
-        if self._session and not self._session.closed:
-            await self._session.close()
+        await self._athletes.close()
+        await self._client.close()
+
+    def client_stats(self) -> Dict[str, Any]:
+        return self._client.stats()
+
+    async def _get_json(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        *,
+        timeout: float = 10,
+        max_age: float = 0,
+        immutable: Union[bool, Callable[[Any], bool]] = False,
+        persist: bool = True,
+    ) -> Any:
+        """GET an ESPN endpoint and return the decoded JSON, or None on non-200.
+
+        With a response store configured:
+          - immutable stored responses, and mutable ones younger than
+            ``max_age`` seconds, are returned without touching the network;
+          - anything older is revalidated with If-None-Match /
+            If-Modified-Since, and a 304 reuses the stored body;
+          - if the request fails outright, the stored body is served instead.
+        ``immutable`` may be a predicate on the decoded body (e.g. "game is
+        final") deciding whether the response is kept forever.  ``persist=False``
+        skips the store for responses kept elsewhere (e.g. athlete records).
+
+        Network errors — including an open circuit breaker, which fails fast
+        instead of waiting on a timeout — propagate when there is nothing
+        stored to fall back on.
+        """
+        store  = self._store if persist else None
+        stored = await store.load(url, params) if store else None
+        if stored is not None and (stored.immutable or stored.age < max_age):
+            self.disk_hits += 1
+            return stored.data
+
+        headers = stored.conditional_headers() if stored is not None else {}
+        try:
+            status, data, resp_headers = await self._client.get_json(
+                url, params, headers or None, timeout
+            )
+        except Exception:
+            if stored is not None:
+                return stored.data
+            raise
+        if status == 304 and stored is not None:
+            self.not_modified += 1
+            await store.touch(url, params)
+            return stored.data
+        if status != 200:
+            # ESPN is failing for this URL even after retries — prefer old data
+            return stored.data if stored is not None and status in RETRY_STATUSES else None
+        etag          = resp_headers.get("ETag")
+        last_modified = resp_headers.get("Last-Modified")
+
+        if store is not None and data is not None:
+            keep = immutable(data) if callable(immutable) else immutable
+            await store.save(
+                url, params, data,
+                etag=etag, last_modified=last_modified, immutable=bool(keep),
+            )
+        return data
 
     # ── Team stats ────────────────────────────────────────────────────────────
 
+    @_coalesced
     async def get_team_stats(self, abbr: str) -> Dict:
         """
         Fetch season averages for a team from ESPN.
         Returns {ppg, papg, off_rtg, def_rtg, is_back_to_back}.
         Falls back to empty dict on failure — caller uses win-pct path.
         """
-        now = time.monotonic()
-        if (
-            abbr in self._team_stats_cache
-            and now - self._team_stats_ts.get(abbr, 0) < TEAM_STATS_TTL
-        ):
-            ts = self._team_stats_cache[abbr]
-            # B2B is time-sensitive — refresh regardless of TTL
-            ts["is_back_to_back"] = abbr in await self._get_played_yesterday()
-            return ts
-
-        team_id = TEAM_IDS.get(abbr)
-        if not team_id:
+        if not TEAM_IDS.get(abbr):
             return {}
+        stats = await self._cached(
+            self._team_stats, abbr, lambda: self._load_team_stats(abbr)
+        )
+        if stats is None:
+            return {}
+        # B2B is time-sensitive — refresh regardless of TTL
+        stats["is_back_to_back"] = abbr in await self._get_played_yesterday()
+        return stats
 
-        session = await self._get_session()
+    async def _load_team_stats(self, abbr: str) -> Optional[Dict]:
+        team_id = TEAM_IDS[abbr]
         stats: Dict = {}
         try:
-            url = ESPN_TEAM_STATS.format(team_id=team_id)
-            async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
-                if resp.status != 200:
-                    return {}
-                data = await resp.json(content_type=None)
+            data = await self._get_json(
+                ESPN_TEAM_STATS.format(team_id=team_id), max_age=TEAM_STATS_TTL
+            )
+            if data is None:
+                return None
 
             # Try multiple response shapes ESPN uses
             raw: List[Dict] = []
@@ -1373,47 +2047,24 @@ class OddsFetcher:
         except Exception:
             pass
 
-        stats["is_back_to_back"] = abbr in await self._get_played_yesterday()
-        self._team_stats_cache[abbr] = stats
-        self._team_stats_ts[abbr]    = now
         return stats
 
     # ── Back-to-back detection ────────────────────────────────────────────────
 
     async def _get_played_yesterday(self) -> Set[str]:
         """Return set of team abbrs that had a game yesterday."""
-        now = time.monotonic()
-        if self._played_yesterday and now - self._played_yesterday_ts < YESTERDAY_TTL:
-            return self._played_yesterday
-
         yesterday = (
             datetime.now(timezone.utc) - timedelta(days=1)
         ).strftime("%Y%m%d")
-        session = await self._get_session()
         played: Set[str] = set()
-
-        try:
-            async with session.get(
-                ESPN_SCOREBOARD,
-                params={"dates": yesterday, "limit": 20},
-                timeout=aiohttp.ClientTimeout(total=10),
-            ) as resp:
-                if resp.status == 200:
-                    data = await resp.json(content_type=None)
-                    for event in data.get("events", []):
-                        g = _parse_espn_event(event)
-                        if g:
-                            played.add(g["home_abbr"])
-                            played.add(g["away_abbr"])
-        except Exception:
-            pass
-
-        self._played_yesterday    = played
-        self._played_yesterday_ts = now
+        for g in await self.get_scoreboard(yesterday):
+            played.add(g["home_abbr"])
+            played.add(g["away_abbr"])
         return played
 
     # ── Per-team roster (availability) ───────────────────────────────────────
 
+    @_coalesced
     async def get_team_roster(self, abbr: str) -> Dict[str, str]:
         """
         Fetch the full active roster for a team from ESPN.
@@ -1421,26 +2072,23 @@ class OddsFetcher:
         "questionable", "doubtful", "day-to-day", "inactive".
         Used to know every player on the team and filter unavailable ones.
         """
-        now = time.monotonic()
-        if (
-            abbr in self._team_roster_cache
-            and now - self._team_roster_ts.get(abbr, 0) < LEADERS_TTL
-        ):
-            return self._team_roster_cache[abbr]
-
-        team_id = TEAM_IDS.get(abbr)
-        if not team_id:
+        if not TEAM_IDS.get(abbr):
             return {}
+        roster = await self._cached(
+            self._team_roster, abbr, lambda: self._load_team_roster(abbr)
+        )
+        return roster or {}
 
-        session  = await self._get_session()
+    async def _load_team_roster(self, abbr: str) -> Optional[Dict[str, str]]:
+        team_id  = TEAM_IDS[abbr]
         result: Dict[str, str] = {}
 
         try:
-            url = ESPN_TEAM_ROSTER.format(team_id=team_id)
-            async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
-                if resp.status != 200:
-                    return {}
-                data = await resp.json(content_type=None)
+            data = await self._get_json(
+                ESPN_TEAM_ROSTER.format(team_id=team_id), max_age=LEADERS_TTL
+            )
+            if data is None:
+                return None
 
             # ESPN roster: top-level "athletes" can be:
             #   (a) flat list of athlete dicts, OR
@@ -1451,6 +2099,7 @@ class OddsFetcher:
                     raw_athletes.extend(item["items"])
                 elif "displayName" in item or "fullName" in item:
                     raw_athletes.append(item)
+            self._athletes.seed_many(raw_athletes, team=abbr)
 
             for athlete in raw_athletes:
                 pname = athlete.get("displayName") or athlete.get("fullName", "")
@@ -1485,238 +2134,26 @@ class OddsFetcher:
         except Exception:
             pass
 
-        if result:
-            self._team_roster_cache[abbr] = result
-            self._team_roster_ts[abbr]    = now
-        return result
+        return result or None
 
     # ── Per-game summary roster (player stats from ESPN pre-game data) ─────────
 
-    async def _parse_summary_roster(
+    async def _get_summary_roster(
         self, event_id: str, home_abbr: str, away_abbr: str
     ) -> Dict[str, Dict]:
         """
-        Parse the ESPN game summary's 'rosters' section.
+        Per-game player pool parsed from the event's shared summary document.
         Returns {player_name: {pts, reb, ast, pra, tier, team_abbr, available}}.
-        ESPN pre-game summaries include every expected player with season averages
-        and their game-day availability status.
-        Falls back to empty dict if the section is missing or the call fails.
+        Falls back to empty dict if the section is missing or the fetch fails.
         """
-        now = time.monotonic()
-        if (
-            event_id in self._summary_roster_cache
-            and now - self._summary_roster_ts.get(event_id, 0) < LEADERS_TTL
-        ):
-            return self._summary_roster_cache[event_id]
-
-        session = await self._get_session()
-        result: Dict[str, Dict] = {}
-        valid_abbrs = {home_abbr, away_abbr}
-        # Use dedicated canonical ID→abbr map (not reversed from TEAM_IDS which has
-        # duplicate values from 2-letter aliases).
-        _id_to_abbr: Dict[str, str] = _TEAM_ID_TO_ABBR
-
-        # ESPN stat name → our internal key
-        stat_name_map: Dict[str, str] = {
-            # ESPN category names (actual "name" field values)
-            "scoring":      "pts",
-            "rebounding":   "reb",
-            "assists":      "ast",
-            # Standard per-game names
-            "avgpoints":    "pts", "points":    "pts", "pointspergame":    "pts",
-            "avgrebounds":  "reb", "rebounds":  "reb", "reboundspergame":  "reb",
-            "avgassists":   "ast", "assistspergame":   "ast",
-            # Short abbreviations
-            "ppg": "pts", "rpg": "reb", "apg": "ast",
-            "pts": "pts", "reb": "reb", "ast": "ast",
-        }
-
-        def _extract_stats(athlete: Dict) -> Dict[str, float]:
-            """Walk every statistics tree shape ESPN uses."""
-            out: Dict[str, float] = {"pts": 0.0, "reb": 0.0, "ast": 0.0}
-
-            def _apply(name: str, value) -> None:
-                sname = name.lower().replace(" ", "").replace("_", "")
-                skey  = stat_name_map.get(sname)
-                if skey and value is not None:
-                    try:
-                        v = float(value)
-                        # Reject season totals masquerading as per-game averages.
-                        # No player averages 55+ PPG, 28+ RPG, or 17+ APG per game.
-                        if v > _PER_GAME_MAX.get(skey, 9999.0):
-                            return
-                        # Only keep the highest VALID per-game value seen across
-                        # multiple ESPN stat shapes for the same player.
-                        if v > out.get(skey, 0.0):
-                            out[skey] = v
-                    except (TypeError, ValueError):
-                        pass
-
-            stats_obj = athlete.get("statistics") or {}
-
-            # Shape A: statistics.splits.categories[].stats[]
-            splits     = stats_obj.get("splits") or {}
-            categories = splits.get("categories") or []
-            for cat in categories:
-                for s in cat.get("stats") or []:
-                    _apply(s.get("name") or "", s.get("value"))
-
-            # Shape B: statistics.categories[].stats[] (no "splits" wrapper)
-            for cat in stats_obj.get("categories") or []:
-                for s in cat.get("stats") or []:
-                    _apply(s.get("name") or "", s.get("value"))
-
-            # Shape C: flat statistics.stats[] list
-            for s in stats_obj.get("stats") or []:
-                _apply(s.get("name") or "", s.get("value"))
-
-            # Shape D: athlete has top-level avgPoints / avgRebounds / avgAssists
-            for raw_name in ("avgPoints", "avgRebounds", "avgAssists", "avgPointsPerGame",
-                             "points", "rebounds", "assists", "ppg", "rpg", "apg"):
-                val = athlete.get(raw_name)
-                if val is not None:
-                    _apply(raw_name, val)
-
-            return out
-
-        def _idx_for(labels: List[str], candidates: List[str]) -> int:
-            """Return first matching column index from a labels list, or -1."""
-            for c in candidates:
-                try:
-                    return labels.index(c)
-                except ValueError:
-                    pass
-            return -1
-
-        def _stat_from_row(row: List[str], idx: int) -> float:
-            """Extract a float from a stats row at index idx.
-            Handles fractions like '7-18' (takes the first part) and plain ints/floats."""
-            if idx < 0 or idx >= len(row):
-                return 0.0
-            raw = str(row[idx]).split("-")[0].split("/")[0].strip()
-            try:
-                return float(raw)
-            except (TypeError, ValueError):
-                return 0.0
-
-        try:
-            async with session.get(
-                ESPN_SUMMARY,
-                params={"event": event_id},
-                timeout=aiohttp.ClientTimeout(total=12),
-            ) as resp:
-                if resp.status != 200:
-                    return {}
-                data = await resp.json(content_type=None)
-
-            # ── Primary: ESPN boxscore.players (live/completed games) ──────────
-            # Structure: boxscore.players[i].team.abbreviation
-            #            boxscore.players[i].statistics[0].labels  → column names
-            #            boxscore.players[i].statistics[0].athletes[j].athlete.displayName
-            #            boxscore.players[i].statistics[0].athletes[j].stats  → list of strings
-            boxscore   = data.get("boxscore") or {}
-            bp_entries = boxscore.get("players") or []
-            for team_block in bp_entries:
-                t_obj     = team_block.get("team") or {}
-                team_abbr = _canon_abbr(
-                    (t_obj.get("abbreviation") or t_obj.get("abbrev") or "").upper()
-                )
-                if team_abbr not in valid_abbrs:
-                    team_id_str = str(t_obj.get("id", ""))
-                    team_abbr   = _id_to_abbr.get(team_id_str, team_abbr)
-                if team_abbr not in valid_abbrs:
-                    continue
-
-                for stats_group in team_block.get("statistics") or []:
-                    raw_labels = stats_group.get("labels") or stats_group.get("names") or []
-                    labels     = [str(l).upper() for l in raw_labels]
-
-                    pts_idx = _idx_for(labels, ["PTS", "POINTS"])
-                    reb_idx = _idx_for(labels, ["REB", "REBOUNDS", "DREB"])
-                    ast_idx = _idx_for(labels, ["AST", "ASSISTS"])
-
-                    for athlete_entry in stats_group.get("athletes") or []:
-                        athlete      = athlete_entry.get("athlete") or {}
-                        pname        = athlete.get("displayName") or athlete.get("fullName", "")
-                        if not pname:
-                            continue
-                        did_not_play = athlete_entry.get("didNotPlay", False)
-                        active       = athlete_entry.get("active", True)
-                        available    = active and not did_not_play
-
-                        raw_stats = athlete_entry.get("stats") or []
-                        pts = min(_stat_from_row(raw_stats, pts_idx), _PER_GAME_MAX["pts"])
-                        reb = min(_stat_from_row(raw_stats, reb_idx), _PER_GAME_MAX["reb"])
-                        ast = min(_stat_from_row(raw_stats, ast_idx), _PER_GAME_MAX["ast"])
-                        pra = pts + reb + ast
-                        tier = _player_tier(pts)
-
-                        if pname not in result or (pts + reb + ast) > (
-                            result[pname]["pts"] + result[pname]["reb"] + result[pname]["ast"]
-                        ):
-                            result[pname] = {
-                                "pts":       pts,
-                                "reb":       reb,
-                                "ast":       ast,
-                                "pra":       pra,
-                                "tier":      tier,
-                                "team_abbr": team_abbr,
-                                "available": available,
-                            }
-
-            # ── Fallback: legacy ESPN "rosters" structure (pre-game summaries) ──
-            # Some game previews expose per-player season averages here.
-            for team_block in data.get("rosters") or []:
-                t_obj     = team_block.get("team") or {}
-                team_abbr = _canon_abbr(
-                    (t_obj.get("abbreviation") or t_obj.get("abbrev") or "").upper()
-                )
-                if team_abbr not in valid_abbrs:
-                    team_id_str = str(t_obj.get("id", ""))
-                    team_abbr   = _id_to_abbr.get(team_id_str, team_abbr)
-                if team_abbr not in valid_abbrs:
-                    continue
-
-                for entry in team_block.get("roster") or []:
-                    athlete = entry.get("athlete") or {}
-                    pname   = athlete.get("displayName") or athlete.get("fullName", "")
-                    if not pname or pname in result:
-                        continue
-
-                    did_not_play = entry.get("didNotPlay", False)
-                    status_name  = (
-                        (entry.get("status") or {}).get("type", {}).get("name", "")
-                    ).lower()
-                    available = (
-                        not did_not_play
-                        and status_name not in ("inactive", "out", "suspended")
-                    )
-
-                    stats = _extract_stats(athlete)
-                    pts, reb, ast = stats["pts"], stats["reb"], stats["ast"]
-                    pra  = pts + reb + ast
-                    tier = _player_tier(pts)
-
-                    result[pname] = {
-                        "pts":       pts,
-                        "reb":       reb,
-                        "ast":       ast,
-                        "pra":       pra,
-                        "tier":      tier,
-                        "team_abbr": team_abbr,
-                        "available": available,
-                    }
-
-        except Exception:
-            pass
-
-        if result:
-            self._summary_roster_cache[event_id] = result
-            self._summary_roster_ts[event_id]    = now
-        return result
+        data = await self._get_summary(event_id)
+        if not data:
+            return {}
+        return _roster_from_summary(data, home_abbr, away_abbr)
 
     # ── Per-team player pool (leaders + roster) ───────────────────────────────
 
+    @_coalesced
     async def get_team_player_pool(self, abbr: str) -> Dict[str, Dict]:
         """
         Return {player_name: {pts, reb, ast, pra, tier, team_abbr}} for every
@@ -1729,18 +2166,15 @@ class OddsFetcher:
 
         Cached per team for 6 hours (same TTL as team stats).
         """
-        now = time.monotonic()
-        if (
-            abbr in self._team_player_pool_cache
-            and now - self._team_player_pool_ts.get(abbr, 0) < TEAM_STATS_TTL
-        ):
-            return self._team_player_pool_cache[abbr]
-
-        team_id = TEAM_IDS.get(abbr)
-        if not team_id:
+        if not TEAM_IDS.get(abbr):
             return {}
+        pool = await self._cached(
+            self._team_pool, abbr, lambda: self._load_team_player_pool(abbr)
+        )
+        return pool or {}
 
-        session = await self._get_session()
+    async def _load_team_player_pool(self, abbr: str) -> Optional[Dict[str, Dict]]:
+        team_id = TEAM_IDS[abbr]
 
         _stat_key_map: Dict[str, str] = {
             # ESPN team leaders category names (what the "name" field actually returns)
@@ -1777,54 +2211,50 @@ class OddsFetcher:
 
         # ── Source 1: team leaders (top scorers/rebounders/assisters for this team) ──
         try:
-            url = ESPN_TEAM_LEADERS.format(team_id=team_id)
-            async with session.get(
-                url,
-                params={"limit": 50},
-                timeout=aiohttp.ClientTimeout(total=10),
-            ) as resp:
-                if resp.status == 200:
-                    data = await resp.json(content_type=None)
-                    # ESPN wraps leaders under "leaders" or "categories"
-                    leaders_data = data.get("leaders") or data.get("categories") or []
-                    for cat in leaders_data:
-                        stat_key = _resolve_cat(cat)
-                        if not stat_key:
-                            continue
-                        # Entries can be under "leaders" or "athletes"
-                        entries = cat.get("leaders") or cat.get("athletes") or []
-                        for entry in entries:
-                            # Athlete nested under "athlete" key OR entry is the athlete
-                            athlete = entry.get("athlete") or entry
-                            pname   = (
-                                athlete.get("displayName")
-                                or athlete.get("fullName")
-                                or entry.get("displayName")
-                                or entry.get("fullName", "")
-                            )
-                            if not pname:
-                                continue
-                            val_raw = (
-                                entry.get("value")
-                                or entry.get("average")
-                                or entry.get("perGameValue")
-                            )
-                            try:
-                                _update(pname, stat_key, float(val_raw or 0))
-                            except (TypeError, ValueError):
-                                pass
+            data = await self._get_json(
+                ESPN_TEAM_LEADERS.format(team_id=team_id),
+                {"limit": 50},
+                max_age=TEAM_STATS_TTL,
+            ) or {}
+            # ESPN wraps leaders under "leaders" or "categories"
+            leaders_data = data.get("leaders") or data.get("categories") or []
+            for cat in leaders_data:
+                stat_key = _resolve_cat(cat)
+                if not stat_key:
+                    continue
+                # Entries can be under "leaders" or "athletes"
+                entries = cat.get("leaders") or cat.get("athletes") or []
+                for entry in entries:
+                    # Athlete nested under "athlete" key OR entry is the athlete
+                    athlete = entry.get("athlete") or entry
+                    pname   = (
+                        athlete.get("displayName")
+                        or athlete.get("fullName")
+                        or entry.get("displayName")
+                        or entry.get("fullName", "")
+                    )
+                    if not pname:
+                        continue
+                    self._athletes.seed(athlete, team=abbr)
+                    val_raw = (
+                        entry.get("value")
+                        or entry.get("average")
+                        or entry.get("perGameValue")
+                    )
+                    try:
+                        _update(pname, stat_key, float(val_raw or 0))
+                    except (TypeError, ValueError):
+                        pass
         except Exception:
             pass
 
         # ── Source 2: team roster (full list; request stats alongside the roster) ──
         try:
-            url = ESPN_TEAM_ROSTER.format(team_id=team_id)
-            async with session.get(
-                url,
-                params={"enable": "stats", "seasontype": "2"},
-                timeout=aiohttp.ClientTimeout(total=10),
-            ) as resp:
-                data = await resp.json(content_type=None) if resp.status == 200 else {}
+            data = await self._get_json(
+                ESPN_TEAM_ROSTER.format(team_id=team_id),
+                {"enable": "stats", "seasontype": "2"},
+                max_age=TEAM_STATS_TTL,
+            ) or {}
 
             raw_athletes: List[Dict] = []
             for item in data.get("athletes", []):
@@ -1832,6 +2262,7 @@ class OddsFetcher:
                     raw_athletes.extend(item["items"])
                 elif "displayName" in item or "fullName" in item:
                     raw_athletes.append(item)
+            self._athletes.seed_many(raw_athletes, team=abbr)
 
             for athlete in raw_athletes:
                 pname = athlete.get("displayName") or athlete.get("fullName", "")
@@ -1878,23 +2309,24 @@ class OddsFetcher:
             d["tier"] = _player_tier(d["pts"])
             result[pname] = d
 
-        if result:
-            self._team_player_pool_cache[abbr] = result
-            self._team_player_pool_ts[abbr]    = now
-        return result
+        return result or None
 
     # ── Season stat leaders ───────────────────────────────────────────────────
 
+    @_coalesced
     async def get_stat_leaders(self, force: bool = False) -> Dict[str, Dict]:
         """
         Fetch season stat leaders from ESPN with a high limit (500).
         Tries multiple paths to extract team abbreviation from each athlete entry.
         """
-        now = time.monotonic()
-        if not force and self._leaders_cache and now - self._leaders_ts < LEADERS_TTL:
-            return self._leaders_cache
+        leaders = await self._cached(
+            self._leaders, "all",
+            lambda: self._load_stat_leaders(max_age=0 if force else LEADERS_TTL),
+            force=force,
+        )
+        return leaders or {}
 
-        session = await self._get_session()
+    async def _load_stat_leaders(self, max_age: float = LEADERS_TTL) -> Optional[Dict[str, Dict]]:
         merged: Dict[str, Dict] = {}
 
         # ESPN uses different category names depending on endpoint version
@@ -1938,14 +2370,11 @@ class OddsFetcher:
             return ""
 
         try:
-            async with session.get(
-                ESPN_LEADERS,
-                params={"limit": 500},
-                timeout=aiohttp.ClientTimeout(total=15),
-            ) as resp:
-                if resp.status != 200:
-                    return self._leaders_cache
-                data = await resp.json(content_type=None)
+            data = await self._get_json(
+                ESPN_LEADERS, {"limit": 500}, timeout=15, max_age=max_age
+            )
+            if data is None:
+                return None
 
             # ESPN wraps the list under "leaders" or "categories"
             categories_list = data.get("leaders") or data.get("categories") or []
@@ -1977,6 +2406,7 @@ class OddsFetcher:
                             continue
                         team_abbr = _abbr_from_athlete(athlete)
                         value     = float(entry.get("value", 0))
+                        self._athletes.seed(athlete, team=team_abbr)
                     except (KeyError, TypeError, ValueError):
                         continue
                     if pname not in merged:
@@ -1993,33 +2423,29 @@ class OddsFetcher:
                 d["tier"] = _player_tier(d["pts"])
                 leaders[pname] = d
 
-            if leaders:
-                self._leaders_cache = leaders
-                self._leaders_ts    = now
+            return leaders or None
 
         except Exception:
-            pass
-
-        return self._leaders_cache
+            return None
 
     # ── Injury report ─────────────────────────────────────────────────────────
 
+    @_coalesced
     async def get_injuries(self, force: bool = False) -> Dict[str, List[Dict]]:
-        now = time.monotonic()
-        if not force and self._injuries_cache and now - self._injuries_ts < INJURIES_TTL:
-            return self._injuries_cache
+        injuries = await self._cached(
+            self._injuries, "all",
+            lambda: self._load_injuries(max_age=0 if force else INJURIES_TTL),
+            force=force,
+        )
+        return injuries or {}
 
-        session = await self._get_session()
+    async def _load_injuries(self, max_age: float = INJURIES_TTL) -> Optional[Dict[str, List[Dict]]]:
         result: Dict[str, List[Dict]] = {}
 
         try:
-            async with session.get(
-                ESPN_INJURIES,
-                timeout=aiohttp.ClientTimeout(total=10),
-            ) as resp:
-                if resp.status != 200:
-                    return self._injuries_cache
-                data = await resp.json(content_type=None)
+            data = await self._get_json(ESPN_INJURIES, max_age=max_age)
+            if data is None:
+                return None
 
             for team_entry in data.get("injuries", []):
                 raw_abbr = team_entry.get("team", {}).get("abbreviation", "").upper()
@@ -2038,77 +2464,82 @@ class OddsFetcher:
                 if abbr and players:
                     result[abbr] = players
 
-            self._injuries_cache = result
-            self._injuries_ts    = now
+            return result
 
         except Exception:
-            pass
-
-        return self._injuries_cache
+            return None
 
     # ── Scoreboard ────────────────────────────────────────────────────────────
 
-    async def get_games(self, force: bool = False) -> List[Dict]:
-        now = time.monotonic()
-        if not force and self._games_cache and now - self._games_ts < GAMES_TTL:
-            return self._games_cache
+    @_coalesced
+    async def get_scoreboard(self, date: str, force: bool = False) -> List[Dict]:
+        """Parsed games on one ESPN scoreboard date ("YYYYMMDD").
 
-        session = await self._get_session()
-        games: List[Dict] = []
-        seen: set = set()
-
-        for delta in [0, 1]:
-            date = (datetime.now(timezone.utc) + timedelta(days=delta)).strftime("%Y%m%d")
-            try:
-                async with session.get(
-                    ESPN_SCOREBOARD,
-                    params={"dates": date, "limit": 20},
-                    timeout=aiohttp.ClientTimeout(total=10),
-                ) as resp:
-                    if resp.status != 200:
-                        continue
-                    data = await resp.json(content_type=None)
-                    for event in data.get("events", []):
-                        g = _parse_espn_event(event)
-                        if g and g["event_id"] not in seen:
-                            seen.add(g["event_id"])
-                            games.append(g)
-            except Exception:
-                pass
+        Today's and future boards live GAMES_TTL; a past board whose games
+        are all final lives SCOREBOARD_TTL_PAST.
+        """
+        def _ttl(games: List[Dict]) -> float:
+            today = datetime.now(timezone.utc).strftime("%Y%m%d")
+            if date < today and all(g.get("completed") for g in games):
+                return SCOREBOARD_TTL_PAST
+            return GAMES_TTL
+
+        games = await self._cached(
+            self._scoreboards, date,
+            lambda: self._load_scoreboard(date, max_age=0 if force else GAMES_TTL),
+            force=force,
+            ttl_for=_ttl,
+        )
+        return games or []
 
-        if games:
-            self._games_cache = games
-            self._games_ts    = now
-        return self._games_cache
+    async def _load_scoreboard(self, date: str, max_age: float = GAMES_TTL) -> Optional[List[Dict]]:
+        try:
+            data = await self._get_json(
+                ESPN_SCOREBOARD, {"dates": date, "limit": 20}, max_age=max_age
+            )
+        except Exception:
+            return None
+        if data is None:
+            return None
+        games: List[Dict] = []
+        for event in data.get("events", []):
+            g = _parse_espn_event(event)
+            if g:
+                games.append(g)
+        self._publish_scoreboard(games)
+        return games
 
-    async def get_completed_games(self, days_back: int = 2) -> List[Dict]:
-        session = await self._get_session()
+    async def _get_scoreboards(self, dates: List[str], force: bool = False) -> List[Dict]:
+        """Fetch several scoreboard dates concurrently; games de-duplicated by event_id."""
+        boards = await asyncio.gather(*[self.get_scoreboard(d, force=force) for d in dates])
         games: List[Dict] = []
         seen: set = set()
+        for board in boards:
+            for g in board:
+                if g["event_id"] not in seen:
+                    seen.add(g["event_id"])
+                    games.append(g)
+        return games
 
-        for delta in range(days_back + 1):
-            date = (datetime.now(timezone.utc) - timedelta(days=delta)).strftime("%Y%m%d")
-            try:
-                async with session.get(
-                    ESPN_SCOREBOARD,
-                    params={"dates": date, "limit": 20},
-                    timeout=aiohttp.ClientTimeout(total=10),
-                ) as resp:
-                    if resp.status != 200:
-                        continue
-                    data = await resp.json(content_type=None)
-                    for event in data.get("events", []):
-                        g = _parse_espn_event(event)
-                        if g and g["event_id"] not in seen and g.get("completed"):
-                            seen.add(g["event_id"])
-                            games.append(g)
-            except Exception:
-                pass
+    @_coalesced
+    async def get_games(self, force: bool = False) -> List[Dict]:
+        now = datetime.now(timezone.utc)
+        return await self._get_scoreboards(
+            [(now + timedelta(days=delta)).strftime("%Y%m%d") for delta in (0, 1)],
+            force=force,
+        )
 
-        return games
+    @_coalesced
+    async def get_completed_games(self, days_back: int = 2) -> List[Dict]:
+        now   = datetime.now(timezone.utc)
+        games = await self._get_scoreboards(
+            [(now - timedelta(days=delta)).strftime("%Y%m%d") for delta in range(days_back + 1)]
+        )
+        return [g for g in games if g.get("completed")]
 
     # ── Full game + odds ──────────────────────────────────────────────────────
 
+    @_coalesced
     async def get_game_with_odds(
         self,
         event_id: str,
@@ -2119,7 +2550,47 @@ class OddsFetcher:
         Return game data merged with fully enhanced odds:
          - Injury-adjusted, power-rated, back-to-back-aware
          - Line movement applied if guild_id + bets_manager provided
+
+        The expensive, guild-independent part comes from get_event_snapshot();
+        only the cheap bet-distribution overlay runs per guild.
         """
+        snapshot = await self.get_event_snapshot(event_id)
+        if snapshot is None:
+            return None
+
+        # Line movement from server's bet volume (optional)
+        bet_dist: Dict[str, float] = {}
+        if guild_id is not None and bets_manager is not None:
+            try:
+                bet_dist = bets_manager.get_bet_distribution(guild_id, event_id)
+            except Exception:
+                pass
+        return apply_guild_overlay(snapshot, bet_dist)
+
+    # ── Per-event base snapshot (shared by every guild) ───────────────────────
+
+    @_coalesced
+    async def get_event_snapshot(self, event_id: str, force: bool = False) -> Optional[Dict]:
+        """Guild-independent odds inputs and player props for one event.
+
+        Holds the scoreboard entry, every generate_odds_for_game input except
+        the bet distribution, the finished player props and the base (no line
+        movement) odds.  Lifetime follows snapshot_ttl() — two minutes near
+        tip-off, longer for games hours away.  Each rebuild gets a new
+        ``version`` so render caches can tell snapshots apart.
+        """
+        return await self._cached(
+            self._snapshots, event_id,
+            lambda: self._build_event_snapshot(event_id),
+            force=force,
+            ttl_for=lambda snap: snapshot_ttl(snap["game"]),
+        )
+
+    def snapshot_expires_in(self, event_id: str) -> Optional[float]:
+        """Seconds until the event's snapshot goes stale, or None if not built yet."""
+        return self._snapshots.expires_in(event_id)
+
+    async def _build_event_snapshot(self, event_id: str) -> Optional[Dict]:
         games = await self.get_games()
         game  = next((g for g in games if g["event_id"] == event_id), None)
         if not game:
@@ -2145,7 +2616,7 @@ class OddsFetcher:
             self.get_team_stats(away_abbr),
             self.get_team_roster(home_abbr),
             self.get_team_roster(away_abbr),
-            self._parse_summary_roster(event_id, home_abbr, away_abbr),
+            self._get_summary_roster(event_id, home_abbr, away_abbr),
             self.get_player_last5(home_abbr),
             self.get_player_last5(away_abbr),
             self.get_team_player_pool(home_abbr),
@@ -2362,14 +2833,6 @@ class OddsFetcher:
                 )
                 pdata["tier"] = _player_tier(pdata["pts"])
 
-        # Line movement from server's bet volume (optional)
-        bet_dist: Dict[str, float] = {}
-        if guild_id is not None and bets_manager is not None:
-            try:
-                bet_dist = bets_manager.get_bet_distribution(guild_id, event_id)
-            except Exception:
-                pass
-
         # Build injury map: {player_name: status} for all injured players on both teams.
         # Used to both shade juice (questionable_players set) and shift the actual
         # prop LINE down proportionally for compromised players.
@@ -2385,8 +2848,6 @@ class OddsFetcher:
                 if raw_status in ("questionable", "doubtful", "day-to-day", "dtd"):
                     questionable_players.add(pname_inj)
 
-        odds  = generate_odds_for_game(game, injuries, stat_leaders, home_ts, away_ts, bet_dist, real_odds=real_odds)
-
         # ── Real DraftKings props (from ESPN propBets endpoint) ────────────────
         if dk_props_raw:
             # ── Team attribution: use already-fetched rosters (keyed by ESPN displayName,
@@ -2439,34 +2900,35 @@ class OddsFetcher:
             # Fallback: synthetic props from season-average pool
             props = generate_player_props_for_game(game, props_pool, questionable_players, injury_map)
 
-        # Build public betting action percentages for UI display
-        h2h_money = bet_dist.get(game["home_team"], 0.0) + bet_dist.get(game["away_team"], 0.0)
-        ou_money  = bet_dist.get("Over", 0.0) + bet_dist.get("Under", 0.0)
-        public_action = {
-            "h2h_total": int(h2h_money),
-            "ou_total":  int(ou_money),
-            "home_pct":  round(bet_dist.get(game["home_team"], 0.0) / h2h_money, 3) if h2h_money > 0 else 0.5,
-            "away_pct":  round(bet_dist.get(game["away_team"], 0.0) / h2h_money, 3) if h2h_money > 0 else 0.5,
-            "over_pct":  round(bet_dist.get("Over",  0.0) / ou_money, 3) if ou_money > 0 else 0.5,
-            "under_pct": round(bet_dist.get("Under", 0.0) / ou_money, 3) if ou_money > 0 else 0.5,
+        self._snapshot_version += 1
+        return {
+            "version":      self._snapshot_version,
+            "game":         game,
+            "injuries":     injuries,
+            "stat_leaders": stat_leaders,
+            "home_ts":      home_ts,
+            "away_ts":      away_ts,
+            "real_odds":    real_odds,
+            "odds":         generate_odds_for_game(
+                game, injuries, stat_leaders, home_ts, away_ts, real_odds=real_odds
+            ),
+            "player_props": props,
         }
 
-        return {**game, "odds": odds, "player_props": props, "public_action": public_action}
-
     # ── Recent completed games (shared cache, feeds last-5 logic) ─────────────
 
+    @_coalesced
     async def get_recent_completed(self, days_back: int = 7) -> List[Dict]:
         """Return completed games from the last `days_back` days, cached 1 hr."""
-        now = time.monotonic()
-        if now - self._recent_completed_ts < RECENT_COMPLETED_TTL and self._recent_completed_cache:
-            return self._recent_completed_cache
-        games = await self.get_completed_games(days_back=days_back)
-        self._recent_completed_cache = games
-        self._recent_completed_ts    = now
-        return games
+        async def _load() -> Optional[List[Dict]]:
+            return await self.get_completed_games(days_back=days_back) or None
+
+        games = await self._cached(self._recent, days_back, _load)
+        return games or []
 
     # ── Per-team last-5-game averages ─────────────────────────────────────────
 
+    @_coalesced
     async def get_player_last5(self, abbr: str) -> Dict[str, Dict]:
         """
         Return {player_name: {pts, reb, ast}} averaged over the team's last
@@ -2474,15 +2936,13 @@ class OddsFetcher:
         (playoffs first, then regular season) so it works even when the global
         recent-completed-games window is empty.  Cached per team for 2 hours.
         """
-        now = time.monotonic()
-        if abbr in self._last5_cache and now - self._last5_ts.get(abbr, 0) < LAST5_TTL:
-            return self._last5_cache[abbr]
-
-        team_id = TEAM_IDS.get(abbr)
-        if not team_id:
+        if not TEAM_IDS.get(abbr):
             return {}
+        last5 = await self._cached(self._last5, abbr, lambda: self._load_player_last5(abbr))
+        return last5 or {}
 
-        session    = await self._get_session()
+    async def _load_player_last5(self, abbr: str) -> Optional[Dict[str, Dict]]:
+        team_id    = TEAM_IDS[abbr]
         event_ids: List[str] = []
 
         # Collect up to 5 most-recent completed game IDs.
@@ -2491,15 +2951,13 @@ class OddsFetcher:
             if len(event_ids) >= 5:
                 break
             try:
-                url = ESPN_TEAM_SCHEDULE.format(team_id=team_id)
-                async with session.get(
-                    url,
-                    params={"season": "2026", "seasontype": season_type},
-                    timeout=aiohttp.ClientTimeout(total=10),
-                ) as resp:
-                    if resp.status != 200:
-                        continue
-                    data = await resp.json(content_type=None)
+                data = await self._get_json(
+                    ESPN_TEAM_SCHEDULE.format(team_id=team_id),
+                    {"season": "2026", "seasontype": season_type},
+                    max_age=LAST5_TTL,
+                )
+                if data is None:
+                    continue
 
                 for ev in reversed(data.get("events", [])):
                     if len(event_ids) >= 5:
@@ -2547,29 +3005,21 @@ class OddsFetcher:
             if counts[pname] >= 1
         }
 
-        if result:
-            self._last5_cache[abbr] = result
-            self._last5_ts[abbr]    = now
-        return result
+        return result or None
 
     # ── ESPN news ─────────────────────────────────────────────────────────────
 
+    @_coalesced
     async def get_news(self, limit: int = 8) -> List[Dict]:
         """Fetch the latest NBA news headlines from ESPN.
 
         Returns a list of dicts with keys:
           id, headline, description, published, url, image_url
         """
-        session = await self._get_session()
         try:
-            async with session.get(
-                ESPN_NEWS,
-                params={"limit": limit},
-                timeout=aiohttp.ClientTimeout(total=10),
-            ) as resp:
-                if resp.status != 200:
-                    return []
-                data = await resp.json(content_type=None)
+            data = await self._get_json(ESPN_NEWS, {"limit": limit})
+            if data is None:
+                return []
 
             articles: List[Dict] = []
             for item in data.get("articles", [])[:limit]:
@@ -2614,102 +3064,16 @@ class OddsFetcher:
     # ── Box score ─────────────────────────────────────────────────────────────
 
     async def get_game_box_score(self, event_id: str) -> Optional[Dict[str, Dict]]:
-        """Parse a completed game's box score into {player_name: {pts, reb, ast, played}}.
+        """Player box score for a game — see _box_score_from_summary.
 
-        `played` is True if the player logged any minutes.  A player who DNP'd
-        due to a late scratch will either be absent from the stat_map entirely
-        (ESPN omits them) or present with MIN == 0 / "--".  Either way the
-        `played` flag lets evaluate_bet return "no_action" so the stake is
-        refunded — matching how FanDuel / DraftKings grade late scratches.
-
-        Completed game stats never change — cached indefinitely per session.
-        Uses ESPN's 'labels' column headers (not 'keys') to locate columns.
+        Served from the shared summary document, which is stored without expiry
+        once the game is completed (completed stats never change).  Returns
+        None until ESPN's summary itself reports the game final.
         """
-        if event_id in self._boxscore_cache:
-            return self._boxscore_cache[event_id]
-
-        session = await self._get_session()
-        try:
-            async with session.get(
-                ESPN_SUMMARY,
-                params={"event": event_id},
-                timeout=aiohttp.ClientTimeout(total=10),
-            ) as resp:
-                if resp.status != 200:
-                    return None
-                data = await resp.json(content_type=None)
-
-            stat_map: Dict[str, Dict] = {}
-            for team_block in (data.get("boxscore") or {}).get("players") or []:
-                for stat_group in team_block.get("statistics") or []:
-                    # ESPN sends both "labels" (display: "PTS") and "keys" (machine:
-                    # "points", "fieldGoalsMade-fieldGoalsAttempted").  Always use
-                    # labels for index lookup — keys contain compound strings like
-                    # "fieldGoalsMade-fieldGoalsAttempted" that can't be floated.
-                    raw_labels = stat_group.get("labels") or stat_group.get("names") or []
-                    labels     = [str(l).upper() for l in raw_labels]
-                    pts_idx    = next((i for i, l in enumerate(labels) if l == "PTS"),  -1)
-                    reb_idx    = next((i for i, l in enumerate(labels) if l == "REB"),  -1)
-                    ast_idx    = next((i for i, l in enumerate(labels) if l == "AST"),  -1)
-                    min_idx    = next((i for i, l in enumerate(labels) if l == "MIN"),  -1)
-                    threes_idx = next((i for i, l in enumerate(labels) if l == "3PM"),  -1)
-                    stl_idx    = next((i for i, l in enumerate(labels) if l == "STL"),  -1)
-                    blk_idx    = next((i for i, l in enumerate(labels) if l == "BLK"),  -1)
-
-                    for athlete_entry in stat_group.get("athletes") or []:
-                        pname     = (athlete_entry.get("athlete") or {}).get("displayName", "")
-                        raw_stats = athlete_entry.get("stats") or []
-                        if not pname or not raw_stats:
-                            continue
-
-                        def _gs(idx: int) -> float:
-                            if idx < 0 or idx >= len(raw_stats):
-                                return 0.0
-                            try:
-                                return float(str(raw_stats[idx]).split("-")[0].split("/")[0])
-                            except (TypeError, ValueError):
-                                return 0.0
-
-                        def _parse_min(idx: int) -> float:
-                            """Return minutes played as a float (0 = DNP)."""
-                            if idx < 0 or idx >= len(raw_stats):
-                                return 0.0
-                            s = str(raw_stats[idx]).strip()
-                            if not s or s in ("--", "0", "0:00", "DNP"):
-                                return 0.0
-                            try:
-                                if ":" in s:
-                                    m, sec = s.split(":", 1)
-                                    return float(m) + float(sec) / 60
-                                return float(s)
-                            except (TypeError, ValueError):
-                                return 0.0
-
-                        pts     = _gs(pts_idx)
-                        reb     = _gs(reb_idx)
-                        ast     = _gs(ast_idx)
-                        threes  = _gs(threes_idx)
-                        stl     = _gs(stl_idx)
-                        blk     = _gs(blk_idx)
-                        minutes = _parse_min(min_idx)
-                        played  = minutes > 0 or (
-                            min_idx < 0 and (pts + reb + ast + threes + stl + blk) > 0
-                        )
-                        stat_map[pname] = {
-                            "pts":    pts,
-                            "reb":    reb,
-                            "ast":    ast,
-                            "threes": threes,
-                            "stl":    stl,
-                            "blk":    blk,
-                            "played": played,
-                        }
-
-            if stat_map:
-                self._boxscore_cache[event_id] = stat_map
-            return stat_map or None
-        except Exception:
+        data = await self._get_summary(event_id, final=True)
+        if not data or not _summary_completed(data):
             return None
+        return _box_score_from_summary(data)
 
 
 # ══════════════════════════════════════════════════════════════════════════════
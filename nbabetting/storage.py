@@ -0,0 +1,630 @@
+"""storage.py – Bet storage backends for BetsManager (SQLite WAL and legacy JSON)."""
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+from abc import ABC, abstractmethod
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# One journalled mutation: (guild_id, op, bet) with op in OPS; bet is None for "clear".
+# "delete" removes a settled bet that has been moved to the archive.
+Op  = Tuple[int, str, Optional[Dict]]
+OPS = ("insert", "settle", "clear", "delete")
+
+
+# Fields BetsManager's in-memory indexes are built from (see BetStore.index_rows)
+INDEX_FIELDS = ("id", "user_id", "event_id", "bet_type", "selection", "stake", "status", "placed_at")
+
+
+def _day_bounds(day: date) -> Tuple[str, str]:
+    """ISO string range [day, next day) — placed_at values sort lexically."""
+    return day.isoformat(), (day + timedelta(days=1)).isoformat()
+
+
+class BetStore(ABC):
+    """Storage interface used by BetsManager.
+
+    Bets are plain dicts (the shape BetsManager builds).  A bet is *active*
+    until settle() moves it to settled; ``status`` is "pending" while active.
+    Every method is synchronous and cheap enough to call on the event loop.
+    Only apply() and close() have defaults; a backend missing any other
+    method fails when it is instantiated.
+    """
+
+    @abstractmethod
+    def insert(self, guild_id: int, bet: Dict) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def settle(self, guild_id: int, bet: Dict) -> bool:
+        """Persist a settled bet; False if it was not active."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get(self, guild_id: int, bet_id: str) -> Optional[Dict]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_many(self, guild_id: int, bet_ids: List[str]) -> Dict[str, Dict]:
+        """{bet_id: bet} for the IDs that exist."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def pending(self, guild_id: int) -> List[Dict]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def index_rows(self, guild_id: int) -> Iterable[Dict]:
+        """Every bet of a guild, reduced to the INDEX_FIELDS (no legs / bodies)."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def user_bets(
+        self, guild_id: int, user_id: int, status: Optional[str], limit: int
+    ) -> List[Dict]:
+        """Newest first."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def user_bets_on(self, guild_id: int, user_id: int, day: date) -> List[Dict]:
+        """Bets the user placed on a UTC calendar day (any status)."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def distribution(self, guild_id: int, event_id: str) -> Dict[str, float]:
+        """Pending non-prop stake per selection for a single-game event."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self, guild_id: int) -> List[Dict]:
+        """Delete every bet for a guild; return the ones that were active."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def settled_before(self, guild_id: int, cutoff: str, limit: int) -> List[Dict]:
+        """Up to ``limit`` settled bets with settled_at < cutoff (ISO string)."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, guild_id: int, bet_id: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def guilds(self) -> List[int]:
+        raise NotImplementedError
+
+    def apply(self, ops: List[Op]) -> None:
+        """Apply a batch of journalled mutations, in order.
+
+        Must be idempotent — a batch may be replayed after a crash — and is
+        called from a worker thread by BetsManager's write-behind flusher.
+        """
+        for guild_id, op, bet in ops:
+            if op == "insert" and self.get(guild_id, bet["id"]) is None:
+                self.insert(guild_id, bet)
+            elif op == "settle":
+                self.settle(guild_id, bet)
+            elif op == "clear":
+                self.clear(guild_id)
+            elif op == "delete":
+                self.delete(guild_id, bet["id"])
+
+    def close(self) -> None:
+        pass
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# SQLite (WAL)
+# ══════════════════════════════════════════════════════════════════════════════
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS bets (
+    guild_id   INTEGER NOT NULL,
+    id         TEXT    NOT NULL,
+    user_id    INTEGER NOT NULL,
+    event_id   TEXT,                -- NULL for parlays (legs live in data)
+    bet_type   TEXT    NOT NULL,
+    selection  TEXT,
+    stake      REAL    NOT NULL,
+    status     TEXT    NOT NULL,
+    placed_at  TEXT    NOT NULL,
+    settled_at TEXT,
+    data       TEXT    NOT NULL,    -- full bet dict as JSON
+    PRIMARY KEY (guild_id, id)
+);
+CREATE INDEX IF NOT EXISTS idx_bets_guild_status       ON bets (guild_id, status);
+CREATE INDEX IF NOT EXISTS idx_bets_guild_user_placed  ON bets (guild_id, user_id, placed_at);
+CREATE INDEX IF NOT EXISTS idx_bets_event              ON bets (event_id);
+"""
+
+
+class SQLiteBetStore(BetStore):
+    """One SQLite database for every guild, in WAL mode.
+
+    Each write touches a single row (no whole-file rewrites), readers never
+    block the writer, and the indexes cover the hot queries: pending bets per
+    guild, a user's recent / today's bets, and per-event distribution.
+    """
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._path   = path
+        self._writer: Optional[sqlite3.Connection] = None   # apply() only, see below
+
+    @staticmethod
+    def _row(guild_id: int, bet: Dict) -> Tuple:
+        return (
+            guild_id,
+            bet["id"],
+            int(bet["user_id"]),
+            bet.get("event_id"),
+            bet["bet_type"],
+            bet.get("selection"),
+            float(bet.get("stake", 0.0)),
+            bet["status"],
+            bet["placed_at"],
+            bet.get("settled_at"),
+            json.dumps(bet, separators=(",", ":")),
+        )
+
+    def insert(self, guild_id: int, bet: Dict) -> None:
+        self._conn.execute(
+            "INSERT INTO bets VALUES (?,?,?,?,?,?,?,?,?,?,?)", self._row(guild_id, bet)
+        )
+
+    def insert_many(self, guild_id: int, bets: Iterable[Dict]) -> int:
+        """Bulk insert (used by the JSON migrator); existing IDs are skipped."""
+        rows = [self._row(guild_id, b) for b in bets]
+        with self._conn:
+            self._conn.execute("BEGIN")
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO bets VALUES (?,?,?,?,?,?,?,?,?,?,?)", rows
+            )
+        return len(rows)
+
+    def settle(self, guild_id: int, bet: Dict) -> bool:
+        cur = self._conn.execute(
+            "UPDATE bets SET status = ?, settled_at = ?, data = ? "
+            "WHERE guild_id = ? AND id = ? AND status = 'pending'",
+            (
+                bet["status"],
+                bet.get("settled_at"),
+                json.dumps(bet, separators=(",", ":")),
+                guild_id,
+                bet["id"],
+            ),
+        )
+        return cur.rowcount > 0
+
+    def get(self, guild_id: int, bet_id: str) -> Optional[Dict]:
+        row = self._conn.execute(
+            "SELECT data FROM bets WHERE guild_id = ? AND id = ?", (guild_id, bet_id)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def get_many(self, guild_id: int, bet_ids: List[str]) -> Dict[str, Dict]:
+        out: Dict[str, Dict] = {}
+        for i in range(0, len(bet_ids), 500):   # stay under SQLite's variable limit
+            chunk = bet_ids[i:i + 500]
+            rows  = self._conn.execute(
+                f"SELECT id, data FROM bets WHERE guild_id = ? AND id IN ({','.join('?' * len(chunk))})",
+                (guild_id, *chunk),
+            ).fetchall()
+            out.update((bid, json.loads(data)) for bid, data in rows)
+        return out
+
+    def pending(self, guild_id: int) -> List[Dict]:
+        rows = self._conn.execute(
+            "SELECT data FROM bets WHERE guild_id = ? AND status = 'pending'", (guild_id,)
+        ).fetchall()
+        return [json.loads(r[0]) for r in rows]
+
+    def index_rows(self, guild_id: int) -> Iterable[Dict]:
+        cur = self._conn.execute(
+            f"SELECT {', '.join(INDEX_FIELDS)} FROM bets WHERE guild_id = ?", (guild_id,)
+        )
+        for row in cur:
+            rec = dict(zip(INDEX_FIELDS, row))
+            rec["user_id"] = str(rec["user_id"])
+            yield rec
+
+    def user_bets(
+        self, guild_id: int, user_id: int, status: Optional[str], limit: int
+    ) -> List[Dict]:
+        if status is None:
+            rows = self._conn.execute(
+                "SELECT data FROM bets WHERE guild_id = ? AND user_id = ? "
+                "ORDER BY placed_at DESC LIMIT ?",
+                (guild_id, user_id, limit),
+            ).fetchall()
+        else:
+            rows = self._conn.execute(
+                "SELECT data FROM bets WHERE guild_id = ? AND user_id = ? AND status = ? "
+                "ORDER BY placed_at DESC LIMIT ?",
+                (guild_id, user_id, status, limit),
+            ).fetchall()
+        return [json.loads(r[0]) for r in rows]
+
+    def user_bets_on(self, guild_id: int, user_id: int, day: date) -> List[Dict]:
+        start, end = _day_bounds(day)
+        rows = self._conn.execute(
+            "SELECT data FROM bets WHERE guild_id = ? AND user_id = ? "
+            "AND placed_at >= ? AND placed_at < ?",
+            (guild_id, user_id, start, end),
+        ).fetchall()
+        return [json.loads(r[0]) for r in rows]
+
+    def distribution(self, guild_id: int, event_id: str) -> Dict[str, float]:
+        rows = self._conn.execute(
+            "SELECT selection, SUM(stake) FROM bets "
+            "WHERE event_id = ? AND guild_id = ? AND status = 'pending' "
+            "AND bet_type != 'player_props' AND selection != '' "
+            "GROUP BY selection",
+            (event_id, guild_id),
+        ).fetchall()
+        return {sel: float(total) for sel, total in rows}
+
+    def clear(self, guild_id: int) -> List[Dict]:
+        with self._conn:
+            self._conn.execute("BEGIN")
+            active = self.pending(guild_id)
+            self._conn.execute("DELETE FROM bets WHERE guild_id = ?", (guild_id,))
+        return active
+
+    def settled_before(self, guild_id: int, cutoff: str, limit: int) -> List[Dict]:
+        rows = self._conn.execute(
+            "SELECT data FROM bets WHERE guild_id = ? AND status != 'pending' "
+            "AND settled_at < ? LIMIT ?",
+            (guild_id, cutoff, limit),
+        ).fetchall()
+        return [json.loads(r[0]) for r in rows]
+
+    def delete(self, guild_id: int, bet_id: str) -> None:
+        self._conn.execute("DELETE FROM bets WHERE guild_id = ? AND id = ?", (guild_id, bet_id))
+
+    def guilds(self) -> List[int]:
+        return [r[0] for r in self._conn.execute("SELECT DISTINCT guild_id FROM bets")]
+
+    def apply(self, ops: List[Op]) -> None:
+        # Batches run in a worker thread on their own connection: WAL lets the
+        # event loop keep reading through self._conn while a batch commits.
+        # BetsManager never runs two batches at once.
+        if self._writer is None:
+            self._writer = sqlite3.connect(
+                str(self._path), isolation_level=None, check_same_thread=False
+            )
+            self._writer.execute("PRAGMA synchronous=NORMAL")
+        conn = self._writer
+        with conn:
+            conn.execute("BEGIN")
+            for guild_id, op, bet in ops:
+                if op == "insert":
+                    conn.execute(
+                        "INSERT OR IGNORE INTO bets VALUES (?,?,?,?,?,?,?,?,?,?,?)",
+                        self._row(guild_id, bet),
+                    )
+                elif op == "settle":
+                    conn.execute(
+                        "UPDATE bets SET status = ?, settled_at = ?, data = ? "
+                        "WHERE guild_id = ? AND id = ? AND status = 'pending'",
+                        (
+                            bet["status"],
+                            bet.get("settled_at"),
+                            json.dumps(bet, separators=(",", ":")),
+                            guild_id,
+                            bet["id"],
+                        ),
+                    )
+                elif op == "clear":
+                    conn.execute("DELETE FROM bets WHERE guild_id = ?", (guild_id,))
+                elif op == "delete":
+                    conn.execute(
+                        "DELETE FROM bets WHERE guild_id = ? AND id = ?", (guild_id, bet["id"])
+                    )
+
+    def close(self) -> None:
+        for conn in (self._writer, self._conn):
+            try:
+                if conn is not None:
+                    conn.close()
+            except sqlite3.Error:
+                pass
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# Legacy JSON (one file per guild)
+# ══════════════════════════════════════════════════════════════════════════════
+
+class JSONBetStore(BetStore):
+    """Per-guild JSON files (``{"active": {}, "settled": {}}``) with in-memory caching.
+
+    The original storage format.  Every write rewrites the guild's whole
+    file, so it is only kept for small installs and as the migration source.
+    """
+
+    def __init__(self, base: Path) -> None:
+        self._base = base
+        self._base.mkdir(parents=True, exist_ok=True)
+        self._cache: Dict[str, Dict] = {}   # str(guild_id) -> {"active": {}, "settled": {}}
+
+    # ── Internal ───────────────────────────────────────────────────────────────
+
+    def _path(self, guild_id: int) -> Path:
+        return self._base / f"{guild_id}.json"
+
+    def _load(self, guild_id: int) -> Dict:
+        gid = str(guild_id)
+        if gid in self._cache:
+            return self._cache[gid]
+        data = load_guild_file(self._path(guild_id))
+        self._cache[gid] = data
+        return data
+
+    def _save(self, guild_id: int) -> None:
+        gid = str(guild_id)
+        if gid not in self._cache:
+            return
+        path = self._path(guild_id)
+        tmp  = path.with_suffix(".tmp")
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self._cache[gid], f, indent=2)
+            tmp.replace(path)   # atomic rename on POSIX — no partial-write corruption
+        except Exception:
+            try:
+                tmp.unlink(missing_ok=True)
+            except Exception:
+                pass
+
+    def _all(self, guild_id: int) -> Iterable[Dict]:
+        data = self._load(guild_id)
+        for pool in ("active", "settled"):
+            yield from data[pool].values()
+
+    # ── BetStore ───────────────────────────────────────────────────────────────
+
+    def insert(self, guild_id: int, bet: Dict) -> None:
+        self._load(guild_id)["active"][bet["id"]] = bet
+        self._save(guild_id)
+
+    def settle(self, guild_id: int, bet: Dict) -> bool:
+        data = self._load(guild_id)
+        if data["active"].pop(bet["id"], None) is None:
+            return False
+        data["settled"][bet["id"]] = bet
+        self._save(guild_id)
+        return True
+
+    def get(self, guild_id: int, bet_id: str) -> Optional[Dict]:
+        data = self._load(guild_id)
+        return data["active"].get(bet_id) or data["settled"].get(bet_id)
+
+    def get_many(self, guild_id: int, bet_ids: List[str]) -> Dict[str, Dict]:
+        out: Dict[str, Dict] = {}
+        for bid in bet_ids:
+            bet = self.get(guild_id, bid)
+            if bet is not None:
+                out[bid] = bet
+        return out
+
+    def pending(self, guild_id: int) -> List[Dict]:
+        return [b for b in self._load(guild_id)["active"].values() if b["status"] == "pending"]
+
+    def index_rows(self, guild_id: int) -> Iterable[Dict]:
+        for bet in self._all(guild_id):
+            yield {f: bet.get(f) for f in INDEX_FIELDS}
+
+    def user_bets(
+        self, guild_id: int, user_id: int, status: Optional[str], limit: int
+    ) -> List[Dict]:
+        uid  = str(user_id)
+        bets = [
+            b for b in self._all(guild_id)
+            if b["user_id"] == uid and (status is None or b["status"] == status)
+        ]
+        bets.sort(key=lambda b: b["placed_at"], reverse=True)
+        return bets[:limit]
+
+    def user_bets_on(self, guild_id: int, user_id: int, day: date) -> List[Dict]:
+        uid    = str(user_id)
+        prefix = day.isoformat()
+        return [
+            b for b in self._all(guild_id)
+            if b.get("user_id") == uid and (b.get("placed_at") or "").startswith(prefix)
+        ]
+
+    def distribution(self, guild_id: int, event_id: str) -> Dict[str, float]:
+        dist: Dict[str, float] = {}
+        for bet in self._load(guild_id)["active"].values():
+            if bet.get("status") != "pending":
+                continue
+            if bet.get("event_id") != event_id:
+                continue
+            if bet.get("bet_type") == "player_props":
+                continue   # props don't affect spread/total lines
+            sel = bet.get("selection", "")
+            if sel:
+                dist[sel] = dist.get(sel, 0.0) + bet.get("stake", 0.0)
+        return dist
+
+    def clear(self, guild_id: int) -> List[Dict]:
+        data   = self._load(guild_id)
+        active = list(data["active"].values())
+        data["active"]  = {}
+        data["settled"] = {}
+        self._save(guild_id)
+        return active
+
+    def settled_before(self, guild_id: int, cutoff: str, limit: int) -> List[Dict]:
+        old = [
+            b for b in self._load(guild_id)["settled"].values()
+            if (b.get("settled_at") or "") < cutoff
+        ]
+        return old[:limit]
+
+    def delete(self, guild_id: int, bet_id: str) -> None:
+        data = self._load(guild_id)
+        if data["settled"].pop(bet_id, None) is not None:
+            self._save(guild_id)
+
+    def guilds(self) -> List[int]:
+        return [int(p.stem) for p in self._base.glob("*.json")]
+
+    def apply(self, ops: List[Op]) -> None:
+        # Runs in the flusher's worker thread while the event loop reads
+        # _cache: mutate copies of the touched guilds and publish each with a
+        # single reference swap, so no reader sees a dict change under it.
+        # Each guild's file is rewritten once per batch.
+        staged: Dict[str, Dict] = {}
+        for guild_id, op, bet in ops:
+            gid = str(guild_id)
+            if gid not in staged:
+                cur = self._load(guild_id)
+                staged[gid] = {"active": dict(cur["active"]), "settled": dict(cur["settled"])}
+            data = staged[gid]
+            if op == "insert":
+                if bet["id"] not in data["active"] and bet["id"] not in data["settled"]:
+                    data["active"][bet["id"]] = bet
+            elif op == "settle":
+                if data["active"].pop(bet["id"], None) is not None:
+                    data["settled"][bet["id"]] = bet
+            elif op == "clear":
+                staged[gid] = {"active": {}, "settled": {}}
+            elif op == "delete":
+                data["settled"].pop(bet["id"], None)
+        for gid, data in staged.items():
+            self._cache[gid] = data
+            self._save(int(gid))
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# Write-behind journal
+# ══════════════════════════════════════════════════════════════════════════════
+
+class BetJournal:
+    """Append-only, fsync'd log of mutations not yet applied to the store.
+
+    ``append()`` writes one JSON line per op and fsyncs before returning;
+    BetsManager calls it from a worker thread with every op recorded since
+    the previous append, so the store can be updated later in batches.  ``rotate()`` seals the current file as ``<name>.1``
+    for the flusher; ``commit()`` deletes it once the batch is in the store.
+    ``replay()`` returns everything still on disk (sealed file first), which
+    BetsManager re-applies at start-up — BetStore.apply is idempotent.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path   = path
+        self._sealed = path.with_name(path.name + ".1")
+        self._fh     = None
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+    def _file(self):
+        if self._fh is None:
+            self._fh = open(self._path, "a", encoding="utf-8")
+        return self._fh
+
+    def append(self, ops: List[Op]) -> None:
+        fh = self._file()
+        for guild_id, op, bet in ops:
+            fh.write(json.dumps({"g": guild_id, "op": op, "bet": bet}, separators=(",", ":")))
+            fh.write("\n")
+        fh.flush()
+        os.fsync(fh.fileno())
+
+    def rotate(self) -> bool:
+        """Seal the live file for flushing; False if a sealed file is still pending."""
+        if self._sealed.exists():
+            return False
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+        if self._path.exists():
+            self._path.replace(self._sealed)
+        return True
+
+    def commit(self) -> None:
+        """Drop the sealed file — its ops are durable in the store."""
+        try:
+            self._sealed.unlink()
+        except OSError:
+            pass
+
+    @staticmethod
+    def _read(path: Path) -> List[Op]:
+        ops: List[Op] = []
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        rec = json.loads(line)
+                    except ValueError:
+                        break   # torn final line from a crash mid-append
+                    if rec.get("op") in OPS:
+                        ops.append((int(rec["g"]), rec["op"], rec.get("bet")))
+        except OSError:
+            pass
+        return ops
+
+    def replay(self) -> List[Op]:
+        return self._read(self._sealed) + self._read(self._path)
+
+    def reset(self) -> None:
+        """Forget everything on disk (after replay() has been applied)."""
+        self.close()
+        for path in (self._sealed, self._path):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+    def close(self) -> None:
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+
+def load_guild_file(path: Path) -> Dict:
+    """Read one legacy per-guild JSON file; missing or corrupt files are empty."""
+    if path.exists():
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            data.setdefault("active", {})
+            data.setdefault("settled", {})
+            return data
+        except Exception:
+            pass
+    return {"active": {}, "settled": {}}
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# One-shot JSON → SQLite migration
+# ══════════════════════════════════════════════════════════════════════════════
+
+def migrate_json_to_sqlite(json_dir: Path, store: SQLiteBetStore) -> int:
+    """Import every ``<guild_id>.json`` under json_dir into the SQLite store.
+
+    Each imported file is renamed to ``<guild_id>.json.migrated`` so the
+    migration runs once; re-running after a partial failure is safe because
+    rows are inserted with INSERT OR IGNORE.  Returns the number of bets read.
+    """
+    total = 0
+    if not json_dir.is_dir():
+        return 0
+    for path in sorted(json_dir.glob("*.json")):
+        try:
+            guild_id = int(path.stem)
+        except ValueError:
+            continue
+        data = load_guild_file(path)
+        bets = list(data["active"].values()) + list(data["settled"].values())
+        total += store.insert_many(guild_id, bets)
+        path.rename(path.with_name(path.name + ".migrated"))
+    return total
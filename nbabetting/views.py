@@ -1,12 +1,16 @@
 """views.py – All Discord UI components for NBABetting."""
 from __future__ import annotations
 
+import asyncio
 import math
+import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import TYPE_CHECKING, Dict, List, Optional, Set
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Hashable, List, Optional, Set, Tuple
 
 import discord
 
+from .athletes import headshot_url
 from .odds import (
     calc_parlay_odds,
     calc_profit,
@@ -59,6 +63,55 @@ def _discord_ts(iso: str) -> str:
         return iso
 
 
+# ── Rendered-embed cache ──────────────────────────────────────────────────────
+
+class _RenderCache:
+    """Built embeds keyed by (view kind, key), tagged with the data version.
+
+    A render is reused only while its version still matches — the odds
+    snapshot / guild distribution, the scoreboard load, or the guild's bet
+    index — so page flips and refreshes over unchanged data are a dict
+    lookup.  Each key holds only its latest version; least-recently used
+    keys are evicted past ``max_entries``.  Cached embeds are shared between
+    views and must not be mutated after they are returned.
+    """
+
+    def __init__(self, max_entries: int = 256) -> None:
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, Hashable], Tuple[Hashable, discord.Embed]]" = OrderedDict()
+        self.hits   = 0
+        self.misses = 0
+
+    def render(
+        self,
+        kind: str,
+        key: Hashable,
+        version: Optional[Hashable],
+        build: Callable[[], discord.Embed],
+    ) -> discord.Embed:
+        if version is None:
+            return build()
+        slot  = (kind, key)
+        entry = self._entries.get(slot)
+        if entry is not None and entry[0] == version:
+            self._entries.move_to_end(slot)
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        embed = build()
+        self._entries[slot] = (version, embed)
+        self._entries.move_to_end(slot)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return embed
+
+    def stats(self) -> Dict[str, Any]:
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+RENDERS = _RenderCache()
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 # Modals
 # ══════════════════════════════════════════════════════════════════════════════
@@ -730,11 +783,9 @@ class BetFlowView(discord.ui.View):
                 pname_sel = raw_sel.split("|")[0] if raw_sel else ""
                 if pname_sel:
                     pdata_sel = g.get("player_props", {}).get(pname_sel, {})
-                    aid = pdata_sel.get("athlete_id", "")
-                    if aid:
-                        embed.set_thumbnail(
-                            url=f"https://a.espncdn.com/i/headshots/nba/players/full/{aid}.png"
-                        )
+                    hid = pdata_sel.get("headshot_id") or pdata_sel.get("athlete_id", "")
+                    if hid:
+                        embed.set_thumbnail(url=headshot_url(hid))
             if not embed.thumbnail:
                 home_logo = g.get("home_logo", "")
                 away_logo = g.get("away_logo", "")
@@ -834,15 +885,24 @@ class GamesView(discord.ui.View):
         self.cog       = cog
         self.page      = 0
         self.total     = max(1, math.ceil(len(games) / self.PAGE_SIZE))
+        self.version   = self._games_version()
         self.message: Optional[discord.Message] = None
         self._sync_buttons()
 
+    def _games_version(self) -> Optional[Tuple[int, int]]:
+        if self.cog is None:
+            return None
+        return self.cog.fetcher.scoreboard_version, len(self.games)
+
     def _sync_buttons(self) -> None:
         self.prev_btn.disabled = self.page == 0
         self.next_btn.disabled = self.page >= self.total - 1
         self.page_btn.label    = f"Page {self.page + 1} / {self.total}"
 
     def build_embed(self) -> discord.Embed:
+        return RENDERS.render("games", self.page, self.version, self._render)
+
+    def _render(self) -> discord.Embed:
         start = self.page * self.PAGE_SIZE
         chunk = self.games[start: start + self.PAGE_SIZE]
         embed = discord.Embed(
@@ -892,9 +952,10 @@ class GamesView(discord.ui.View):
             try:
                 fresh = await self.cog.fetcher.get_games(force=True)
                 if fresh:
-                    self.games = fresh
-                    self.total = max(1, math.ceil(len(fresh) / self.PAGE_SIZE))
-                    self.page  = min(self.page, self.total - 1)
+                    self.games   = fresh
+                    self.total   = max(1, math.ceil(len(fresh) / self.PAGE_SIZE))
+                    self.page    = min(self.page, self.total - 1)
+                    self.version = self._games_version()
                     self._sync_buttons()
             except Exception:
                 pass
@@ -997,7 +1058,12 @@ class LeaderboardView(discord.ui.View):
 # ══════════════════════════════════════════════════════════════════════════════
 
 class MyBetsView(discord.ui.View):
-    """Paginated bets view — no cancellation, bets are final once placed."""
+    """Paginated bets view — no cancellation, bets are final once placed.
+
+    With a ``cursor`` and ``load_more`` the list is only the first chunk of a
+    longer history; the next chunk is fetched when paging past the end.
+    Pages are rendered through RENDERS, keyed on the guild's bet-index version.
+    """
 
     PAGE_SIZE = 3
 
@@ -1008,17 +1074,31 @@ class MyBetsView(discord.ui.View):
         author_id: int,
         guild_id: int,
         title: str = "📋 My Active Bets",
+        *,
+        cursor: Optional[str] = None,
+        load_more: Optional[Callable[[str], Awaitable[Tuple[List[Dict], Optional[str]]]]] = None,
+        user_id: Optional[int] = None,
+        version: Optional[int] = None,
     ) -> None:
         super().__init__(timeout=120)
         self.bets      = bets
         self.cog       = cog
         self.author_id = author_id
         self.guild_id  = guild_id
+        self.user_id   = user_id if user_id is not None else author_id   # whose bets
         self.title     = title
         self.page      = 0
+        self.cursor    = cursor if load_more is not None else None
+        self.load_more = load_more
+        # Bet-index version ``bets`` was read at — pass it when the read awaited
+        self.version   = version if version is not None else cog.bets.index_version(guild_id)
         self.message: Optional[discord.Message] = None
         self._rebuild()
 
+    def _total_label(self) -> str:
+        total = max(1, math.ceil(len(self.bets) / self.PAGE_SIZE))
+        return f"{total}+" if self.cursor else str(total)
+
     def _rebuild(self) -> None:
         self.clear_items()
         total = max(1, math.ceil(len(self.bets) / self.PAGE_SIZE))
@@ -1026,10 +1106,10 @@ class MyBetsView(discord.ui.View):
         prev = discord.ui.Button(emoji="⬅️", style=discord.ButtonStyle.secondary,
                                  disabled=self.page == 0, row=0)
         prev.callback = self._prev
-        page_lbl = discord.ui.Button(label=f"Page {self.page+1}/{total}",
+        page_lbl = discord.ui.Button(label=f"Page {self.page+1}/{self._total_label()}",
                                      style=discord.ButtonStyle.secondary, disabled=True, row=0)
         nxt = discord.ui.Button(emoji="➡️", style=discord.ButtonStyle.secondary,
-                                disabled=self.page >= total - 1, row=0)
+                                disabled=self.page >= total - 1 and not self.cursor, row=0)
         nxt.callback = self._next
         close = discord.ui.Button(label="Close", style=discord.ButtonStyle.danger,
                                   emoji="❌", row=0)
@@ -1040,6 +1120,14 @@ class MyBetsView(discord.ui.View):
         self.add_item(close)
 
     def build_embed(self) -> discord.Embed:
+        return RENDERS.render(
+            "bets",
+            (self.guild_id, self.user_id, self.title, self.page),
+            (self.version, len(self.bets), self.cursor),
+            self._render,
+        )
+
+    def _render(self) -> discord.Embed:
         start = self.page * self.PAGE_SIZE
         chunk = self.bets[start: start + self.PAGE_SIZE]
         embed = discord.Embed(title=self.title, color=discord.Color.blurple())
@@ -1056,8 +1144,8 @@ class MyBetsView(discord.ui.View):
                     value=f"*(Error rendering bet: {exc})*",
                     inline=False,
                 )
-        total = max(1, math.ceil(len(self.bets) / self.PAGE_SIZE))
-        embed.set_footer(text=f"Page {self.page+1}/{total} · {len(self.bets)} total bet(s)")
+        count = f"{len(self.bets)}+ bet(s)" if self.cursor else f"{len(self.bets)} total bet(s)"
+        embed.set_footer(text=f"Page {self.page+1}/{self._total_label()} · {count}")
         return embed
 
     def _add_bet_field(self, embed: discord.Embed, bet: Dict) -> None:
@@ -1133,6 +1221,9 @@ class MyBetsView(discord.ui.View):
         if interaction.user.id != self.author_id:
             return await interaction.response.send_message("Not yours.", ephemeral=True)
         await interaction.response.defer()
+        if (self.page + 2) * self.PAGE_SIZE > len(self.bets) and self.cursor:
+            more, self.cursor = await self.load_more(self.cursor)
+            self.bets.extend(more)
         self.page = min(max(0, math.ceil(len(self.bets) / self.PAGE_SIZE) - 1), self.page + 1)
         self._rebuild()
         await self.message.edit(embed=self.build_embed(), view=self)
@@ -1184,8 +1275,91 @@ class ConfirmView(discord.ui.View):
 # Odds board view  (/bet odds)
 # ══════════════════════════════════════════════════════════════════════════════
 
+# Minimum seconds between shared recomputes of one event's odds boards
+ODDS_REFRESH_INTERVAL = 15.0
+
+
+class _OddsBoards:
+    """Open OddsViews grouped by event, and the one refresh they all share.
+
+    A Refresh click joins the event's in-flight recompute if there is one;
+    otherwise it starts one unless the event was refreshed less than
+    ODDS_REFRESH_INTERVAL ago (every open board already shows that result).
+    A recompute rebuilds the event snapshot once, overlays it per guild with
+    a board open, and edits every open board on the event, skipping boards
+    whose rendered embed did not change.
+    """
+
+    def __init__(self) -> None:
+        self._views:    Dict[str, Set["OddsView"]] = {}
+        self._inflight: Dict[str, "asyncio.Future[None]"] = {}
+        self._last:     Dict[str, float] = {}
+
+    def add(self, view: "OddsView") -> None:
+        self._views.setdefault(view.event_id, set()).add(view)
+
+    def discard(self, view: "OddsView") -> None:
+        views = self._views.get(view.event_id)
+        if views is None:
+            return
+        views.discard(view)
+        if not views:
+            del self._views[view.event_id]
+            self._last.pop(view.event_id, None)
+
+    async def refresh(self, view: "OddsView") -> bool:
+        """Refresh the event's boards; False if it was refreshed too recently."""
+        event_id = view.event_id
+        task = self._inflight.get(event_id)
+        if task is None:
+            if time.monotonic() - self._last.get(event_id, 0.0) < ODDS_REFRESH_INTERVAL:
+                return False
+            self._last[event_id] = time.monotonic()
+            task = self._inflight[event_id] = asyncio.ensure_future(self._run(view.cog, event_id))
+            task.add_done_callback(lambda _t: self._inflight.pop(event_id, None))
+        await asyncio.shield(task)
+        return True
+
+    async def _run(self, cog: "NBABetting", event_id: str) -> None:
+        views = [
+            v for v in self._views.get(event_id, ())
+            if v.message is not None and not v.is_finished()
+        ]
+        games: Dict[Optional[int], Optional[Dict]] = {}
+        try:
+            # One rebuild per debounce window; the per-guild overlays below reuse it
+            await cog.fetcher.get_event_snapshot(event_id, force=True)
+        except Exception:
+            pass
+        for guild_id in {v.guild_id for v in views}:
+            try:
+                games[guild_id] = await cog.fetcher.get_game_with_odds(
+                    event_id, guild_id=guild_id, bets_manager=cog.bets,
+                )
+            except Exception:
+                games[guild_id] = None
+
+        edits = []
+        for v in views:
+            fresh = games.get(v.guild_id)
+            if fresh:
+                v.game = fresh
+            shown = v.shown
+            embed = v.build_embed()
+            if embed is not shown:
+                edits.append(v.message.edit(embed=embed, view=v))
+        await asyncio.gather(*edits, return_exceptions=True)
+
+
+ODDS_BOARDS = _OddsBoards()
+
+
 class OddsView(discord.ui.View):
-    """Read-only full odds board for a single game."""
+    """Read-only full odds board for a single game.
+
+    Boards opened with a cog and event ID register in ODDS_BOARDS, so the
+    Refresh button updates every open board on the event from one recompute.
+    """
 
     def __init__(
         self,
@@ -1201,9 +1375,21 @@ class OddsView(discord.ui.View):
         self.cog       = cog
         self.guild_id  = guild_id
         self.event_id  = event_id
+        self.shown: Optional[discord.Embed] = None   # last embed handed out for display
         self.message: Optional[discord.Message] = None
+        if cog is not None and event_id:
+            ODDS_BOARDS.add(self)
 
     def build_embed(self) -> discord.Embed:
+        self.shown = RENDERS.render(
+            "odds",
+            (self.guild_id, self.event_id or self.game.get("event_id")),
+            self.game.get("render_version"),
+            self._render,
+        )
+        return self.shown
+
+    def _render(self) -> discord.Embed:
         g    = self.game
         odds = g.get("odds") or {}
         meta = odds.get("_meta", {})
@@ -1341,24 +1527,23 @@ class OddsView(discord.ui.View):
     async def refresh_btn(self, interaction: discord.Interaction, button: discord.ui.Button) -> None:
         await interaction.response.defer()
         if self.cog and self.event_id:
-            try:
-                fresh = await self.cog.fetcher.get_game_with_odds(
-                    self.event_id,
-                    guild_id=self.guild_id,
-                    bets_manager=self.cog.bets,
+            if not await ODDS_BOARDS.refresh(self):
+                await interaction.followup.send(
+                    f"⏳ Odds were refreshed less than {ODDS_REFRESH_INTERVAL:.0f}s ago — "
+                    "this board is already up to date.",
+                    ephemeral=True,
                 )
-                if fresh:
-                    self.game = fresh
-            except Exception:
-                pass
+            return
         await self.message.edit(embed=self.build_embed(), view=self)
 
     @discord.ui.button(label="❌ Close", style=discord.ButtonStyle.danger)
     async def close_btn(self, interaction: discord.Interaction, button: discord.ui.Button) -> None:
+        ODDS_BOARDS.discard(self)
         await interaction.response.edit_message(view=None)
         self.stop()
 
     async def on_timeout(self) -> None:
+        ODDS_BOARDS.discard(self)
         if self.message:
             try:
                 await self.message.edit(view=None)